@@ -0,0 +1,205 @@
+"""
+분석 서버(analysis_server) 클라이언트 (표준 라이브러리만 사용하므로 GUI 시작 시간에 영향 없음)
+
+사용 예:
+    client = AnalysisClient("http://127.0.0.1:8765")        # 또는 "unix:/tmp/reliability.sock"
+    workbook = client.load("panel.xlsx")
+    result = workbook.alpha("희망1 to 희망6, 희망3(R)", name="희망")
+    client.export([result], "results.xlsx")
+
+서버에 보내는 요청에는 서버가 실행할 때 만든 토큰이 필요하다. 토큰은 RELIABILITY_SERVER_TOKEN,
+없으면 토큰 파일(RELIABILITY_SERVER_TOKEN_FILE, 기본값: 캐시 폴더/server.token)에서 읽는다.
+
+환경 변수
+    RELIABILITY_SERVER             GUI가 사용할 서버 주소 (없으면 GUI가 직접 계산)
+    RELIABILITY_SERVER_TOKEN       서버 토큰
+    RELIABILITY_SERVER_TOKEN_FILE  서버 토큰 파일
+"""
+import http.client
+import json
+import os
+import socket
+from urllib.parse import urlsplit
+
+from column_index import Selection, SelectionError
+from workbook_cache import cache_dir
+
+DEFAULT_TIMEOUT = 600  # 초 (큰 파일을 처음 읽거나 부트스트랩을 계산하는 요청도 기다림)
+
+
+def server_address():
+    """RELIABILITY_SERVER 환경 변수의 서버 주소 (없으면 None)"""
+    return os.environ.get("RELIABILITY_SERVER", "").strip() or None
+
+
+def token_path():
+    """서버 토큰 파일 경로"""
+    return os.environ.get("RELIABILITY_SERVER_TOKEN_FILE") or os.path.join(cache_dir(), "server.token")
+
+
+def read_token():
+    """서버 토큰 (환경 변수 또는 토큰 파일, 없으면 None)"""
+    token = os.environ.get("RELIABILITY_SERVER_TOKEN", "").strip()
+    if token:
+        return token
+    try:
+        with open(token_path(), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+class ServerError(RuntimeError):
+    """서버 오류 (status: HTTP 상태 코드, 서버에 연결할 수 없으면 None)"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class AnalysisClient:
+    """
+    address: "http://호스트:포트" 또는 "unix:소켓 경로", token: 서버 토큰 (None이면 read_token())
+    요청마다 새로 연결하므로 여러 스레드에서 함께 써도 된다.
+    """
+
+    def __init__(self, address, timeout=DEFAULT_TIMEOUT, token=None):
+        self.address = address
+        self.timeout = timeout
+        self.token = token or read_token()
+        if address.startswith("unix:"):
+            self._socket_path, self._host, self._port = address[len("unix:"):], None, None
+        else:
+            parts = urlsplit(address if "://" in address else "http://" + address)
+            self._socket_path, self._host, self._port = None, parts.hostname, parts.port or 80
+
+    def _connection(self):
+        if self._socket_path is not None:
+            return _UnixConnection(self._socket_path, self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def call(self, method, path, body=None):
+        """요청 하나 보내기 → 응답 JSON (오류 응답은 SelectionError/ValueError/ServerError)"""
+        data = None if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        connection = self._connection()
+        try:
+            headers = {"Content-Type": "application/json; charset=utf-8"}
+            if self.token:
+                headers["Authorization"] = f"Bearer {self.token}"
+            connection.request(method, path, data, headers)
+            response = connection.getresponse()
+            status, payload = response.status, json.loads(response.read() or b"null")
+        except (OSError, http.client.HTTPException) as e:
+            raise ServerError(f"분석 서버({self.address})에 연결할 수 없습니다: {e}") from e
+        finally:
+            connection.close()
+        if status != 200:
+            raise _error(payload, status)
+        return payload
+
+    def post(self, op, **body):
+        return self.call("POST", "/" + op, {key: value for key, value in body.items() if value is not None})
+
+    def health(self):
+        return self.call("GET", "/health")
+
+    def datasets(self):
+        return self.call("GET", "/datasets")
+
+    def load(self, path, sheet=None):
+        """서버에 데이터 파일 불러오기 (경로는 서버 컴퓨터 기준, 상대 경로는 서버의 --root 기준) → RemoteWorkbook"""
+        return RemoteWorkbook(self, self.post("load", path=os.fspath(path), sheet=sheet))
+
+    def export(self, results, path, append=False):
+        """결과 로그 항목들을 서버에서 보고서 파일로 저장 → 쓴 행 수"""
+        return self.post("export", results=list(results), path=os.fspath(path), append=append)["rows"]
+
+    def batch(self, requests):
+        """
+        여러 요청을 한 번에 보내기 (requests: [{"op": "alpha", "dataset": ..., ...}, ...])
+        반환: 요청별 결과 (오류가 난 요청은 그 자리에 예외 객체)
+        """
+        outcomes = self.post("batch", requests=list(requests))
+        return [outcome["result"] if "result" in outcome else _error(outcome, outcome.get("status"))
+                for outcome in outcomes]
+
+
+def _error(payload, status):
+    payload = payload if isinstance(payload, dict) else {}
+    if "errors" in payload:
+        return SelectionError(payload["errors"])
+    message = payload.get("error", f"HTTP {status}")
+    if status == 400:
+        return ValueError(message)
+    return ServerError(message, status)
+
+
+def selection_body(selection):
+    """문항 → 요청 본문 (Selection이면 문항명 그대로, 그 밖에는 문항 선택 입력 "spec")"""
+    if isinstance(selection, Selection):
+        return {"columns": list(selection.columns),
+                "reversed": [col for col in selection.columns if col in selection.reversed]}
+    return {"spec": selection}
+
+
+class RemoteWorkbook:
+    """
+    서버에 상주하는 데이터 (GUI에서 lazy_workbook.LazyWorkbook 대신 사용)
+    file_path, sheet, sheet_names, columns, fingerprint, fingerprint_ready는 LazyWorkbook과 같다.
+    문항(selection)은 column_index.Selection 또는 문항 선택 입력 (문자열, 토큰 리스트)
+    """
+
+    fingerprint_ready = True  # 서버가 계산해 보냄
+
+    def __init__(self, client, info):
+        self.client = client
+        self.dataset = info["dataset"]
+        self.file_path = info["path"]
+        self.sheet = info["sheet"]
+        self.sheet_names = info["sheet_names"]
+        self.columns = info["columns"]
+        self.fingerprint = info["fingerprint"]
+
+    def request(self, op, selection=None, **options):
+        """분석 요청 본문 (batch에 넣을 때 사용)"""
+        body = {"op": op, "dataset": self.dataset, **(selection_body(selection) if selection is not None else {})}
+        body.update({key: value for key, value in options.items() if value is not None})
+        return body
+
+    def _post(self, op, selection, **options):
+        body = self.request(op, selection, **options)
+        del body["op"]
+        return self.client.post(op, **body)
+
+    def resolve(self, spec):
+        """문항 선택 입력 해석 → column_index.Selection"""
+        resolved = self.client.post("resolve", dataset=self.dataset, spec=spec)
+        return Selection(resolved["columns"], frozenset(resolved["reversed"]))
+
+    def alpha(self, selection, name=None, missing=None, ci=None, group_by=None):
+        """
+        전체 α와 문항 제거 시 α → 결과 로그 항목
+        ci: True 또는 신뢰구간 옵션 {"method", "n_boot", "level", "seed"}, group_by: 집단 변수 리스트
+        """
+        return self._post("alpha", selection, name=name, missing=missing, ci=ci, group_by=group_by)
+
+    def item_deleted(self, selection, missing=None):
+        """{"alpha", "removed": {표시명: 제거 시 α}, "n", "removed_n", "missing"} (반올림하지 않음)"""
+        return self._post("item-deleted", selection, missing=missing)
+
+    def reduce(self, selection, target, method=None, beam_width=None, name=None, missing=None):
+        """α가 가장 큰 target문항 조합 → 결과 로그 항목"""
+        return self._post("reduce", selection, target=target, method=method, beam_width=beam_width,
+                          name=name, missing=missing)
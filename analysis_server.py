@@ -0,0 +1,623 @@
+"""
+로컬 분석 서버 (여러 분석자가 같은 데이터를 한 프로세스에서 함께 사용)
+
+사용 예:
+    python analysis_server.py                              # http://127.0.0.1:8765
+    python analysis_server.py --port 9000 --workers 8 --compact
+    python analysis_server.py --socket /tmp/reliability.sock --root /data/panels
+
+불러온 데이터(lazy_workbook)와 공분산 블록 캐시(dataset_stats)를 서버에 상주시켜, 같은 파일을 여는 분석자는
+파일 읽기와 교차곱 계산을 다시 하지 않는다. 데이터는 파일 내용 해시 + 시트로 구분하므로 경로가 달라도
+내용이 같으면 같은 데이터를 쓰고, 상주 데이터가 --max-datasets개를 넘으면 가장 오래 쓰지 않은 것부터 내려놓는다.
+
+보안: 서버는 loopback 주소(또는 Unix 소켓)에서만 받고(다른 주소는 --allow-remote가 있어야 함), 실행할 때마다
+새 토큰을 만들어 본인만 읽을 수 있는 토큰 파일(기본값: 캐시 폴더/server.token)에 쓴다. 모든 요청은
+"Authorization: Bearer 토큰" 머리글이 있어야 하고(없으면 401), POST 본문은 Content-Type: application/json이어야
+한다(아니면 415 - 웹 페이지가 보낸 요청은 이 조건을 만족할 수 없음). 읽고 쓰는 파일은 --root 폴더
+(기본값: 서버를 실행한 폴더) 안으로 제한한다(밖이면 403). 상대 경로는 --root 기준이다.
+
+요청은 HTTP POST + JSON 본문
+    /load          {"path", "sheet"}                          → 데이터 번호, 문항명, 시트 이름
+    /resolve       {"dataset", "spec"}                        → 해석된 문항 (columns, reversed, labels)
+    /alpha         {"dataset", 문항, "name", "missing", "ci", "group_by"}   → 결과 로그 항목
+    /item-deleted  {"dataset", 문항, "missing"}               → 전체 α, 문항 제거 시 α, 유효 N
+    /reduce        {"dataset", 문항, "target", "method", "beam_width", "name", "missing"} → 결과 로그 항목
+    /export        {"results", "path", "append"}              → 쓴 행 수 (서버 컴퓨터의 --root 안에 저장)
+    /batch         {"requests": [{"op": "alpha", ...}, ...]}  → 요청별 {"result": ...} 또는 {"error": ...}
+    GET /health, GET /datasets (상주 중인 데이터 목록)
+문항은 "spec"(GUI와 같은 문항 선택 입력, 문자열 또는 토큰 리스트) 또는 "columns" + "reversed"(문항명 그대로)로 준다.
+오류는 {"error": 메시지} (문항 선택 오류는 "errors"에 토큰별 메시지)와 400/401/403/404/415/503/500 상태로 돌려준다.
+
+계산은 크기가 정해진 작업 풀(--workers 스레드, numpy 행렬 곱은 GIL을 놓음)에서 실행하고, 대기 중인 요청이
+--queue개를 넘으면 503으로 바로 돌려준다. 여러 분석자가 동시에 보낸 같은 요청은 한 번만 계산해 결과를 함께
+돌려주고, /batch는 같은 데이터의 요청들이 쓰는 문항 열을 한 번에 읽은 뒤 요청별 계산을 작업 풀에 나누어 맡긴다.
+클라이언트는 analysis_client (GUI는 RELIABILITY_SERVER 환경 변수가 있으면 이 서버에 계산을 맡김).
+"""
+import argparse
+import hashlib
+import hmac
+import ipaddress
+import json
+import os
+import secrets
+import socketserver
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from analysis_client import token_path
+from column_index import ColumnIndex, Selection, SelectionError
+from export import export_results
+from instrumentation import span
+from item_reduction import DEFAULT_BEAM_WIDTH, REDUCTION_METHODS
+from lazy_workbook import LazyWorkbook, sheet_names
+from reliability import DEFAULT_MISSING, check_missing_mode
+from reliability_batch import analyze_selection, reduction_result
+from workbook_cache import file_fingerprint
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE = 64  # 작업 풀에서 기다릴 수 있는 요청 수 (넘으면 503)
+DEFAULT_MAX_DATASETS = 4
+CI_OPTIONS = ("method", "n_boot", "level", "seed")
+_ANALYSIS_OPS = ("alpha", "item-deleted", "reduce")
+
+
+class ServiceError(Exception):
+    """요청 오류 (status: 돌려줄 HTTP 상태 코드)"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_default(value):
+    # numpy 수치(np.int64 등)는 파이썬 수치로, 그 밖에는 문자열로
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def _base_name(columns):
+    """척도명 기본값: 첫 문항명에서 숫자 등을 뺀 글자 (e.g., '희망1' → '희망') - GUI와 같음"""
+    return "".join(filter(str.isalpha, str(columns[0])))
+
+
+class Dataset:
+    """서버에 상주하는 데이터 하나 (workbook: LazyWorkbook, index: 문항명 ColumnIndex)"""
+
+    def __init__(self, dataset_id, path, workbook):
+        self.id = dataset_id
+        self.path = path
+        self.workbook = workbook
+        self.index = ColumnIndex(workbook.columns)
+        self._known = set(workbook.columns)
+
+    def describe(self, columns=True):
+        info = {"dataset": self.id, "path": self.path, "sheet": self.workbook.sheet,
+                "sheet_names": self.workbook.sheet_names, "fingerprint": self.workbook.fingerprint,
+                "n_columns": len(self.workbook.columns), "loaded_columns": len(self.workbook.loaded_columns)}
+        if columns:
+            info["columns"] = self.workbook.columns
+        return info
+
+    def selection(self, request):
+        """요청의 문항 → column_index.Selection ("spec" 또는 "columns" + "reversed")"""
+        if "columns" in request:
+            columns, reversed_columns = _get(request, "columns", "names"), _get(request, "reversed", "names", [])
+            errors = [f"'{col}': 데이터에 없는 문항입니다." for col in columns if col not in self._known]
+            errors += [f"'{col}': 역코딩 문항이 선택한 문항에 없습니다." for col in reversed_columns
+                       if col not in columns]
+            if len(set(columns)) != len(columns):
+                errors.append("같은 문항이 두 번 이상 들어갔습니다.")
+            if errors:
+                raise SelectionError(errors)
+            return Selection(columns, frozenset(reversed_columns))
+        if "spec" not in request:
+            raise ServiceError('문항("spec" 또는 "columns")이 필요합니다.')
+        return self.index.resolve(_get(request, "spec", "spec"))
+
+
+class AnalysisService:
+    """
+    요청 처리 (HTTP와 무관하게 같은 프로세스에서 바로 호출할 수도 있음)
+    workers: 작업 풀 스레드 수, queue: 대기할 수 있는 요청 수, max_datasets: 상주시킬 데이터 수
+    use_cache, compact: LazyWorkbook과 같음 (None이면 환경 변수를 따름)
+    root: 읽고 쓸 수 있는 파일의 최상위 폴더 (기본값: 현재 폴더)
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, queue=DEFAULT_QUEUE, max_datasets=DEFAULT_MAX_DATASETS,
+                 use_cache=None, compact=None, root=None):
+        self.workers = workers
+        self.root = os.path.realpath(root or os.getcwd())
+        self.max_datasets = max_datasets
+        self.use_cache = use_cache
+        self.compact = compact
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis")
+        self._slots = threading.BoundedSemaphore(workers + queue)
+        self._datasets = OrderedDict()  # 데이터 번호 → Dataset (최근에 쓴 것이 뒤)
+        self._inflight = {}  # 요청 내용 → 계산 중인 Future
+        self._lock = threading.Lock()
+        self._ops = {"load": self.load, "resolve": self.resolve, "alpha": self.alpha,
+                     "item-deleted": self.item_deleted, "reduce": self.reduce, "export": self.export}
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------ 요청 분배
+
+    def handle(self, op, request):
+        """요청 하나 처리 → 결과 (끝날 때까지 기다림)"""
+        if op == "batch":
+            return self.batch(_get(request, "requests", "requests"))
+        return self.submit(op, request).result()
+
+    def submit(self, op, request, wait=False):
+        """
+        요청을 작업 풀에 넣기 → Future (같은 요청을 계산 중이면 그 Future를 함께 기다림)
+        wait: 대기열이 차 있으면 503 대신 자리가 날 때까지 기다림 (이미 받은 batch의 요청들)
+        """
+        method = self._ops.get(op) if isinstance(op, str) else None
+        if method is None:
+            raise ServiceError(f"알 수 없는 요청: {op}", 404)
+        key = json.dumps([op, request], sort_keys=True, ensure_ascii=False, default=str)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            if not wait:
+                future = self._run(self._traced, op, method, request)
+                self._inflight[key] = future
+        if wait:
+            # 자리가 날 때까지 잠금 없이 기다린 뒤 다시 확인 (그동안 같은 요청이 들어왔으면 함께 기다림)
+            self._slots.acquire()
+            with self._lock:
+                future = self._inflight.get(key)
+                if future is not None:
+                    self._slots.release()
+                    return future
+                future = self._run(self._traced, op, method, request, acquired=True)
+                self._inflight[key] = future
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _run(self, func, *args, acquired=False):
+        if not acquired and not self._slots.acquire(blocking=False):
+            raise ServiceError("요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요.", 503)
+        try:
+            future = self.executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _forget(self, key):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _traced(op, method, request):
+        with span("server." + op, dataset=request.get("dataset")):
+            return method(request)
+
+    def batch(self, requests):
+        """
+        여러 요청을 한 번에 처리 → 요청별 {"result": 결과} 또는 {"error": 메시지, "status": 상태 코드}
+        분석 요청이 쓰는 문항 열은 데이터별로 먼저 한 번에 읽는다. 대기열 자리가 있어 받은 batch는
+        요청이 대기열보다 많아도 자리가 나는 대로 넣는다.
+        """
+        self._run(self._preload, requests).result()
+        futures = []
+        for request in requests:
+            body = {key: value for key, value in request.items() if key != "op"}
+            try:
+                futures.append(self.submit(request.get("op"), body, wait=True))
+            except ServiceError as e:
+                futures.append(e)
+        return [_outcome(future) for future in futures]
+
+    def _preload(self, requests):
+        columns = {}  # 데이터 번호 → 읽을 문항 열
+        for request in requests:
+            if request.get("op") not in _ANALYSIS_OPS:
+                continue
+            try:
+                dataset = self._dataset(request)
+                selection = dataset.selection(request)
+            except (ServiceError, ValueError):
+                continue  # 오류는 요청별 결과로 알림
+            needed = columns.setdefault(dataset.id, [])
+            needed.extend(selection.columns)
+            group_by = request.get("group_by")
+            if isinstance(group_by, list):
+                needed.extend(col for col in group_by if _is_name(col) and col in dataset.index.names)
+        for dataset_id, needed in columns.items():
+            dataset = self._datasets.get(dataset_id)
+            if dataset is not None:
+                with span("server.preload", dataset=dataset_id, columns=len(needed)):
+                    dataset.workbook.load(needed)
+
+    # ------------------------------------------------------------ 데이터
+
+    def load(self, request):
+        """데이터 파일 불러오기 (이미 상주 중이면 그대로 사용) → 데이터 정보"""
+        path = self._path(request.get("path"))
+        if not os.path.isfile(path):
+            raise ServiceError(f"파일이 없습니다: {path}", 404)
+        sheet = _get(request, "sheet", "str") or None
+        if sheet is not None and sheet == next(iter(sheet_names(path)), None):
+            sheet = None  # 첫 시트는 이름을 주든 안 주든 같은 데이터
+        fingerprint = file_fingerprint(path)
+        dataset_id = hashlib.blake2b(f"{fingerprint}\0{sheet}".encode("utf-8"), digest_size=8).hexdigest()
+        with self._lock:
+            dataset = self._datasets.get(dataset_id)
+            if dataset is not None:
+                self._datasets.move_to_end(dataset_id)
+                return dataset.describe()
+
+        workbook = LazyWorkbook(path, sheet, fingerprint, self.use_cache, self.compact)
+        with self._lock:
+            dataset = self._datasets.setdefault(dataset_id, Dataset(dataset_id, path, workbook))
+            self._datasets.move_to_end(dataset_id)
+            while len(self._datasets) > self.max_datasets:
+                self._datasets.popitem(last=False)  # 계산 중인 요청은 가지고 있는 참조로 계속 진행
+        return dataset.describe()
+
+    def _path(self, path):
+        """요청의 파일 경로 → root 안의 절대 경로 (root 밖이면 403)"""
+        if not isinstance(path, str) or not path:
+            raise ServiceError('"path"(파일 경로 문자열)가 필요합니다.')
+        if "\0" in path:
+            raise ServiceError(f"잘못된 파일 경로입니다: {path!r}")
+        full = os.path.realpath(os.path.join(self.root, os.path.expanduser(path)))
+        try:
+            inside = os.path.commonpath([full, self.root]) == self.root
+        except ValueError:  # Windows에서 드라이브가 다른 경우
+            inside = False
+        if not inside:
+            raise ServiceError(f"허용된 폴더({self.root}) 밖의 파일은 사용할 수 없습니다: {path}", 403)
+        return full
+
+    def _dataset(self, request):
+        dataset_id = _get(request, "dataset", "str")
+        if dataset_id is None:
+            raise ServiceError('"dataset"(/load가 돌려준 데이터 번호)이 필요합니다.')
+        with self._lock:
+            dataset = self._datasets.get(dataset_id)
+            if dataset is None:
+                raise ServiceError(f"불러오지 않은 데이터입니다 ({dataset_id}). /load로 먼저 불러오세요.", 404)
+            self._datasets.move_to_end(dataset_id)
+        return dataset
+
+    def datasets(self):
+        """상주 중인 데이터 목록 (문항명 제외)"""
+        with self._lock:
+            datasets = list(self._datasets.values())
+        return [dataset.describe(columns=False) for dataset in datasets]
+
+    # ------------------------------------------------------------ 분석
+
+    def resolve(self, request):
+        selection = self._dataset(request).selection(request)
+        return {"columns": selection.columns, "reversed": [col for col in selection.columns
+                                                          if col in selection.reversed],
+                "labels": selection.labels()}
+
+    def alpha(self, request):
+        """전체 α와 문항 제거 시 α (신뢰구간, 집단별 α 선택) → 결과 로그 항목"""
+        dataset = self._dataset(request)
+        selection = dataset.selection(request)
+        missing = _missing(request)
+        group_by = _get(request, "group_by", "names", [])
+        ci = _get(request, "ci", "ci")
+        ci_options = None
+        if ci:
+            ci_options = {} if ci is True else _ci_options(ci)
+        stats = dataset.workbook.stats(selection.columns + group_by)
+        return analyze_selection(stats, selection, _get(request, "name", "str") or _base_name(selection.columns),
+                                 ci_options, missing=missing, group_columns=group_by)
+
+    def item_deleted(self, request):
+        """전체 α와 문항 제거 시 α (반올림하지 않음)"""
+        dataset = self._dataset(request)
+        selection = dataset.selection(request)
+        missing = _missing(request)
+        stats = dataset.workbook.stats(selection.columns)
+        alpha, removed, (n, removed_n) = stats.reliability(selection.columns, selection.reversed,
+                                                           selection.labels(), missing)
+        return {"alpha": alpha, "removed": removed, "n": n, "removed_n": removed_n, "missing": missing}
+
+    def reduce(self, request):
+        """α가 가장 큰 target문항 조합 탐색 → 결과 로그 항목"""
+        dataset = self._dataset(request)
+        selection = dataset.selection(request)
+        missing = _missing(request)
+        target = _get(request, "target", "int")
+        if target is None:
+            raise ServiceError('"target"(남길 문항 수)이 필요합니다.')
+        method = _get(request, "method", "str", "greedy")
+        if method not in REDUCTION_METHODS:
+            raise ServiceError(f"알 수 없는 축약 방법: {method} ({', '.join(REDUCTION_METHODS)} 중 선택)")
+        beam_width = _get(request, "beam_width", "int", DEFAULT_BEAM_WIDTH)
+        if beam_width < 1:
+            raise ServiceError('"beam_width"는 1 이상이어야 합니다.')
+        reduce_options = {"target": target, "method": method, "beam_width": beam_width}
+        stats = dataset.workbook.stats(selection.columns)
+        return reduction_result(stats, selection, _get(request, "name", "str") or _base_name(selection.columns),
+                                reduce_options, missing)
+
+    def export(self, request):
+        """결과 로그 항목들을 보고서 파일로 저장 (export.export_results) → 쓴 행 수"""
+        results = request.get("results")
+        if not isinstance(results, list) or not all(isinstance(result, dict) for result in results):
+            raise ServiceError('"results"는 결과 로그 항목(JSON 객체) 목록이어야 합니다.')
+        path = self._path(request.get("path"))
+        return {"rows": export_results(results, path, _get(request, "append", "bool", False)), "path": path}
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_name(value):
+    """문항명 (엑셀 머리글이 숫자면 숫자로 읽힘)"""
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
+# 요청 필드 형식 → (확인 함수, 오류 메시지에 쓸 설명)
+_KINDS = {
+    "str": (lambda value: isinstance(value, str), "문자열"),
+    "int": (_is_int, "정수"),
+    "number": (lambda value: _is_int(value) or isinstance(value, float), "숫자"),
+    "bool": (lambda value: isinstance(value, bool), "true 또는 false"),
+    "names": (lambda value: isinstance(value, list) and all(map(_is_name, value)), "문항명 목록"),
+    "spec": (lambda value: isinstance(value, str) or isinstance(value, list) and all(isinstance(token, str)
+                                                                                    for token in value),
+             '문항 선택 입력 문자열 (예: "희망1 to 희망6, 희망3(R)") 또는 문자열 목록'),
+    "ci": (lambda value: isinstance(value, (bool, dict)), "true 또는 신뢰구간 옵션 객체"),
+    "requests": (lambda value: isinstance(value, list) and all(isinstance(item, dict) for item in value),
+                 "요청(JSON 객체) 목록"),
+}
+
+
+def _get(request, key, kind, default=None):
+    """요청 필드 값 (없거나 null이면 default, 형식이 다르면 400 오류)"""
+    value = request.get(key)
+    if value is None:
+        return default
+    check, description = _KINDS[kind]
+    if not check(value):
+        received = json.dumps(value, ensure_ascii=False)
+        received = received if len(received) <= 40 else received[:40] + "…"
+        raise ServiceError(f'"{key}" 형식이 잘못되었습니다 (필요한 형식: {description}, 받은 값: {received}).')
+    return value
+
+
+def _ci_options(ci):
+    """요청의 신뢰구간 옵션 확인 → bootstrap.alpha_confidence_intervals 인수"""
+    unknown = set(ci) - set(CI_OPTIONS)
+    if unknown:
+        raise ServiceError(f"알 수 없는 신뢰구간 옵션: {', '.join(sorted(unknown))}")
+    options = {"method": _get(ci, "method", "str"), "n_boot": _get(ci, "n_boot", "int"),
+               "level": _get(ci, "level", "number"), "seed": _get(ci, "seed", "int")}
+    if options["n_boot"] is not None and options["n_boot"] < 1:
+        raise ServiceError('"n_boot"는 1 이상이어야 합니다.')
+    if options["level"] is not None and not 0 < options["level"] < 1:
+        raise ServiceError('"level"은 0과 1 사이여야 합니다 (예: 0.95).')
+    return {key: value for key, value in options.items() if value is not None}
+
+
+def _missing(request):
+    missing = _get(request, "missing", "str", DEFAULT_MISSING)
+    check_missing_mode(missing)
+    return missing
+
+
+def _error_payload(e):
+    """예외 → (HTTP 상태 코드, 오류 응답)"""
+    if isinstance(e, SelectionError):
+        return 400, {"error": str(e), "errors": e.errors}
+    if isinstance(e, ServiceError):
+        return e.status, {"error": str(e)}
+    if isinstance(e, FileNotFoundError):
+        return 404, {"error": str(e)}
+    if isinstance(e, (ValueError, TypeError, KeyError)):
+        return 400, {"error": str(e)}
+    return 500, {"error": f"{type(e).__name__}: {e}"}
+
+
+def _outcome(future):
+    if isinstance(future, Exception):
+        error = future
+    else:
+        error = future.exception()
+        if error is None:
+            return {"result": future.result()}
+    status, payload = _error_payload(error)
+    return {**payload, "status": status}
+
+
+# ---------------------------------------------------------------- HTTP
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "ReliabilityServer/1"
+    protocol_version = "HTTP/1.1"  # 연결을 유지해 같은 클라이언트의 다음 요청을 바로 받음
+
+    def do_GET(self):
+        if self._rejected():
+            return
+        service = self.server.service
+        if self.path == "/health":
+            self._send(200, {"status": "ok", "workers": service.workers})
+        elif self.path == "/datasets":
+            self._send(200, service.datasets())
+        else:
+            self._send(404, {"error": f"알 수 없는 경로: {self.path}"})
+
+    def do_POST(self):
+        if self._rejected(body=True):
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError as e:  # JSONDecodeError, UnicodeDecodeError
+                raise ServiceError(f"요청 본문이 올바른 JSON이 아닙니다: {e}") from e
+            if not isinstance(request, dict):
+                raise ServiceError("요청 본문은 JSON 객체여야 합니다.")
+            result = self.server.service.handle(self.path.strip("/"), request)
+        except Exception as e:
+            self._send(*_error_payload(e))
+            return
+        self._send(200, result)
+
+    def _rejected(self, body=False):
+        """토큰과 Content-Type 확인 → 거절해 오류 응답을 보냈으면 True"""
+        authorization = self.headers.get("Authorization") or ""
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), self.server.token.encode()):
+            self._send(401, {"error": "토큰이 없거나 맞지 않습니다 (서버의 토큰 파일 또는 RELIABILITY_SERVER_TOKEN 확인)."})
+        elif body and self.headers.get_content_type() != "application/json":
+            self._send(415, {"error": "요청 본문은 Content-Type: application/json이어야 합니다."})
+        else:
+            return False
+        self.close_connection = True  # 읽지 않은 본문이 남아 있으므로 연결을 닫음
+        return True
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, default=_json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class AnalysisHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service, token, verbose=False):
+        self.service = service
+        self.token = token
+        self.verbose = verbose
+        super().__init__(address, _Handler)
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class AnalysisUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, path, service, token, verbose=False):
+            self.service = service
+            self.token = token
+            self.verbose = verbose
+            super().__init__(path, _Handler)
+
+        def server_bind(self):
+            super().server_bind()
+            os.chmod(self.server_address, 0o600)  # 다른 사용자는 연결할 수 없음
+
+        def server_close(self):
+            super().server_close()
+            if os.path.exists(self.server_address):
+                os.remove(self.server_address)
+
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # 그 밖의 호스트 이름과 "" (모든 주소)
+
+
+def write_token(path, token):
+    """토큰 파일 쓰기 (본인만 읽고 쓸 수 있게)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token)
+    os.chmod(path, 0o600)  # 이미 있던 파일의 권한도 줄임
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, verbose=False, token=None,
+                allow_remote=False):
+    """
+    서버 만들기 (serve_forever로 실행) - port=0이면 비어 있는 포트 (server.server_address로 확인)
+    socket_path: 주면 TCP 대신 Unix 소켓 (Windows 제외)
+    token: 요청에 필요한 토큰 (None이면 새로 만듦, server.token으로 확인)
+    allow_remote: loopback이 아닌 주소에서 받기 (token을 직접 주어야 함)
+    """
+    if socket_path is None and not is_loopback(host):
+        if not allow_remote or token is None:
+            raise ValueError(f"loopback이 아닌 주소({host!r})에서 받으려면 allow_remote와 토큰이 모두 필요합니다.")
+    token = token or secrets.token_urlsafe(32)
+    if socket_path is None:
+        return AnalysisHTTPServer((host, port), service, token, verbose)
+    if not hasattr(socketserver, "UnixStreamServer"):
+        raise ValueError("이 운영체제에서는 Unix 소켓을 사용할 수 없습니다. --port를 사용하세요.")
+    if os.path.exists(socket_path):
+        os.remove(socket_path)  # 이전에 비정상 종료한 서버의 소켓 파일
+    return AnalysisUnixServer(socket_path, service, token, verbose)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="신뢰도 분석 로컬 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help=f"받을 주소 (기본값: {DEFAULT_HOST}, loopback이 아니면 --allow-remote 필요)")
+    parser.add_argument("--allow-remote", action="store_true",
+                        help="loopback이 아닌 주소에서도 받기 (다른 컴퓨터가 토큰으로 --root 안의 파일을 읽고 쓸 수 있음)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})")
+    parser.add_argument("--socket", metavar="PATH", help="TCP 대신 Unix 소켓으로 받기")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"계산 작업 스레드 수 (기본값: {DEFAULT_WORKERS})")
+    parser.add_argument("--queue", type=int, default=DEFAULT_QUEUE,
+                        help=f"대기할 수 있는 요청 수, 넘으면 503 (기본값: {DEFAULT_QUEUE})")
+    parser.add_argument("--max-datasets", type=int, default=DEFAULT_MAX_DATASETS,
+                        help=f"상주시킬 데이터 수 (기본값: {DEFAULT_MAX_DATASETS})")
+    parser.add_argument("--root", default=os.getcwd(),
+                        help="불러오고 저장할 수 있는 파일의 최상위 폴더 (기본값: 현재 폴더)")
+    parser.add_argument("--token-file", default=token_path(),
+                        help=f"토큰을 쓸 파일 (기본값: {token_path()})")
+    parser.add_argument("--no-cache", action="store_true", help="파싱된 데이터 캐시를 사용하지 않음")
+    parser.add_argument("--compact", action="store_true",
+                        help="문항 응답을 uint8 코드 + 결측 비트 마스크로 보관 (상주 메모리 약 1/7)")
+    parser.add_argument("--verbose", action="store_true", help="요청마다 한 줄씩 출력")
+    args = parser.parse_args(argv)
+    if args.socket is None and not is_loopback(args.host) and not args.allow_remote:
+        parser.error(f"loopback이 아닌 주소({args.host!r})에서 받으려면 --allow-remote가 필요합니다.")
+
+    token = secrets.token_urlsafe(32)
+    write_token(args.token_file, token)
+    service = AnalysisService(args.workers, args.queue, args.max_datasets,
+                              use_cache=False if args.no_cache else None, compact=True if args.compact else None,
+                              root=args.root)
+    server = make_server(service, args.host, args.port, args.socket, args.verbose, token, args.allow_remote)
+    address = f"unix:{args.socket}" if args.socket else "http://{}:{}".format(*server.server_address[:2])
+    print(f"분석 서버 실행 중: {address} (작업 스레드 {args.workers}개, Ctrl+C로 종료)")
+    print(f"파일 폴더: {service.root}, 토큰 파일: {args.token_file}")
+    print(f"GUI에서 사용하려면 RELIABILITY_SERVER={address}")
+    if not is_loopback(args.host) and args.socket is None:
+        print("경고: 다른 컴퓨터에서도 접속할 수 있습니다. 토큰을 받은 사람만 --root 안의 파일을 읽고 쓸 수 있습니다.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+백그라운드 작업 실행
+
+파일 읽기, 분석, 저장처럼 오래 걸리는 작업을 별도 스레드(또는 지정한 실행기)에서 돌리고,
+진행 상황과 결과는 root.after 폴링으로 Tk 이벤트 루프에 전달한다.
+Tk 위젯은 항상 메인 스레드에서만 건드린다.
+작업마다 'job.<함수명>', 완료 처리(화면 갱신)는 'ui.on_done' 단계로 걸린 시간을 기록한다 (instrumentation).
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentation import span
+
+
+class JobCancelled(Exception):
+    """사용자가 작업을 취소함"""
+
+
+class Job:
+    """작업 함수에 전달되는 진행/취소 핸들"""
+
+    def __init__(self, message=""):
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._progress = (0, 0, message)
+
+    def report(self, done, total=0, message=None):
+        """진행 상황 보고 (total=0이면 진행률 미정)"""
+        with self._lock:
+            if message is None:
+                message = self._progress[2]
+            self._progress = (done, total, message)
+
+    def progress(self):
+        with self._lock:
+            return self._progress
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check(self):
+        """취소되었으면 JobCancelled 발생 (작업 함수가 단계 사이마다 호출)"""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+
+def _run_job(func, job, *args):
+    with span("job." + func.__name__, message=job.progress()[2]):
+        return func(job, *args)
+
+
+class BackgroundRunner:
+    """
+    Tk 앱용 백그라운드 작업 실행기
+    root: Tk 루트, progressbar: ttk.Progressbar, status_var: 상태 문구 StringVar
+    on_busy: 작업 시작/종료 시 호출 (True/False) - 버튼 활성화 전환 등
+    """
+
+    def __init__(self, root, progressbar=None, status_var=None, on_busy=None,
+                 executor=None, poll_ms=50):
+        self.root = root
+        self.progressbar = progressbar
+        self.status_var = status_var
+        self.on_busy = on_busy
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.poll_ms = poll_ms
+        self._current = None  # (job, future, on_done, on_error)
+
+    @property
+    def busy(self):
+        return self._current is not None
+
+    def submit(self, func, *args, message="", on_done=None, on_error=None):
+        """
+        func(job, *args)를 백그라운드에서 실행
+        완료 시 on_done(결과), 실패 시 on_error(예외)를 메인 스레드에서 호출
+        """
+        if self.busy:
+            raise RuntimeError("이미 작업이 진행 중입니다.")
+        job = Job(message)
+        future = self.executor.submit(_run_job, func, job, *args)
+        self._current = (job, future, on_done, on_error)
+        self._set_busy(True, message)
+        self.root.after(self.poll_ms, self._poll)
+        return job
+
+    def cancel(self):
+        """진행 중인 작업 취소 (결과는 버려진다)"""
+        if self._current is not None:
+            job, future = self._current[:2]
+            job.cancel()
+            future.cancel()
+            self._finish()
+            if self.status_var is not None:
+                self.status_var.set("취소되었습니다.")
+
+    def _poll(self):
+        if self._current is None:
+            return
+        job, future, on_done, on_error = self._current
+        if not future.done():
+            self._show_progress(*job.progress())
+            self.root.after(self.poll_ms, self._poll)
+            return
+
+        self._finish()
+        error = future.exception()
+        if isinstance(error, JobCancelled):
+            return
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+            return
+        if self.status_var is not None:
+            self.status_var.set("완료")
+        if on_done is not None:
+            with span("ui.on_done", callback=getattr(on_done, "__name__", "")):
+                on_done(future.result())
+
+    def _show_progress(self, done, total, message):
+        if self.status_var is not None and message:
+            self.status_var.set(message if not total else f"{message} ({done}/{total})")
+        if self.progressbar is None:
+            return
+        if total:
+            if str(self.progressbar["mode"]) != "determinate":
+                self.progressbar.stop()
+                self.progressbar.configure(mode="determinate", maximum=total)
+            self.progressbar["value"] = done
+
+    def _set_busy(self, busy, message=""):
+        if self.progressbar is not None:
+            if busy:
+                self.progressbar.configure(mode="indeterminate", value=0)
+                self.progressbar.start(15)
+            else:
+                self.progressbar.stop()
+                self.progressbar.configure(mode="determinate", value=0)
+        if self.status_var is not None and busy:
+            self.status_var.set(message)
+        if self.on_busy is not None:
+            self.on_busy(busy)
+
+    def _finish(self):
+        self._current = None
+        self._set_busy(False)
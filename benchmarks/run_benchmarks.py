@@ -0,0 +1,350 @@
+"""
+성능 벤치마크 (파일 읽기, α 계산, 분석 서버 요청, 결과 로그 표시, 결과 저장)
+
+사용 예:
+    python benchmarks/run_benchmarks.py                    # quick 구성, 저장된 기준선과 비교
+    python benchmarks/run_benchmarks.py --preset full      # N 1e3~1e6, k 5~500 (셀 수 한도 이내)
+    python benchmarks/run_benchmarks.py --filter alpha     # 이름에 alpha가 들어간 항목만
+    python benchmarks/run_benchmarks.py --save-baseline    # 현재 결과를 기준선으로 저장
+
+항목마다 --repeat번 실행해 가장 짧은 시간을 쓰고, 한 번 더 tracemalloc으로 최대 메모리를 잰다.
+기준선(benchmarks/baseline.json)보다 시간이 --tolerance 이상 느려지거나 최대 메모리가
+--memory-tolerance 이상 늘면 REGRESSION으로 표시하고 종료 코드 1로 끝난다.
+기준선은 측정한 컴퓨터에서만 의미가 있으므로 다른 컴퓨터에서는 먼저 --save-baseline으로 만든다.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from column_index import ColumnIndex  # noqa: E402
+from dataset_stats import DatasetStats  # noqa: E402
+from reliability import cronbach_alpha, reliability_analysis  # noqa: E402
+from export import export_results  # noqa: E402
+from synthetic import make_results, make_survey  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+PRESETS = {
+    "quick": {"rows": [1_000, 10_000], "items": [5, 50], "missing": [0.0, 0.1]},
+    "full": {"rows": [1_000, 10_000, 100_000, 1_000_000], "items": [5, 50, 500], "missing": [0.0, 0.1]},
+}
+DEFAULT_MAX_CELLS = 50_000_000  # 응답자 수 × 문항 수가 이보다 큰 조합은 건너뜀
+XLSX_MAX_CELLS = 200_000  # 엑셀 읽기는 느리므로 작은 데이터에서만 측정
+N_RESULTS = 100  # 결과 로그 표시/저장에 쓰는 결과 수
+NOISE_SECONDS = 0.002  # 이보다 작은 시간 차이는 회귀로 보지 않음
+NOISE_MB = 1.0
+
+
+class Context:
+    """데이터 크기 하나에 대한 벤치마크 준비물 (가상 데이터와 임시 파일)"""
+
+    def __init__(self, n_rows, n_items, missing_rate, workdir):
+        self.n_rows, self.n_items, self.missing_rate = n_rows, n_items, missing_rate
+        self.workdir = workdir
+        self.data = make_survey(n_rows, n_items, missing_rate)
+        self.columns = list(self.data.columns)
+        self._paths = {}
+        self.cleanup = None  # 항목이 끝난 뒤 정리할 함수 (Tk 창 등)
+
+    def path(self, extension):
+        """가상 데이터를 저장한 파일 경로 (처음 요청할 때 한 번만 저장)"""
+        if extension not in self._paths:
+            path = os.path.join(self.workdir, f"survey_{self.n_rows}_{self.n_items}_{self.missing_rate}.{extension}")
+            if extension == "csv":
+                self.data.to_csv(path, index=False)
+            else:
+                self.data.to_excel(path, index=False)
+            self._paths[extension] = path
+        return self._paths[extension]
+
+
+# ---------- 벤치마크 항목: setup(ctx) → 측정할 함수 ----------
+
+def bench_load_csv(ctx):
+    from workbook_cache import parse_file
+    path = ctx.path("csv")
+    return lambda: parse_file(path)
+
+
+def bench_load_xlsx(ctx):
+    from workbook_cache import parse_file
+    path = ctx.path("xlsx")
+    return lambda: parse_file(path)
+
+
+def bench_load_cached(ctx):
+    from workbook_cache import read_workbook
+    path = ctx.path("csv")
+    read_workbook(path, use_cache=True)  # 캐시 채우기
+    return lambda: read_workbook(path, use_cache=True)
+
+
+def bench_load_header(ctx):
+    from lazy_workbook import LazyWorkbook
+    path = ctx.path("xlsx")
+    return lambda: LazyWorkbook(path).columns
+
+
+def bench_load_columns(ctx):
+    from lazy_workbook import LazyWorkbook
+    from workbook_cache import read_workbook
+    path = ctx.path("csv")
+    read_workbook(path, use_cache=True)  # 캐시 채우기
+    columns = ctx.columns[:5]  # 척도 하나 분량의 문항만 캐시에서 읽음
+    return lambda: LazyWorkbook(path, use_cache=True).load(columns)
+
+
+def bench_resolve(ctx):
+    spec = f"문항1 to 문항{ctx.n_items}, -문항2, 문항2(R)"
+    return lambda: ColumnIndex(ctx.columns).resolve(spec)
+
+
+def bench_alpha(ctx):
+    return lambda: cronbach_alpha(ctx.data)
+
+
+def bench_alpha_item_deleted(ctx):
+    return lambda: reliability_analysis(ctx.data)
+
+
+def bench_stats_cold(ctx):
+    return lambda: DatasetStats(ctx.data).reliability(ctx.columns)
+
+
+def bench_compact_build(ctx):
+    from compact_data import CompactData
+    return lambda: CompactData.from_frame(ctx.data)
+
+
+def bench_stats_cold_compact(ctx):
+    from compact_data import CompactData
+    data = CompactData.from_frame(ctx.data)
+    return lambda: DatasetStats(data).reliability(ctx.columns)
+
+
+def bench_stats_warm(ctx):
+    stats = DatasetStats(ctx.data)
+    stats.reliability(ctx.columns)
+    subset = ctx.columns[::2] if len(ctx.columns) > 3 else ctx.columns
+    return lambda: stats.reliability(subset, missing="pairwise")
+
+
+def bench_server_alpha(ctx):
+    """분석 서버에 상주한 데이터로 문항 제거 시 α 요청 한 번 (localhost 왕복 포함)"""
+    import threading
+
+    from analysis_client import AnalysisClient
+    from analysis_server import AnalysisService, make_server
+
+    service = AnalysisService(workers=2, root=ctx.workdir)
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def cleanup():
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    ctx.cleanup = cleanup
+    client = AnalysisClient("http://127.0.0.1:%d" % server.server_address[1], token=server.token)
+    workbook = client.load(ctx.path("csv"))
+    workbook.item_deleted(ctx.columns, missing="pairwise")  # 열 읽기와 블록 계산은 미리
+    subset = ctx.columns[::2] if len(ctx.columns) > 3 else ctx.columns
+    return lambda: workbook.item_deleted(subset, missing="pairwise")
+
+
+def bench_render_log(ctx):
+    import tkinter as tk
+
+    from widgets import ResultsLogView
+
+    root = tk.Tk()  # 화면이 없으면 TclError → 건너뜀
+    root.withdraw()
+    results = make_results(N_RESULTS, ctx.n_items)
+
+    def run():
+        view = ResultsLogView(root)
+        view.extend(results)  # 세션 복원과 같은 방식
+        root.update_idletasks()
+        view.destroy()
+
+    ctx.cleanup = root.destroy
+    return run
+
+
+def bench_export(extension):
+    def setup(ctx):
+        results = make_results(N_RESULTS, ctx.n_items)
+        path = os.path.join(ctx.workdir, "export" + extension)
+        return lambda: export_results(results, path)
+    return setup
+
+
+# (이름, setup, 응답자 수에 따라 달라지는지, 실행 조건)
+BENCHMARKS = [
+    ("load_csv", bench_load_csv, True, None),
+    ("load_xlsx", bench_load_xlsx, True, lambda ctx: ctx.n_rows * ctx.n_items <= XLSX_MAX_CELLS),
+    ("load_cached", bench_load_cached, True, None),
+    ("load_header", bench_load_header, False, lambda ctx: ctx.n_rows * ctx.n_items <= XLSX_MAX_CELLS),
+    ("load_columns", bench_load_columns, True, None),
+    ("resolve", bench_resolve, False, None),
+    ("alpha", bench_alpha, True, None),
+    ("alpha_item_deleted", bench_alpha_item_deleted, True, None),
+    ("stats_cold", bench_stats_cold, True, None),
+    ("stats_warm", bench_stats_warm, True, None),
+    ("compact_build", bench_compact_build, True, None),
+    ("stats_cold_compact", bench_stats_cold_compact, True, None),
+    ("server_alpha", bench_server_alpha, True, None),
+    ("render_log", bench_render_log, False, None),
+    ("export_xlsx", bench_export(".xlsx"), False, None),
+    ("export_csv", bench_export(".csv"), False, None),
+    ("export_parquet", bench_export(".parquet"), False, None),
+]
+
+
+def measure(func, repeat):
+    """(가장 짧은 실행 시간 초, 최대 추가 메모리 MB)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), peak / 2 ** 20
+
+
+def run(grid, repeat, name_filter=None, max_cells=DEFAULT_MAX_CELLS, log=print):
+    """grid의 모든 크기에서 벤치마크 실행 → {항목 키: {"seconds", "peak_mb"} 또는 {"skipped": 사유}}"""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ["RELIABILITY_CACHE_DIR"] = os.path.join(workdir, "cache")
+        for missing_rate in grid["missing"]:
+            for n_items in grid["items"]:
+                for row_index, n_rows in enumerate(grid["rows"]):
+                    if n_rows * n_items > max_cells:
+                        continue
+                    ctx = Context(n_rows, n_items, missing_rate, workdir)
+                    for name, setup, by_rows, condition in BENCHMARKS:
+                        if name_filter and name_filter not in name:
+                            continue
+                        if not by_rows and row_index > 0:
+                            continue
+                        if condition is not None and not condition(ctx):
+                            continue
+                        key = case_key(name, n_rows if by_rows else None, n_items, missing_rate)
+                        ctx.cleanup = None
+                        try:
+                            seconds, peak_mb = measure(setup(ctx), repeat)
+                        except Exception as e:  # 화면이 없는 환경의 Tk 등
+                            results[key] = {"skipped": f"{type(e).__name__}: {e}"}
+                            log(f"{key:<55} 건너뜀 ({type(e).__name__})")
+                            continue
+                        finally:
+                            if ctx.cleanup is not None:
+                                ctx.cleanup()
+                        results[key] = {"seconds": round(seconds, 6), "peak_mb": round(peak_mb, 3)}
+                        log(f"{key:<55} {seconds * 1000:10.2f} ms {peak_mb:10.2f} MB")
+    return results
+
+
+def case_key(name, n_rows, n_items, missing_rate):
+    rows = f"N={n_rows}," if n_rows is not None else ""
+    return f"{name}[{rows}k={n_items},missing={missing_rate:g}]"
+
+
+def compare(results, baseline, tolerance, memory_tolerance):
+    """기준선과 비교 → 회귀 항목 설명 리스트"""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None or "seconds" not in current or "seconds" not in base:
+            continue
+        if (current["seconds"] > base["seconds"] * (1 + tolerance)
+                and current["seconds"] - base["seconds"] > NOISE_SECONDS):
+            regressions.append(f"{key}: 시간 {base['seconds'] * 1000:.2f} ms → {current['seconds'] * 1000:.2f} ms "
+                               f"({current['seconds'] / base['seconds']:.2f}배)")
+        if (current["peak_mb"] > base["peak_mb"] * (1 + memory_tolerance)
+                and current["peak_mb"] - base["peak_mb"] > NOISE_MB):
+            regressions.append(f"{key}: 메모리 {base['peak_mb']:.2f} MB → {current['peak_mb']:.2f} MB")
+    return regressions
+
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+            "machine": platform.machine(), "system": platform.system()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="신뢰도 분석 성능 벤치마크")
+    parser.add_argument("--preset", choices=PRESETS, default="quick", help="데이터 크기 구성 (기본값: quick)")
+    parser.add_argument("--rows", type=int, nargs="+", help="응답자 수 목록 (preset 대신)")
+    parser.add_argument("--items", type=int, nargs="+", help="문항 수 목록 (preset 대신)")
+    parser.add_argument("--missing", type=float, nargs="+", help="결측 비율 목록 (preset 대신)")
+    parser.add_argument("--max-cells", type=int, default=DEFAULT_MAX_CELLS,
+                        help=f"응답자 수 × 문항 수 한도 (기본값: {DEFAULT_MAX_CELLS:,})")
+    parser.add_argument("--filter", help="이름에 이 문자열이 들어간 항목만 실행")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (기본값: 3)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준선 파일 (기본값: benchmarks/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준선으로 저장 (기존 항목은 덮어씀)")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="허용하는 시간 증가 비율 (기본값: 0.5)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="허용하는 메모리 증가 비율 (기본값: 0.2)")
+    parser.add_argument("-o", "--output", help="결과를 JSON으로 저장할 파일")
+    args = parser.parse_args(argv)
+
+    grid = dict(PRESETS[args.preset])
+    for option in ("rows", "items", "missing"):
+        if getattr(args, option):
+            grid[option] = getattr(args, option)
+
+    results = run(grid, args.repeat, args.filter, args.max_cells)
+    report = {"environment": environment(), "cases": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        baseline = {"environment": environment(), "cases": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline["environment"] = environment()
+        baseline["cases"].update({key: value for key, value in results.items() if "seconds" in value})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("기준선이 없습니다. --save-baseline으로 먼저 만드세요.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline["cases"], args.tolerance, args.memory_tolerance)
+    if regressions:
+        print(f"\nREGRESSION ({len(regressions)}개 항목이 기준선보다 나빠짐)")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\n기준선 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+GUI 시작 시간 측정 (매번 새 파이썬 프로세스에서 실행)
+
+사용 예:
+    python benchmarks/startup.py               # 5번씩 실행해 최소/중앙값 표시
+    python benchmarks/startup.py --repeat 10
+
+    interpreter   파이썬만 시작 (-c pass)
+    import        import reliability_gui (계산 모듈 + tkinter)
+    window        창과 위젯을 만들고 한 번 그리기 (화면이 없으면 건너뜀)
+
+항목마다 시작할 때 불러온 무거운 모듈(pandas, openpyxl, pyarrow)도 표시한다.
+창을 띄울 때 pandas가 보이면 어딘가에서 모듈 최상단 import가 다시 생긴 것이다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("numpy", "pandas", "openpyxl", "pyarrow")
+
+_REPORT = f"import json, sys; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+CASES = {
+    "interpreter": "pass",
+    "import": "import reliability_gui; " + _REPORT,
+    "window": ("import tkinter, reliability_gui\n"
+               "try:\n"
+               "    root = reliability_gui.build_window()\n"
+               "except tkinter.TclError:\n"
+               "    raise SystemExit(3)\n"
+               "root.update()\n"
+               + _REPORT + "\n"
+               "root.destroy()"),
+}
+_NO_DISPLAY = 3
+
+
+def run_case(code):
+    """새 프로세스에서 code 실행 → (걸린 시간, 불러온 무거운 모듈) - 화면이 없으면 None"""
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if completed.returncode == _NO_DISPLAY:
+        return None
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip())
+    output = completed.stdout.strip().splitlines()
+    return seconds, json.loads(output[-1]) if output else []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GUI 시작 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수 (기본값: 5)")
+    args = parser.parse_args(argv)
+
+    print(f"{'항목':<12}{'최소':>10}{'중앙값':>10}  불러온 모듈")
+    for name, code in CASES.items():
+        runs = [run_case(code) for _ in range(args.repeat)]
+        if runs[0] is None:
+            print(f"{name:<12}  (화면이 없어 건너뜀)")
+            continue
+        seconds = [run[0] for run in runs]
+        print(f"{name:<12}{min(seconds) * 1000:>8.0f}ms{statistics.median(seconds) * 1000:>8.0f}ms  "
+              f"{', '.join(runs[-1][1]) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+벤치마크용 가상 설문 데이터 생성
+
+1요인 모형(공통 요인 + 고유 오차)으로 만든 연속 점수를 1~5점 리커트 응답으로 자른다.
+문항명은 '문항1'..'문항k' (문항군 범위 입력 '문항1 to 문항k'로 전체 선택 가능).
+같은 (응답자 수, 문항 수, 결측 비율, 시드)는 항상 같은 데이터를 만든다.
+"""
+import numpy as np
+import pandas as pd
+
+
+def make_survey(n_rows, n_items, missing_rate=0.0, seed=0, n_groups=0):
+    """
+    가상 설문 DataFrame
+    missing_rate: 응답마다 독립적으로 결측이 될 확률
+    n_groups: 0보다 크면 '집단' 열(1..n_groups)도 추가
+    """
+    rng = np.random.default_rng(seed)
+    loadings = rng.uniform(0.4, 0.9, n_items)
+    factor = rng.standard_normal((n_rows, 1))
+    scores = factor * loadings + rng.standard_normal((n_rows, n_items)) * np.sqrt(1 - loadings ** 2)
+    values = np.clip(np.round(scores * 1.2 + 3), 1, 5)
+    if missing_rate:
+        values[rng.random(values.shape) < missing_rate] = np.nan
+
+    data = pd.DataFrame(values, columns=[f"문항{i}" for i in range(1, n_items + 1)])
+    if n_groups:
+        data["집단"] = rng.integers(1, n_groups + 1, n_rows)
+    return data
+
+
+def make_results(n_results, n_items, n_scales=10, seed=0):
+    """
+    결과 로그 렌더링/저장 벤치마크용 결과 항목 리스트 (report.make_result 형식)
+    n_scales: 서로 다른 척도 수 (같은 척도를 문항을 바꿔 가며 여러 번 분석하는 사용 방식)
+    """
+    from report import make_result
+
+    rng = np.random.default_rng(seed)
+    results = []
+    for r in range(n_results):
+        columns = [f"척도{r % n_scales}_{i}" for i in range(1, n_items + 1)]
+        removed = dict(zip(columns, rng.uniform(0.6, 0.9, n_items)))
+        n = (1000, {col: 1000 for col in columns})
+        results.append(make_result(f"척도{r % n_scales}", columns, float(rng.uniform(0.6, 0.9)), removed,
+                                   n=n, missing="listwise"))
+    return results
@@ -0,0 +1,221 @@
+"""
+크론바흐 알파와 문항 제거 시 알파의 부트스트랩/잭나이프 신뢰구간
+
+재표본은 인덱스 배열로 한꺼번에 만들고 (반복 수 × 응답자 수) 가중치 행렬로 바꾼 뒤,
+α 계산에 필요한 합계들을 행렬 곱 한 번으로 모든 반복에 대해 구한다.
+반복은 작업 단위로 나누어 실행기(스레드/프로세스 풀)에 분산할 수 있고,
+작업별 난수 시드는 SeedSequence로 고정되어 실행기와 무관하게 같은 결과가 나온다.
+
+결측 처리 방식은 reliability와 같다. listwise는 결측 없는 응답자만 남기고, mean은 평균으로
+한 번 대체한 뒤 재표본을 뽑는다. pairwise는 (응답자 수 × 문항 수) 관측 마스크와 중심화 값만 두고,
+반복 묶음마다 가중 교차곱으로 문항 쌍별 충분통계량을 구한다 (응답자 수 × k² 특징 행렬은 만들지 않음).
+"""
+import numpy as np
+
+from instrumentation import span
+from reliability import DEFAULT_MISSING, alpha_from_covariance, check_missing_mode, covariance_from_moments
+
+DEFAULT_N_BOOT = 2000
+DEFAULT_LEVEL = 0.95
+_N_TASKS = 8
+_BATCH_CELLS = 4_000_000  # 한 번에 만드는 가중치 행렬의 최대 원소 수
+
+
+def _prepare(values, missing):
+    """결측 처리 적용 → (응답 배열, 쌍별 계산 필요 여부)"""
+    check_missing_mode(missing)
+    values = np.asarray(values, dtype=float)
+    observed = ~np.isnan(values)
+    if observed.all():
+        return values, False
+    if missing == "listwise":
+        return values[observed.all(axis=1)], False
+    if missing == "mean":
+        with np.errstate(invalid="ignore"):
+            return np.where(observed, values, np.nanmean(values, axis=0)), False
+    return values, True
+
+
+def _features(values, pairwise=False):
+    """
+    응답자별 특징 - 가중합만으로 α와 문항 제거 시 α를 계산할 수 있도록 구성
+    결측 없는 자료: (응답자 수 × 3k+2) 문항 값, 제곱, 합계, 합계 제곱, 합계 × 문항
+    pairwise: (관측 마스크, 중심화하고 결측을 0으로 채운 값) - 각각 (응답자 수 × k),
+              가중합은 _weighted_sums가 문항 쌍별 곱(reliability.pairwise_moments의 행별 기여분)으로 구함
+    """
+    if not pairwise:
+        centered = values - values.mean(axis=0)
+        total = centered.sum(axis=1, keepdims=True)
+        return np.hstack([centered, centered ** 2, total, total ** 2, total * centered])
+
+    observed = ~np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        centered = np.where(observed, values - np.nanmean(values, axis=0), 0.0)
+    return observed, centered  # 마스크는 bool로 두어 작업에 넘기는 크기를 줄임
+
+
+def _n_rows(features, pairwise=False):
+    return len(features[0]) if pairwise else len(features)
+
+
+def _weighted_sums(features, weights, pairwise=False):
+    """
+    반복별 응답자 가중치 (반복 수 × 응답자 수) → 특징 가중합 (반복 수 × 특징 수)
+    pairwise의 특징은 (n, sx, sxy) 문항 쌍별 행렬을 펼쳐 이어 붙인 3k² 개
+    """
+    if not pairwise:
+        return weights @ features
+    mask, centered = features
+    b, k = len(weights), mask.shape[1]
+    weighted_mask = weights[:, :, None] * mask  # (반복, 응답자, 문항)
+    n = weighted_mask.transpose(0, 2, 1) @ mask.astype(float)
+    sx = centered.T @ weighted_mask
+    sxy = centered.T @ (weights[:, :, None] * centered)
+    return np.concatenate([n.reshape(b, k * k), sx.reshape(b, k * k), sxy.reshape(b, k * k)], axis=1)
+
+
+def _row_sums(features, start, stop, pairwise=False):
+    """응답자 start..stop 각각의 특징 (응답자 수 × 특징 수) - 잭나이프용"""
+    if not pairwise:
+        return features[start:stop]
+    mask, centered = (part[start:stop] for part in features)
+    mask = mask.astype(float)
+
+    def outer(a, b):
+        return (a[:, :, None] * b[:, None, :]).reshape(len(a), -1)
+
+    return np.hstack([outer(mask, mask), outer(centered, mask), outer(centered, centered)])
+
+
+def _alpha_from_sums(sums, n, n_items, pairwise=False):
+    """
+    가중합(..., 특징 수)과 가중치 합 n(...)으로 (α, 문항 제거 시 α) 계산 - 앞쪽 차원은 반복
+    """
+    k = n_items
+    n = np.asarray(n, dtype=float)
+    if pairwise:
+        shape = sums.shape[:-1] + (k, k)
+        moments = (sums[..., i * k * k:(i + 1) * k * k].reshape(shape) for i in range(3))
+        cov, _ = covariance_from_moments(*moments, n, "pairwise")
+        return alpha_from_covariance(cov)
+
+    s1, s2 = sums[..., :k], sums[..., k:2 * k]
+    t1, t2, tf = sums[..., 2 * k], sums[..., 2 * k + 1], sums[..., 2 * k + 2:]
+    n = n[..., None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        item_variances = (s2 - s1 ** 2 / n) / (n - 1)
+        variance_sum = item_variances.sum(axis=-1)
+        total_variance = (t2 - t1 ** 2 / n[..., 0]) / (n[..., 0] - 1)
+        alpha = (k / (k - 1)) * (1 - variance_sum / total_variance)
+
+        # 문항 j 제거 시 합계 = 합계 - x_j
+        removed_sum = t1[..., None] - s1
+        removed_sq = t2[..., None] - 2 * tf + s2
+        removed_total = (removed_sq - removed_sum ** 2 / n) / (n - 1)
+        if k > 2:
+            removed = ((k - 1) / (k - 2)) * (1 - (variance_sum[..., None] - item_variances) / removed_total)
+        else:
+            removed = np.full(removed_total.shape, np.nan)
+    return alpha, removed
+
+
+def _bootstrap_task(features, n_items, seed_seq, n_reps, pairwise=False):
+    """[작업] n_reps번의 부트스트랩 반복 → (α 배열, 문항 제거 시 α 배열)"""
+    rng = np.random.default_rng(seed_seq)
+    n = _n_rows(features, pairwise)
+    # pairwise는 반복마다 (응답자 수 × 문항 수) 가중 배열을 만듦
+    width = n * features[0].shape[1] if pairwise else max(n, features.shape[1])
+    batch = max(1, min(n_reps, _BATCH_CELLS // max(width, 1)))
+    alphas, removed = [], []
+    for start in range(0, n_reps, batch):
+        b = min(batch, n_reps - start)
+        idx = rng.integers(0, n, size=(b, n))
+        # 인덱스 배열 → 반복별 응답자 가중치(뽑힌 횟수)
+        weights = np.bincount((idx + n * np.arange(b)[:, None]).ravel(), minlength=b * n).reshape(b, n)
+        a, r = _alpha_from_sums(_weighted_sums(features, weights, pairwise), np.full(b, n), n_items, pairwise)
+        alphas.append(a)
+        removed.append(r)
+    return np.concatenate(alphas), np.concatenate(removed)
+
+
+def _percentile_ci(replicates, level):
+    tail = (1 - level) / 2 * 100
+    with np.errstate(invalid="ignore"):
+        return np.nanpercentile(replicates, [tail, 100 - tail], axis=0)
+
+
+def _jackknife_ci(features, n_items, estimate, removed_estimate, level, pairwise=False):
+    """잭나이프(응답자 하나씩 제외) 표준오차를 이용한 정규근사 신뢰구간"""
+    from statistics import NormalDist
+
+    n = _n_rows(features, pairwise)
+    total = _weighted_sums(features, np.ones((1, n)), pairwise)[0]
+    batch = max(1, _BATCH_CELLS // max(len(total), 1))
+    alphas, removed = [], []
+    for start in range(0, n, batch):
+        rows = _row_sums(features, start, min(start + batch, n), pairwise)
+        a, r = _alpha_from_sums(total - rows, np.full(len(rows), n - 1), n_items, pairwise)
+        alphas.append(a)
+        removed.append(r)
+    alphas, removed = np.concatenate(alphas), np.concatenate(removed)
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+
+    def interval(replicates, center):
+        se = np.sqrt((n - 1) / n * np.nansum((replicates - np.nanmean(replicates, axis=0)) ** 2, axis=0))
+        return np.array([center - z * se, center + z * se])
+
+    return interval(alphas, estimate), interval(removed, removed_estimate)
+
+
+def alpha_confidence_intervals(values, columns, method="bootstrap", n_boot=DEFAULT_N_BOOT,
+                               level=DEFAULT_LEVEL, seed=None, executor=None, progress=None,
+                               missing=DEFAULT_MISSING):
+    """
+    α와 문항 제거 시 α의 신뢰구간
+    values: (응답자 수, 문항 수) 배열, columns: 문항명
+    method: "bootstrap" (백분위 부트스트랩) 또는 "jackknife" (잭나이프 정규근사)
+    executor: 부트스트랩 작업을 분산할 concurrent.futures 실행기 (없으면 순차 실행)
+    progress: progress(완료 작업 수, 전체 작업 수) 콜백
+    missing: 결측 처리 방식 (listwise, pairwise, mean)
+    반환: {"level": 수준, "alpha": (하한, 상한), "removed": {문항명: (하한, 상한)}}
+    """
+    with span("ci." + method, rows=len(values), columns=len(columns), missing=missing, n_boot=n_boot):
+        values, pairwise = _prepare(values, missing)
+        if len(values) < 2:
+            # listwise에서 모든 응답자에게 결측이 있는 경우 등 - 재표본을 뽑을 수 없음
+            raise ValueError(f"신뢰구간을 계산할 응답자가 없습니다 (결측 처리 후 {len(values)}명, 2명 이상 필요).")
+        features = _features(values, pairwise)
+        n_items = len(columns)
+
+        if method == "jackknife":
+            total = _weighted_sums(features, np.ones((1, len(values))), pairwise)[0]
+            estimate, removed_estimate = _alpha_from_sums(total, len(values), n_items, pairwise)
+            alpha_ci, removed_ci = _jackknife_ci(features, n_items, estimate, removed_estimate, level, pairwise)
+        elif method == "bootstrap":
+            seeds = np.random.SeedSequence(seed).spawn(_N_TASKS)
+            reps = [n_boot // _N_TASKS + (i < n_boot % _N_TASKS) for i in range(_N_TASKS)]
+            tasks = [(seed_seq, n) for seed_seq, n in zip(seeds, reps) if n]
+            if executor is None:
+                results = []
+                for seed_seq, n in tasks:
+                    results.append(_bootstrap_task(features, n_items, seed_seq, n, pairwise))
+                    if progress is not None:
+                        progress(len(results), len(tasks))
+            else:
+                futures = [executor.submit(_bootstrap_task, features, n_items, seed_seq, n, pairwise)
+                           for seed_seq, n in tasks]
+                results = []
+                for future in futures:  # 제출 순서대로 모아 실행기와 무관하게 같은 결과
+                    results.append(future.result())
+                    if progress is not None:
+                        progress(len(results), len(tasks))
+            alpha_ci = _percentile_ci(np.concatenate([a for a, _ in results]), level)
+            removed_ci = _percentile_ci(np.concatenate([r for _, r in results]), level)
+        else:
+            raise ValueError(f"알 수 없는 신뢰구간 방법: {method}")
+
+    return {
+        "level": level,
+        "alpha": (float(alpha_ci[0]), float(alpha_ci[1])),
+        "removed": {col: (float(lo), float(hi)) for col, lo, hi in zip(columns, removed_ci[0], removed_ci[1])},
+    }
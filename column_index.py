@@ -0,0 +1,213 @@
+"""
+문항명 색인과 문항 선택 해석기
+
+파일을 불러올 때 한 번 만들어 두고 문항 검색(접두어/부분 문자열),
+문항군 묶음(희망1..희망N), 문항 선택 입력 해석에 사용한다.
+
+문항 선택 입력 (쉼표로 구분)
+    희망1               문항 하나
+    희망1 to 희망6      범위 (문항군 번호 기준, 희망10처럼 두 자리 이상도 가능, 희망1to희망6처럼 붙여 써도 됨)
+    희망01 to 희망12    0으로 시작하는 번호는 자릿수를 맞춘 문항명 (희망01, 희망02, ..., 희망12)
+    희망*, 희망?        와일드카드
+    -희망3, !희망3      앞에서 고른 문항에서 제외
+    희망3(R)            역코딩 문항 (범위/와일드카드에도 사용 가능)
+
+입력과 똑같은 이름의 문항이 있으면 범위나 와일드카드로 해석하지 않는다 (e.g., 'Q1[a]', 'from to end').
+범위는 입력한 번호로 만든 문항명 그대로 찾고, 번호가 같은 다른 문항(희망1 대신 희망01)으로 바꾸지 않는다.
+"""
+import bisect
+import fnmatch
+import re
+from typing import NamedTuple
+
+_FAMILY_PATTERN = re.compile(r"^(.*?)(\d+)$")
+_RANGE_PATTERN = re.compile(r"^(.*?\d)\s*to\s*(.*?\d)$", re.IGNORECASE)
+_SPACED_TO_PATTERN = re.compile(r"^(.+?)\s+to\s+(.+)$", re.IGNORECASE)  # 번호로 끝나지 않는 범위 (오류 안내용)
+_REVERSE_PATTERN = re.compile(r"^(.*?)\s*\((?:R|역)\)$", re.IGNORECASE)
+
+
+class SelectionError(ValueError):
+    """문항 선택 입력 오류 (errors: 토큰별 오류 메시지 리스트)"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__("\n".join(self.errors))
+
+
+class Selection(NamedTuple):
+    """해석된 문항 선택 (columns: 입력 순서의 문항명, reversed: 역코딩 문항명 집합)"""
+    columns: list
+    reversed: frozenset
+
+    def labels(self):
+        """결과 표시용 문항명 (역코딩 문항은 '(R)' 표시)"""
+        return [f"{col}(R)" if col in self.reversed else col for col in self.columns]
+
+
+def split_family(name):
+    """문항명을 (접두어, 번호)로 분리 (e.g., '희망10' → ('희망', 10)), 번호가 없으면 None"""
+    match = _FAMILY_PATTERN.match(str(name))
+    if not match or not match.group(1):
+        return None
+    return match.group(1), int(match.group(2))
+
+
+class ColumnIndex:
+    """
+    column_names: 데이터의 문항명 리스트 (원래 순서 유지)
+    """
+
+    def __init__(self, column_names):
+        self.names = list(column_names)
+        self._positions = {name: i for i, name in enumerate(self.names)}
+        self._positions.update({str(name): i for i, name in enumerate(self.names)})
+        self._lower = [str(name).lower() for name in self.names]
+        self._sorted = sorted((lower, i) for i, lower in enumerate(self._lower))
+        self._sorted_keys = [lower for lower, _ in self._sorted]
+
+        # 문항군: 접두어 → [(번호, 위치), ...] (번호 순)
+        self.families = {}
+        for i, name in enumerate(self.names):
+            parts = split_family(name)
+            if parts is not None:
+                self.families.setdefault(parts[0], []).append((parts[1], i))
+        for members in self.families.values():
+            members.sort()
+
+        self._last_query = ""
+        self._last_result = list(range(len(self.names)))
+
+    def __len__(self):
+        return len(self.names)
+
+    def prefix(self, prefix):
+        """접두어로 시작하는 문항 위치 (원래 순서)"""
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        stop = bisect.bisect_left(self._sorted_keys, prefix + "\U0010ffff")
+        return sorted(i for _, i in self._sorted[start:stop])
+
+    def search(self, query):
+        """
+        부분 문자열 검색 → 문항 위치 리스트 (원래 순서), '희망*'처럼 *로 끝나면 접두어 검색
+        이전 검색어에 글자를 덧붙인 경우 이전 결과 안에서만 다시 찾는다 (입력할 때마다 호출)
+        """
+        query = query.strip().lower()
+        if query.endswith("*"):
+            return self.prefix(query.rstrip("*"))
+        if not query:
+            result = list(range(len(self.names)))
+        elif self._last_query and query.startswith(self._last_query):
+            result = [i for i in self._last_result if query in self._lower[i]]
+        else:
+            result = [i for i, lower in enumerate(self._lower) if query in lower]
+        self._last_query, self._last_result = query, result
+        return result
+
+    def family_of(self, name):
+        """같은 문항군의 문항명 리스트 (번호 순), 문항군이 없으면 [name]"""
+        parts = split_family(name)
+        if parts is None or parts[0] not in self.families:
+            return [name]
+        return [self.names[i] for _, i in self.families[parts[0]]]
+
+    def resolve(self, spec):
+        """
+        문항 선택 입력을 실제 문항명으로 해석 (계산 전에 모든 오류를 모아 SelectionError로 알림)
+        spec: '희망1 to 희망6, -희망3, 불안2(R)' 같은 문자열 또는 토큰 리스트
+        반환: Selection
+        """
+        tokens = spec.split(",") if isinstance(spec, str) else list(spec)
+        reversed_columns, errors = set(), []
+        chosen = {}  # 선택된 문항 위치 → 선택 순번
+        order = 0
+
+        for raw in tokens:
+            token = str(raw).strip()
+            if not token:
+                continue
+            exclude = token[0] in "-!"
+            if exclude:
+                token = token[1:].strip()
+            reverse = False
+            match = _REVERSE_PATTERN.match(token)
+            if match:
+                token, reverse = match.group(1).strip(), True
+
+            try:
+                positions = self._resolve_token(token)
+            except SelectionError as e:
+                errors.extend(e.errors)
+                continue
+
+            if exclude:
+                for i in positions:
+                    if i not in chosen:
+                        errors.append(f"'{raw.strip()}': 제외할 문항 '{self.names[i]}'이(가) 앞에서 선택되지 않았습니다.")
+                    else:
+                        del chosen[i]
+                continue
+            for i in positions:
+                if i in chosen:
+                    errors.append(f"'{raw.strip()}': 문항 '{self.names[i]}'이(가) 두 번 이상 들어갔습니다.")
+                    continue
+                chosen[i] = order
+                order += 1
+                if reverse:
+                    reversed_columns.add(self.names[i])
+
+        selected = [self.names[i] for i in sorted(chosen, key=chosen.get)]
+        if not errors and len(selected) < 2:
+            errors.append("문항이 2개 이상 필요합니다.")
+        if errors:
+            raise SelectionError(errors)
+        return Selection(selected, frozenset(reversed_columns & set(selected)))
+
+    def _resolve_token(self, token):
+        """토큰 하나 → 문항 위치 리스트"""
+        position = self._positions.get(token)
+        if position is not None:
+            return [position]
+
+        range_match = _RANGE_PATTERN.match(token) or _SPACED_TO_PATTERN.match(token)
+        if range_match:
+            return self._resolve_range(token, range_match.group(1).strip(), range_match.group(2).strip())
+
+        if any(ch in token for ch in "*?["):
+            if token.endswith("*") and not any(ch in token[:-1] for ch in "*?["):
+                positions = [i for i in self.prefix(token[:-1]) if str(self.names[i]).startswith(token[:-1])]
+            else:
+                pattern = re.compile(fnmatch.translate(token))
+                positions = [i for i, name in enumerate(self.names) if pattern.match(str(name))]
+            if not positions:
+                raise SelectionError([f"'{token}': 일치하는 문항이 없습니다."])
+            return positions
+
+        hint = ""
+        parts = split_family(token)
+        if parts is not None and parts[0] in self.families:
+            numbers = [n for n, _ in self.families[parts[0]]]
+            hint = f" ('{parts[0]}' 문항 번호: {numbers[0]}~{numbers[-1]})"
+        raise SelectionError([f"'{token}': 데이터에 없는 문항입니다.{hint}"])
+
+    def _resolve_range(self, token, start, end):
+        start_parts, end_parts = split_family(start), split_family(end)
+        if start_parts is None or end_parts is None:
+            raise SelectionError([f"'{token}': 범위의 시작과 끝은 '희망1'처럼 번호로 끝나야 합니다."])
+        if start_parts[0] != end_parts[0]:
+            raise SelectionError([f"'{token}': 범위 입력의 시작과 끝 문항명이 일치해야 합니다!"])
+        prefix, first, last = start_parts[0], start_parts[1], end_parts[1]
+        if first > last:
+            raise SelectionError([f"'{token}': 범위의 시작 번호가 끝 번호보다 큽니다."])
+
+        # 입력한 번호 그대로 문항명을 만든다 (0으로 시작하는 번호는 그 자릿수를 유지)
+        digits = [name[len(prefix):] for name in (start, end)]
+        width = max((len(d) for d in digits if len(d) > 1 and d.startswith("0")), default=0)
+        names = [f"{prefix}{n:0{width}d}" for n in range(first, last + 1)]
+        missing = [name for name in names if name not in self._positions]
+        if missing:
+            others = [str(self.names[i]) for n, i in self.families.get(prefix, [])
+                      if first <= n <= last and str(self.names[i]) not in names]
+            hint = f" (자릿수가 다른 문항: {', '.join(others[:5])}{' 등' if len(others) > 5 else ''})" if others else ""
+            raise SelectionError([f"'{token}': 데이터에 없는 문항: {', '.join(missing)}{hint}"])
+        return [self._positions[name] for name in names]
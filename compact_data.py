@@ -0,0 +1,187 @@
+"""
+리커트 응답용 압축 데이터 (메모리 절약 모드)
+
+정수 값만 있고 값의 범위가 256 이하인 문항은 '값 - 최솟값'을 uint8 코드로, 결측 여부는 비트 마스크
+(응답자 8명당 1바이트)로 따로 보관한다. 코드와 마스크는 문항별로 연속된 열 우선(Fortran 순서) 배열이므로
+문항 블록을 읽을 때 필요한 열만 순서대로 읽는다. 응답 한 칸에 float64는 8바이트, 압축 모드는 약 1.1바이트.
+그 밖의 열(소수, 범위가 넓은 정수, 문자열)은 원래 DataFrame 그대로 보관한다.
+
+DatasetStats는 압축된 문항의 기준값을 최솟값으로 잡아 코드를 그대로 교차곱한다. 코드가 정수이므로
+교차곱 합은 float64(정수 2^53까지 정확)로 누적해도 정확하다 (응답자 수 × 255² < 2^53).
+
+환경 변수
+    RELIABILITY_COMPACT       1이면 불러온 문항을 압축 모드로 보관 (lazy_workbook)
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+_CODE_RANGE = 255  # uint8 코드로 담을 수 있는 최댓값 - 최솟값
+
+
+def compact_enabled():
+    return os.environ.get("RELIABILITY_COMPACT", "").strip().lower() in ("1", "true", "yes")
+
+
+def _integer_values(column):
+    """uint8 코드로 담을 수 있는 열이면 float 값 배열 (결측은 NaN), 아니면 None"""
+    if not pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+        return None
+    values = column.to_numpy(dtype=float, na_value=np.nan)
+    observed = values[~np.isnan(values)]
+    if observed.size and (not np.array_equal(observed, np.round(observed))
+                          or observed.max() - observed.min() > _CODE_RANGE):
+        return None
+    return values
+
+
+class CompactData:
+    """
+    압축 데이터 (DatasetStats에 DataFrame 대신 넘길 수 있음, CompactData.from_frame으로 생성)
+    columns: 전체 열 이름, codes: (응답자 수, 압축 문항 수) uint8 Fortran 배열 - 결측은 0
+    offsets: 압축 문항별 최솟값 (값 = 코드 + 최솟값), missing: 결측 비트 마스크 (np.packbits, 행 방향)
+    extra: 압축하지 않은 열 DataFrame
+    """
+
+    def __init__(self, columns, n_rows, codes, offsets, missing, has_missing, extra, slots):
+        self.columns = pd.Index(columns)
+        self.n_rows = n_rows
+        self.codes = codes
+        self.offsets = offsets
+        self.missing = missing
+        self.has_missing = has_missing
+        self.extra = extra
+        self._slots = slots  # 열 위치 → 압축 문항 번호 (0 이상) 또는 -(extra 열 번호 + 1)
+        self._positions = {}
+        for i, col in enumerate(self.columns):
+            self._positions.setdefault(col, i)
+
+    @classmethod
+    def from_frame(cls, data):
+        """DataFrame → 압축 데이터 (압축할 수 없는 열은 그대로 보관)"""
+        n_rows = len(data)
+        codes, offsets, masks, extra, slots = [], [], [], [], []
+        for i in range(data.shape[1]):
+            values = _integer_values(data.iloc[:, i])
+            if values is None:
+                slots.append(-(len(extra) + 1))
+                extra.append(i)
+                continue
+            observed = ~np.isnan(values)
+            low = values[observed].min() if observed.any() else 0.0
+            slots.append(len(codes))
+            codes.append(np.where(observed, values - low, 0).astype(np.uint8))
+            offsets.append(int(low))
+            masks.append(~observed)
+
+        code_array = np.empty((n_rows, len(codes)), dtype=np.uint8, order="F")
+        mask_array = np.empty(((n_rows + 7) // 8, len(codes)), dtype=np.uint8, order="F")
+        for j, (code, mask) in enumerate(zip(codes, masks)):
+            code_array[:, j] = code
+            mask_array[:, j] = np.packbits(mask)
+        return cls(data.columns, n_rows, code_array, np.array(offsets, dtype=np.int64), mask_array,
+                   np.array([mask.any() for mask in masks], dtype=bool),
+                   data.iloc[:, extra].reset_index(drop=True), np.array(slots, dtype=np.int64))
+
+    def __len__(self):
+        return self.n_rows
+
+    @property
+    def nbytes(self):
+        """보관 중인 배열 크기 (바이트)"""
+        return (self.codes.nbytes + self.missing.nbytes + self.offsets.nbytes
+                + int(self.extra.memory_usage(index=False).sum()))
+
+    def _observed(self, j):
+        return ~np.unpackbits(self.missing[:, j], count=self.n_rows).astype(bool)
+
+    def column(self, position):
+        """열 하나의 값 (float, 결측은 NaN) - 숫자가 아닌 열은 TypeError/ValueError"""
+        slot = self._slots[position]
+        if slot < 0:
+            return self.extra.iloc[:, -slot - 1].to_numpy(dtype=float, na_value=np.nan)
+        values = self.codes[:, slot] + float(self.offsets[slot])
+        if self.has_missing[slot]:
+            values[~self._observed(slot)] = np.nan
+        return values
+
+    def _position(self, col):
+        try:
+            return self._positions[col]
+        except KeyError:
+            raise ValueError(f"데이터에 없는 문항: {col}") from None
+
+    def values(self, columns):
+        """선택한 열의 값 배열 (응답자 수 × 열 수, float, 결측은 NaN)"""
+        values = np.empty((self.n_rows, len(columns)))
+        for j, col in enumerate(columns):
+            values[:, j] = self.column(self._position(col))
+        return values
+
+    def frame(self, columns):
+        """선택한 열의 DataFrame (결측이 없는 압축 열은 int64, 있으면 float64)"""
+        decoded = {}
+        for j, col in enumerate(columns):
+            position = self._position(col)
+            slot = self._slots[position]
+            if slot < 0:
+                decoded[j] = self.extra.iloc[:, -slot - 1]
+            elif self.has_missing[slot]:
+                decoded[j] = self.column(position)
+            else:
+                decoded[j] = self.codes[:, slot].astype(np.int64) + self.offsets[slot]
+        frame = pd.DataFrame(decoded, index=range(self.n_rows))
+        frame.columns = list(columns)
+        return frame
+
+    def centered_block(self, start, stop, shifts=None):
+        """
+        start~stop 열의 (관측 마스크, 기준값을 빼고 결측을 0으로 채운 배열, 기준값, 숫자가 아닌 열 리스트)
+        압축 열의 기준값은 최솟값이므로 배열 값은 정수 코드 그대로다.
+        shifts: 이전에 정한 기준값 (None이면 압축하지 않은 열은 관측치 평균)
+        """
+        width = stop - start
+        # 열 단위로 채우므로 Fortran 순서 (C 순서면 열마다 응답자 수만큼 띄엄띄엄 씀)
+        observed = np.ones((self.n_rows, width), dtype=bool, order="F")
+        centered = np.zeros((self.n_rows, width), order="F")
+        new_shifts = np.zeros(width)
+        non_numeric = []
+        for offset in range(width):
+            slot = self._slots[start + offset]
+            if slot >= 0:
+                centered[:, offset] = self.codes[:, slot]
+                new_shifts[offset] = self.offsets[slot]
+                if self.has_missing[slot]:
+                    observed[:, offset] = self._observed(slot)
+                continue
+            try:
+                values = self.extra.iloc[:, -slot - 1].to_numpy(dtype=float, na_value=np.nan)
+            except (TypeError, ValueError):
+                non_numeric.append(self.columns[start + offset])
+                observed[:, offset] = False
+                continue
+            observed[:, offset] = ~np.isnan(values)
+            if shifts is not None:
+                new_shifts[offset] = shifts[offset]
+            elif observed[:, offset].any():
+                new_shifts[offset] = values[observed[:, offset]].mean()
+            centered[:, offset] = np.where(observed[:, offset], values - new_shifts[offset], 0.0)
+        return observed, centered, new_shifts, non_numeric
+
+    def concat(self, other):
+        """열을 덧붙인 새 압축 데이터 (응답자가 같아야 함)"""
+        if other.n_rows != self.n_rows:
+            raise ValueError("응답자 수가 다른 데이터는 합칠 수 없습니다.")
+        m = self.codes.shape[1]
+        codes = np.empty((self.n_rows, m + other.codes.shape[1]), dtype=np.uint8, order="F")
+        codes[:, :m], codes[:, m:] = self.codes, other.codes
+        missing = np.empty((self.missing.shape[0], codes.shape[1]), dtype=np.uint8, order="F")
+        missing[:, :m], missing[:, m:] = self.missing, other.missing
+        n_extra = self.extra.shape[1]
+        other_slots = np.where(other._slots >= 0, other._slots + m, other._slots - n_extra)
+        return CompactData(list(self.columns) + list(other.columns), self.n_rows, codes,
+                           np.concatenate([self.offsets, other.offsets]), missing,
+                           np.concatenate([self.has_missing, other.has_missing]),
+                           pd.concat([self.extra, other.extra], axis=1),
+                           np.concatenate([self._slots, other_slots]))
@@ -0,0 +1,209 @@
+"""
+불러온 데이터 전체에 대한 문항 통계량 캐시
+
+문항 쌍별 충분통계량(응답자 수, 합, 교차곱 합)을 열 블록 단위로 필요할 때 한 번만 계산해 보관한다.
+이후 어떤 문항 조합을 어떤 결측 처리 방식(pairwise/mean)으로 분석하든 보관된 행렬의
+부분 행렬만 쓰므로 응답자 수에 비례하는 계산이 다시 일어나지 않는다.
+listwise는 선택한 문항에 결측이 없으면 같은 캐시를 쓰고, 결측이 있으면 원자료에서 계산한다.
+새 파일을 불러오면 새 DatasetStats를 만들어 교체한다.
+열을 필요할 때 읽는 경우(lazy_workbook)에는 add_columns로 열을 덧붙이며, 이미 계산한 블록은 그대로 쓴다.
+data로 압축 데이터(compact_data.CompactData)를 받으면 정수 문항은 uint8 코드를 그대로 교차곱한다.
+"""
+import threading
+import warnings
+
+import numpy as np
+
+from compact_data import CompactData
+from instrumentation import span
+from reliability import (DEFAULT_MISSING, alpha_from_covariance, check_missing_mode, covariance_from_moments,
+                         effective_n, item_covariance)
+
+DEFAULT_BLOCK_SIZE = 64
+
+
+def _cross_moments(values_a, values_b):
+    """두 블록의 (관측 마스크, 중심화 값) → a열 × b열 (n, sx, sy, sxy)"""
+    (mask_a, x_a), (mask_b, x_b) = values_a, values_b
+    return mask_a.T @ mask_b, x_a.T @ mask_b, mask_a.T @ x_b, x_a.T @ x_b
+
+
+class DatasetStats:
+    """
+    data: pandas DataFrame 또는 compact_data.CompactData (불러온 데이터 전체)
+    block_size: 한 번에 계산하는 열 블록 크기
+    """
+
+    def __init__(self, data, block_size=DEFAULT_BLOCK_SIZE):
+        self.data = data
+        self.block_size = block_size
+        self.n_rows = len(data)
+        self._positions = {col: i for i, col in enumerate(data.columns)}
+        self._has_missing = np.zeros(len(self._positions), dtype=bool)
+        self._non_numeric = set()
+        self._shifts = {}  # 블록 번호 → 열별 기준값 (관측치 평균)
+        self._cross = {}  # (블록 a, 블록 b) → a열 × b열 (n, sx, sy, sxy) 블록
+        self._lock = threading.Lock()
+
+    def add_columns(self, data):
+        """
+        열이 늘어난 데이터로 교체 (기존 열이 같은 순서로 앞에 있고 응답자는 같아야 함)
+        이미 계산한 블록 쌍은 유지하고, 열이 늘어나는 마지막 블록만 다시 계산한다.
+        """
+        old = len(self._positions)
+        if list(data.columns[:old]) != list(self.data.columns) or len(data) != self.n_rows:
+            raise ValueError("기존 열과 응답자가 같은 데이터에만 열을 추가할 수 있습니다.")
+        with self._lock:
+            if old % self.block_size:
+                partial = old // self.block_size
+                self._shifts.pop(partial, None)
+                self._cross = {pair: value for pair, value in self._cross.items() if partial not in pair}
+            self.data = data
+            self._positions = {col: i for i, col in enumerate(data.columns)}
+            self._has_missing = np.concatenate([self._has_missing, np.zeros(len(data.columns) - old, dtype=bool)])
+
+    def _positions_of(self, columns):
+        missing = [col for col in columns if col not in self._positions]
+        if missing:
+            raise ValueError(f"데이터에 없는 문항: {', '.join(map(str, missing))}")
+        return np.array([self._positions[col] for col in columns], dtype=int)
+
+    def _block_values(self, block):
+        """블록의 열들 → (관측 마스크, 기준값을 빼고 결측을 0으로 채운 배열)"""
+        start = block * self.block_size
+        stop = min(start + self.block_size, len(self._positions))
+        if isinstance(self.data, CompactData):
+            observed, centered, shifts, non_numeric = self.data.centered_block(start, stop, self._shifts.get(block))
+            self._non_numeric.update(non_numeric)
+            if block not in self._shifts:
+                self._shifts[block] = shifts
+                self._has_missing[start:stop] = ~observed.all(axis=0)
+            return observed.astype(float), centered
+
+        values = np.full((self.n_rows, stop - start), np.nan)
+        for offset, col in enumerate(self.data.columns[start:stop]):
+            try:
+                values[:, offset] = self.data.iloc[:, start + offset].to_numpy(dtype=float, na_value=np.nan)
+            except (TypeError, ValueError):
+                self._non_numeric.add(col)
+
+        observed = ~np.isnan(values)
+        if block not in self._shifts:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # 값이 없는 열은 기준값 0
+                self._shifts[block] = np.nan_to_num(np.nanmean(values, axis=0))
+            self._has_missing[start:stop] = ~observed.all(axis=0)
+        return observed.astype(float), np.where(observed, values - self._shifts[block], 0.0)
+
+    def _ensure_blocks(self, blocks):
+        """아직 없는 블록 쌍 계산 → 새로 계산한 블록 쌍 수"""
+        todo = [(a, b) for i, a in enumerate(blocks) for b in blocks[i:] if (a, b) not in self._cross]
+        if not todo:
+            return 0
+        if isinstance(self.data, CompactData):
+            # 압축 데이터는 float64로 푼 블록을 두 개까지만 들고 있어 최대 메모리도 압축 크기 + 블록 두 개
+            # b 블록은 a마다 다시 풀되, 큰 번호부터 돌아 마지막에 푼 블록을 다음 a로 그대로 씀
+            held = None  # (블록 번호, 푼 값)
+            for a in sorted({a for a, _ in todo}):
+                values_a = held[1] if held is not None and held[0] == a else self._block_values(a)
+                held = None
+                for b in sorted((b for pair_a, b in todo if pair_a == a), reverse=True):
+                    values_b = values_a if b == a else self._block_values(b)
+                    self._cross[(a, b)] = _cross_moments(values_a, values_b)
+                    held = (b, values_b)
+            return len(todo)
+        arrays = {}
+        for block in sorted({block for pair in todo for block in pair}):
+            arrays[block] = self._block_values(block)
+        for a, b in todo:
+            self._cross[(a, b)] = _cross_moments(arrays[a], arrays[b])
+        return len(todo)
+
+    def _moments(self, positions, blocks):
+        """선택한 문항의 쌍별 충분통계량 (n, sx, sxy)를 보관된 블록에서 모음"""
+        block_of = positions // self.block_size
+        offset = positions % self.block_size
+        k = len(positions)
+        n, sx, sxy = np.empty((k, k)), np.empty((k, k)), np.empty((k, k))
+        members = {block: np.flatnonzero(block_of == block) for block in blocks}
+        for a in blocks:
+            for b in blocks:
+                rows, cols = members[a], members[b]
+                if a <= b:
+                    idx = np.ix_(offset[rows], offset[cols])
+                    n_ab, sx_ab, _, sxy_ab = (m[idx] for m in self._cross[(a, b)])
+                else:
+                    # (b, a) 블록의 sy가 전치하면 a행 × b열의 sx
+                    idx = np.ix_(offset[cols], offset[rows])
+                    n_ba, _, sy_ba, sxy_ba = (m[idx] for m in self._cross[(b, a)])
+                    n_ab, sx_ab, sxy_ab = n_ba.T, sy_ba.T, sxy_ba.T
+                target = np.ix_(rows, cols)
+                n[target], sx[target], sxy[target] = n_ab, sx_ab, sxy_ab
+        return n, sx, sxy
+
+    def covariance(self, columns, reverse=(), missing=DEFAULT_MISSING):
+        """
+        선택한 문항의 (공분산 행렬, 유효 N 행렬) - reliability.item_covariance와 같은 형식
+        reverse: 역코딩할 문항명 (최솟값 + 최댓값 - 응답)
+        missing: 결측 처리 방식 (listwise, pairwise, mean)
+        """
+        check_missing_mode(missing)
+        positions = self._positions_of(columns)
+        blocks = sorted(set((positions // self.block_size).tolist()))
+        with span("covariance", rows=self.n_rows, columns=len(columns), missing=missing) as s:
+            # 여러 스레드가 함께 쓰는 경우(analysis_server) add_columns가 블록을 바꾸지 못하도록 모을 때까지 잠금
+            with self._lock:
+                s.set(new_blocks=self._ensure_blocks(blocks))
+                non_numeric = [col for col in columns if col in self._non_numeric]
+                raw = missing == "listwise" and self._has_missing[positions].any()
+                moments = None if non_numeric or raw else self._moments(positions, blocks)
+
+            if non_numeric:
+                raise ValueError(f"숫자가 아닌 값이 있는 문항: {', '.join(map(str, non_numeric))}")
+
+            if raw:
+                # 결측 없는 응답자 집합이 문항 조합마다 다르므로 원자료에서 계산
+                s.set(source="raw")
+                return item_covariance(self.values(columns, reverse), missing)
+
+            cov, n = covariance_from_moments(*moments, self.n_rows, "pairwise" if missing == "listwise" else missing)
+            # 역코딩(c - x)은 어느 결측 처리 방식에서도 해당 문항과의 공분산 부호만 바꿈
+            signs = np.array([-1.0 if col in reverse else 1.0 for col in columns])
+            return cov * np.outer(signs, signs), n
+
+    def values(self, columns, reverse=()):
+        """선택한 문항의 원자료 배열 (응답자 수 × 문항 수, 결측은 NaN, 역코딩 적용) - 신뢰구간 계산용"""
+        self._positions_of(columns)
+        if isinstance(self.data, CompactData):
+            values = self.data.values(columns)
+        else:
+            values = self.data[list(columns)].to_numpy(dtype=float, na_value=np.nan, copy=True)
+        for j, col in enumerate(columns):
+            if col in reverse:
+                values[:, j] = np.nanmin(values[:, j]) + np.nanmax(values[:, j]) - values[:, j]
+        return values
+
+    def frame(self, columns):
+        """원자료 중 columns 열의 DataFrame (데이터에 없는 열은 빠짐) - 집단 변수용"""
+        columns = [col for col in columns if col in self._positions]
+        if isinstance(self.data, CompactData):
+            return self.data.frame(columns)
+        return self.data[columns]
+
+    def reliability(self, columns, reverse=(), labels=None, missing=DEFAULT_MISSING):
+        """
+        전체 α와 문항 제거 시 α (부분 행렬 연산만 수행)
+        reverse: 역코딩할 문항명, labels: 결과에 쓸 문항 표시명 (기본값: 문항명)
+        missing: 결측 처리 방식 (listwise, pairwise, mean)
+        반환: (전체 α, {문항명: 제거 시 α}, (전체 α의 N, {문항명: 제거 시 N}))
+        """
+        columns = list(columns)
+        if len(columns) < 2:
+            raise ValueError("문항이 2개 이상 필요합니다.")
+        cov, n = self.covariance(columns, reverse, missing)
+        with span("alpha", columns=len(columns)):
+            alpha, removed_alpha = alpha_from_covariance(cov)
+            total_n, removed_n = effective_n(n)
+        labels = labels or columns
+        return (float(alpha), {label: float(value) for label, value in zip(labels, removed_alpha)},
+                (total_n, {label: int(value) for label, value in zip(labels, removed_n)}))
@@ -0,0 +1,248 @@
+"""
+결과 보고서 저장 (행 단위 스트리밍)
+
+결과 로그 항목을 한 행씩 저장용 행(report.result_row)으로 바꿔 바로 파일에 쓴다.
+표 전체를 DataFrame으로 만들지 않으므로 결과가 수천 개여도 메모리 사용량이 일정하다
+(열 이름만 먼저 한 번 훑어서 정한다).
+    xlsx     openpyxl write_only 모드 (쓴 행은 바로 임시 파일로 내보냄)
+    csv      csv 모듈 (UTF-8 BOM, 엑셀에서 바로 열림)
+    parquet  pyarrow (ROW_GROUP_SIZE 행마다 row group 하나)
+
+append=True이면 기존 보고서 뒤에 새 결과만 덧붙인다. CSV는 기존 머리글에 없는 열이 없으면
+파일 끝에 바로 쓰고, 있으면 머리글을 넓혀 다시 쓴다. xlsx와 Parquet은 파일 형식상 제자리 추가가
+안 되므로 기존 행을 읽는 대로 새 파일에 옮겨 쓰고(결과 로그에서 다시 만들지 않음) 새 행을 이어 쓴다.
+새 파일은 같은 폴더의 임시 파일에 쓴 뒤 교체하므로 저장 중 오류나 취소가 나도 기존 파일은 그대로다.
+"""
+import csv
+import os
+import tempfile
+from itertools import chain
+
+from instrumentation import span
+from report import is_count_column, result_row, table_columns
+
+EXPORT_FORMATS = ("xlsx", "csv", "parquet")
+ROW_GROUP_SIZE = 1000
+TEXT_COLUMNS = ("변수", "결측 처리", "축약", "제거 문항")
+_PROGRESS_EVERY = 100
+
+
+def export_format(path):
+    """확장자로 저장 형식 결정 (.csv, .parquet 외에는 xlsx)"""
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    return "xlsx"
+
+
+def export_results(results, path, append=False, progress=None):
+    """
+    결과 로그 항목들을 보고서 파일로 저장
+    append: 파일이 이미 있으면 뒤에 추가 (없으면 새로 만듦)
+    progress: progress(쓴 행 수, 전체 행 수) 콜백 (예외를 내면 저장을 멈추고 기존 파일 유지)
+    반환: 쓴 행 수
+    """
+    results = list(results)
+    columns = table_columns(result_row(result) for result in results)
+    rows = (result_row(result) for result in results)
+    return write_rows(path, columns, rows, len(results), append, progress)
+
+
+def write_rows(path, columns, rows, total=None, append=False, progress=None):
+    """
+    행({열 이름: 값})들을 확장자에 맞는 형식으로 저장 - 값이 없는 열은 빈 칸
+    total: 전체 행 수 (진행 상황 표시용)
+    반환: 쓴 행 수
+    """
+    fmt = export_format(path)
+    counter = _Counter(rows, total, progress)
+    append = append and os.path.exists(path) and os.path.getsize(path) > 0
+    with span("export." + fmt, rows=total, columns=len(columns), append=append):
+        if append and fmt == "csv":
+            header = _csv_header(path)
+            if set(columns) <= set(header):
+                # 새 열이 없으면 파일 끝에 바로 추가 (중간에 멈추면 추가한 부분을 잘라 냄)
+                with open(path, "a", newline="", encoding="utf-8") as f:
+                    start = f.tell()
+                    try:
+                        _write_csv_rows(f, header, counter)
+                    except BaseException:
+                        f.truncate(start)
+                        raise
+                return counter.count
+        if append:
+            columns, rows = _merge_existing(fmt, path, columns, counter)
+        else:
+            rows = counter
+        _replace(path, lambda tmp_path: _WRITERS[fmt](tmp_path, columns, rows))
+    return counter.count
+
+
+class _Counter:
+    """행을 넘겨주며 쓴 행 수를 세고 진행 상황 보고"""
+
+    def __init__(self, rows, total, progress):
+        self.rows = rows
+        self.total = total or 0
+        self.progress = progress
+        self.count = 0
+
+    def __iter__(self):
+        for row in self.rows:
+            yield row
+            self.count += 1
+            if self.progress is not None and (self.count % _PROGRESS_EVERY == 0 or self.count == self.total):
+                self.progress(self.count, self.total)
+
+
+def _replace(path, write):
+    """같은 폴더의 임시 파일에 쓴 뒤 원래 파일과 교체"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=os.path.splitext(str(path))[1] or ".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _merge_existing(fmt, path, columns, new_rows):
+    """기존 파일의 행 + 새 행 → (넓힌 열 목록, 행 iterator) - 기존 행은 읽는 대로 넘겨줌"""
+    header, old_rows = _READERS[fmt](path)
+    merged = list(header) + [col for col in columns if col not in header]
+    return merged, chain(old_rows, new_rows)
+
+
+# ---------------------------------------------------------------- CSV
+
+def _write_csv(path, columns, rows):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        _write_csv_rows(f, columns, rows)
+
+
+def _write_csv_rows(f, columns, rows):
+    writer = csv.DictWriter(f, fieldnames=columns, restval="", extrasaction="ignore")
+    for row in rows:
+        writer.writerow(row)
+
+
+def _csv_header(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return next(csv.reader(f), [])
+
+
+def _read_csv(path):
+    f = open(path, newline="", encoding="utf-8-sig")
+    reader = csv.DictReader(f)
+    header = list(reader.fieldnames or [])
+
+    def rows():
+        with f:
+            yield from reader
+
+    return header, rows()
+
+
+# ---------------------------------------------------------------- xlsx
+
+def _write_xlsx(path, columns, rows, sheet_title="Sheet1"):
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title)
+    bold = Font(bold=True)
+    header = []
+    for col in columns:
+        cell = WriteOnlyCell(sheet, value=col)
+        cell.font = bold
+        header.append(cell)
+    sheet.append(header)
+    try:
+        for row in rows:
+            sheet.append([row.get(col) for col in columns])
+    except BaseException:
+        sheet.close()  # 쓰다 만 시트의 임시 파일 정리
+        raise
+    workbook.save(path)
+
+
+def _read_xlsx(path):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True)
+    if len(workbook.worksheets) > 1:
+        workbook.close()
+        raise ValueError(f"시트가 여러 개인 파일에는 결과를 추가할 수 없습니다: {path}")
+    values = workbook.worksheets[0].iter_rows(values_only=True)
+    header = list(next(values, ()))
+    while header and header[-1] is None:
+        header.pop()
+
+    def rows():
+        try:
+            for row in values:
+                yield {col: value for col, value in zip(header, row) if value is not None}
+        finally:
+            workbook.close()
+
+    return header, rows()
+
+
+# ---------------------------------------------------------------- Parquet
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet로 저장하려면 pyarrow가 필요합니다 (pip install pyarrow)") from e
+    return pa, pq
+
+
+def _arrow_type(pa, col):
+    if col == "문항 수" or is_count_column(col):
+        return pa.int64()
+    if col in TEXT_COLUMNS or col.endswith(" CI"):
+        return pa.string()  # 문항 제거 시 신뢰구간은 '[0.764, 0.788]' 문자열
+    return pa.float64()
+
+
+def _write_parquet(path, columns, rows):
+    pa, pq = _pyarrow()
+    schema = pa.schema([(col, _arrow_type(pa, col)) for col in columns])
+    with pq.ParquetWriter(path, schema) as writer:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == ROW_GROUP_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+
+
+def _read_parquet(path):
+    _, pq = _pyarrow()
+    parquet_file = pq.ParquetFile(path)
+
+    def rows():
+        try:
+            for batch in parquet_file.iter_batches(batch_size=ROW_GROUP_SIZE):
+                for row in batch.to_pylist():
+                    yield {col: value for col, value in row.items() if value is not None}
+        finally:
+            parquet_file.close()  # 교체 전에 파일을 닫아야 함 (Windows)
+
+    return parquet_file.schema_arrow.names, rows()
+
+
+_WRITERS = {"csv": _write_csv, "xlsx": _write_xlsx, "parquet": _write_parquet}
+_READERS = {"csv": _read_csv, "xlsx": _read_xlsx, "parquet": _read_parquet}
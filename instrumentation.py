@@ -0,0 +1,257 @@
+"""
+단계별 시간/메모리 기록 (성능 진단용)
+
+파일 읽기, 공분산 계산, α 계산, 결과 로그 표시, 저장 등 각 단계를 span으로 감싸
+걸린 시간, 처리한 행/열 수, (켜 둔 경우) 최대 메모리 할당량을 기록한다.
+기록은 크기가 정해진 링 버퍼에 쌓이므로 계속 켜 두어도 메모리가 늘지 않고,
+시간 측정은 단계마다 perf_counter 두 번이라 계산 비용에 비해 무시할 만하다.
+메모리 측정(tracemalloc)은 모든 할당을 추적해 계산이 느려지므로 필요할 때만 켠다.
+최대 메모리는 그 단계가 실행되는 동안 프로세스 전체의 최대 할당량 - 시작 시 할당량이다.
+tracemalloc의 최대값은 프로세스에 하나뿐이므로 한 번에 한 스레드의 단계만 메모리를 잰다
+(분석 서버처럼 여러 스레드가 동시에 계산하면 먼저 시작한 스레드가 끝날 때까지 다른 스레드의 단계는
+peak_bytes가 None이고, 재는 단계의 최대값에는 같은 시간에 다른 스레드가 할당한 메모리도 들어간다).
+
+기록은 JSON Lines(한 줄에 단계 하나) 또는 Chrome trace 형식(chrome://tracing, Perfetto)으로 저장할 수 있다.
+
+사용 예:
+    with span("covariance", rows=n_rows, columns=k, missing=missing) as s:
+        ...
+        s.set(new_blocks=3)  # 단계 안에서 알게 된 정보 추가
+
+환경 변수
+    RELIABILITY_TRACE         0이면 기록하지 않음 (기본값: 기록)
+    RELIABILITY_TRACE_MEMORY  1이면 단계별 최대 메모리도 기록
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+DEFAULT_CAPACITY = 10_000  # 보관할 최근 단계 수
+
+
+def _env_flag(name, default):
+    value = os.environ.get(name, "").strip().lower()
+    if not value:
+        return default
+    return value not in ("0", "false", "no", "off")
+
+
+class _NullSpan:
+    """기록을 끈 경우의 span (아무것도 하지 않음)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, rows=None, columns=None, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """
+    단계 하나의 기록 (with 문으로 사용)
+    rows, columns: 처리한 행/열 수, args: 그 밖의 정보 (결측 처리 방식, 캐시 적중 여부 등)
+    """
+
+    def __init__(self, tracer, name, rows=None, columns=None, args=None):
+        self.tracer = tracer
+        self.name = name
+        self.rows = rows
+        self.columns = columns
+        self.args = args or {}
+        self._start = None
+        self._memory_start = None
+        self._peak = 0
+        self._depth = 0
+
+    def set(self, rows=None, columns=None, **args):
+        """단계 안에서 알게 된 행/열 수나 정보 추가"""
+        if rows is not None:
+            self.rows = rows
+        if columns is not None:
+            self.columns = columns
+        self.args.update(args)
+
+    def __enter__(self):
+        stack = self.tracer._stack()
+        if self.tracer.track_memory and tracemalloc.is_tracing() and self.tracer._claim_memory():
+            current, peak = tracemalloc.get_traced_memory()
+            # 바깥 단계의 최대값을 넘겨준 뒤 이 단계 기준으로 다시 잼
+            if stack and stack[-1]._memory_start is not None:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+            self._memory_start = self._peak = current
+        self._depth = len(stack)
+        stack.append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        stack = self.tracer._stack()
+        stack.pop()
+        peak_bytes = None
+        if self._memory_start is not None:
+            if tracemalloc.is_tracing():
+                peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+                peak_bytes = peak - self._memory_start
+                if stack and stack[-1]._memory_start is not None:
+                    stack[-1]._peak = max(stack[-1]._peak, peak)
+            self.tracer._release_memory()
+        self.tracer._record(self, end, peak_bytes, exc_type)
+        return False
+
+
+class Tracer:
+    """
+    단계 기록 보관소 (여러 스레드에서 동시에 써도 안전)
+    capacity: 보관할 최근 단계 수, enabled: 기록 여부, track_memory: 최대 메모리 측정 여부
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, enabled=True, track_memory=False):
+        self.enabled = enabled
+        self.track_memory = False
+        self._events = deque(maxlen=capacity)
+        self._count = 0  # 지금까지 기록한 단계 수 (버퍼에서 밀려난 것 포함)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._started_tracemalloc = False
+        self._memory_owner = None  # 메모리를 재고 있는 스레드 (tracemalloc.reset_peak는 프로세스 전체에 적용)
+        self._memory_depth = 0
+        self.set_track_memory(track_memory)
+
+    def span(self, name, rows=None, columns=None, **args):
+        """단계 기록용 context manager"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, rows, columns, args)
+
+    def set_track_memory(self, enabled):
+        """최대 메모리 측정 켜기/끄기 (이 기록기가 켠 tracemalloc만 끔)"""
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif not enabled and self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.track_memory = bool(enabled)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _claim_memory(self):
+        """현재 스레드가 메모리를 재도 되면 True (다른 스레드의 단계가 재는 중이면 False)"""
+        ident = threading.get_ident()
+        with self._lock:
+            if self._memory_owner not in (None, ident):
+                return False
+            self._memory_owner = ident
+            self._memory_depth += 1
+            return True
+
+    def _release_memory(self):
+        with self._lock:
+            self._memory_depth -= 1
+            if not self._memory_depth:
+                self._memory_owner = None
+
+    def _record(self, span, end, peak_bytes, exc_type):
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "start": span._start - self._origin,
+            "duration": end - span._start,
+            "depth": span._depth,
+            "thread": thread.name,
+            "thread_id": thread.ident,
+            "rows": span.rows,
+            "columns": span.columns,
+            "peak_bytes": peak_bytes,
+            "args": span.args,
+        }
+        if exc_type is not None:
+            event["error"] = exc_type.__name__
+        with self._lock:
+            self._events.append(event)
+            self._count += 1
+
+    def events(self):
+        """보관 중인 단계 기록 리스트 (시작 순서가 아니라 끝난 순서)"""
+        with self._lock:
+            return list(self._events)
+
+    def events_since(self, count):
+        """
+        count번째 이후에 기록된 단계 (화면 갱신용)
+        반환: (새 기록 리스트, 지금까지의 기록 수) - 다음 호출에 기록 수를 넘긴다
+        """
+        with self._lock:
+            new = min(self._count - count, len(self._events))
+            events = list(self._events)[len(self._events) - new:] if new > 0 else []
+            return events, self._count
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+
+    def summary(self):
+        """단계 이름별 (횟수, 총 시간, 최대 시간) - 총 시간이 긴 순서"""
+        totals = {}
+        for event in self.events():
+            count, total, longest = totals.get(event["name"], (0, 0.0, 0.0))
+            totals[event["name"]] = (count + 1, total + event["duration"], max(longest, event["duration"]))
+        return sorted(((name, *values) for name, values in totals.items()), key=lambda row: -row[2])
+
+    def write_jsonl(self, path):
+        """JSON Lines로 저장 (한 줄에 단계 하나, 시간은 초, 메모리는 바이트)"""
+        with open(path, "w", encoding="utf-8") as f:
+            for event in self.events():
+                f.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+
+    def write_chrome_trace(self, path):
+        """Chrome trace 형식으로 저장 (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)"""
+        pid = os.getpid()
+        trace_events, threads = [], {}
+        for event in self.events():
+            threads.setdefault(event["thread_id"], event["thread"])
+            args = dict(event["args"])
+            for key in ("rows", "columns", "error"):
+                if event.get(key) is not None:
+                    args[key] = event[key]
+            if event["peak_bytes"] is not None:
+                args["peak_mb"] = round(event["peak_bytes"] / 2 ** 20, 3)
+            trace_events.append({"name": event["name"], "ph": "X", "pid": pid, "tid": event["thread_id"],
+                                 "ts": event["start"] * 1e6, "dur": event["duration"] * 1e6, "args": args})
+        for tid, name in threads.items():
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+
+    def write(self, path):
+        """확장자에 따라 저장 (.json은 Chrome trace, 그 밖에는 JSON Lines)"""
+        if str(path).lower().endswith(".json"):
+            self.write_chrome_trace(path)
+        else:
+            self.write_jsonl(path)
+
+
+# 프로그램 전체에서 쓰는 기록기
+tracer = Tracer(enabled=_env_flag("RELIABILITY_TRACE", True),
+                track_memory=_env_flag("RELIABILITY_TRACE_MEMORY", False))
+
+
+def span(name, rows=None, columns=None, **args):
+    """전역 기록기의 단계 기록 (tracer.span)"""
+    return tracer.span(name, rows, columns, **args)
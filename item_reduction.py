@@ -0,0 +1,178 @@
+"""
+척도 단축용 문항 축약 탐색
+
+문항 풀의 공분산 행렬 하나만으로 목표 문항 수에서 α가 가장 큰 문항 조합을 찾는다.
+문항 집합 S의 α는 (문항 수, 문항 분산 합 V, 공분산 합 T)만 있으면 되고,
+문항 j를 빼면 V - c_jj, T - 2·r_j + c_jj (r_j: S 안에서 j행의 합)로 바뀌므로
+후보 하나의 평가는 O(1), 제거를 확정한 뒤 r 갱신은 O(k)이다 (rank-one downdate).
+
+방법
+    greedy      매 단계 α가 가장 커지는 문항을 하나씩 제거 (후진 제거)
+    beam        매 단계 상위 beam_width개 조합을 유지하며 제거
+    exhaustive  목표 문항 수의 모든 조합 평가 (조합 수가 MAX_COMBINATIONS 이하일 때만)
+"""
+from itertools import combinations, islice
+from math import comb
+from typing import NamedTuple
+
+import numpy as np
+
+from instrumentation import span
+from reliability import DEFAULT_MISSING, alpha_from_covariance, effective_n
+
+REDUCTION_METHODS = ("greedy", "beam", "exhaustive")
+DEFAULT_BEAM_WIDTH = 10
+MAX_COMBINATIONS = 2_000_000
+_BATCH_CELLS = 4_000_000  # 전수 탐색에서 한 번에 만드는 부분 행렬 원소 수
+
+
+class Reduction(NamedTuple):
+    """
+    축약 결과 (문항은 공분산 행렬의 위치)
+    kept: 남은 문항, alpha: 남은 문항의 α, removed: 제거된 문항
+    path: 제거 순서 [(제거 문항, 제거 후 문항 수, 제거 후 α), ...] (전수 탐색은 빈 리스트)
+    """
+    kept: list
+    alpha: float
+    removed: list
+    path: list
+
+
+def _alpha(n_items, variance_sum, total):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (n_items / (n_items - 1)) * (1 - variance_sum / total)
+
+
+def _rank(alphas):
+    """NaN은 가장 나쁜 후보로 정렬"""
+    return np.where(np.isnan(alphas), -np.inf, alphas)
+
+
+def beam_search(cov, target, beam_width=DEFAULT_BEAM_WIDTH, progress=None):
+    """
+    후진 제거 빔 탐색 (beam_width=1이면 greedy)
+    cov: 문항 풀의 공분산 행렬 (k×k), target: 남길 문항 수
+    progress: progress(완료 단계 수, 전체 단계 수) 콜백
+    """
+    cov = np.asarray(cov, dtype=float)
+    k = cov.shape[0]
+    diag = np.diag(cov)
+    # 상태: (남은 문항 마스크, V, T, 남은 문항 안의 행 합, 제거 경로)
+    beams = [(np.ones(k, dtype=bool), diag.sum(), cov.sum(), cov.sum(axis=1), [])]
+
+    steps = k - target
+    for step in range(steps):
+        n_items = k - step
+        candidates = []
+        for b, (mask, v, t, rows, _) in enumerate(beams):
+            items = np.flatnonzero(mask)
+            alphas = _alpha(n_items - 1, v - diag[items], t - 2 * rows[items] + diag[items])
+            candidates.extend(zip(_rank(alphas), alphas, [b] * len(items), items))
+        candidates.sort(key=lambda c: -c[0])
+
+        next_beams, seen = [], set()
+        for _, alpha, b, j in candidates:
+            mask, v, t, rows, path = beams[b]
+            new_mask = mask.copy()
+            new_mask[j] = False
+            key = new_mask.tobytes()
+            if key in seen:
+                continue
+            seen.add(key)
+            next_beams.append((new_mask, v - diag[j], t - 2 * rows[j] + diag[j], rows - cov[:, j],
+                               path + [(int(j), n_items - 1, float(alpha))]))
+            if len(next_beams) == beam_width:
+                break
+        beams = next_beams
+        if progress is not None:
+            progress(step + 1, steps)
+
+    mask, v, t, _, path = beams[0]
+    return Reduction(np.flatnonzero(mask).tolist(), float(_alpha(target, v, t)), [j for j, _, _ in path], path)
+
+
+def exhaustive_search(cov, target, progress=None):
+    """목표 문항 수의 모든 조합 중 α 최대 조합"""
+    cov = np.asarray(cov, dtype=float)
+    k = cov.shape[0]
+    total = comb(k, target)
+    if total > MAX_COMBINATIONS:
+        raise ValueError(f"조합 수가 너무 많습니다 ({total:,}개). greedy 또는 beam 방법을 사용하세요.")
+
+    diag = np.diag(cov)
+    batch = max(1, _BATCH_CELLS // (target * target))
+    all_combos = combinations(range(k), target)
+    best_alpha, best = -np.inf, None
+    done = 0
+    while True:
+        flat = np.fromiter((i for combo in islice(all_combos, batch) for i in combo), dtype=int)
+        if not len(flat):
+            break
+        subsets = flat.reshape(-1, target)
+        alphas = _alpha(target, diag[subsets].sum(axis=1),
+                        cov[subsets[:, :, None], subsets[:, None, :]].sum(axis=(1, 2)))
+        ranked = _rank(alphas)
+        i = int(np.argmax(ranked))
+        if best is None or ranked[i] > best_alpha:
+            best_alpha, best = ranked[i], (subsets[i].tolist(), float(alphas[i]))
+        done += len(subsets)
+        if progress is not None:
+            progress(done, total)
+
+    kept, alpha = best
+    return Reduction(kept, alpha, sorted(set(range(k)) - set(kept)), [])
+
+
+def reduce_items(cov, target, method="greedy", beam_width=DEFAULT_BEAM_WIDTH, progress=None):
+    """
+    목표 문항 수(target)에서 α가 최대인 문항 조합 탐색
+    method: greedy, beam, exhaustive
+    반환: Reduction
+    """
+    k = np.asarray(cov).shape[0]
+    if not 2 <= target < k:
+        raise ValueError(f"남길 문항 수는 2 이상 {k - 1} 이하여야 합니다.")
+    with span("reduction." + method, columns=k, target=target):
+        if method == "greedy":
+            return beam_search(cov, target, 1, progress)
+        if method == "beam":
+            return beam_search(cov, target, beam_width, progress)
+        if method == "exhaustive":
+            return exhaustive_search(cov, target, progress)
+    raise ValueError(f"알 수 없는 축약 방법: {method} ({', '.join(REDUCTION_METHODS)} 중 선택)")
+
+
+def reduce_selection(stats, selection, target, method="greedy", beam_width=DEFAULT_BEAM_WIDTH,
+                     missing=DEFAULT_MISSING, progress=None):
+    """
+    불러온 데이터(DatasetStats)에서 문항 선택(column_index.Selection) 축약
+    listwise는 조합마다 응답자가 달라지지 않도록 문항 풀 전체에서 결측 없는 응답자를 기준으로 비교하고,
+    보고하는 α와 N은 남은 문항만으로 다시 계산한다 (같은 문항을 분석 실행한 결과와 같음)
+    반환: (남은 문항명, 전체 α, {표시명: 제거 시 α}, (N, {표시명: 제거 시 N}), 축약 정보)
+        축약 정보: {"방법", "원래 문항 수", "제거 문항": [표시명], "경로": [(표시명, 문항 수, α)]}
+                   listwise는 "경로 N"(경로의 α를 계산한 응답자 수)도 포함
+    """
+    cov, n = stats.covariance(selection.columns, selection.reversed, missing)
+    reduction = reduce_items(cov, target, method, beam_width, progress)
+    labels = selection.labels()
+
+    kept = reduction.kept
+    kept_columns = [selection.columns[i] for i in kept]
+    if missing == "listwise":
+        kept_cov, kept_n = stats.covariance(kept_columns, selection.reversed, missing)
+    else:
+        kept_cov, kept_n = cov[np.ix_(kept, kept)], n[np.ix_(kept, kept)]
+    alpha, removed_alpha = alpha_from_covariance(kept_cov)
+    total_n, removed_n = effective_n(kept_n)
+    kept_labels = [labels[i] for i in kept]
+    info = {
+        "방법": method,
+        "원래 문항 수": len(labels),
+        "제거 문항": [labels[j] for j in reduction.removed],
+        "경로": [(labels[j], n_items, alpha_after) for j, n_items, alpha_after in reduction.path],
+    }
+    if missing == "listwise":
+        info["경로 N"] = int(n.min())
+    return (kept_columns, float(alpha),
+            {label: float(value) for label, value in zip(kept_labels, removed_alpha)},
+            (total_n, {label: int(value) for label, value in zip(kept_labels, removed_n)}), info)
@@ -0,0 +1,170 @@
+"""
+필요한 열만 읽는 데이터 파일 (문항이 많은 설문 파일용)
+
+1단계: 시트 이름과 머리글(문항명)만 읽어 문항 리스트를 바로 채운다 (엑셀도 수십 ms).
+2단계: 분석할 문항 열만 필요할 때 읽어 작은 dtype으로 보관하고, 다음 분석에서는 아직 읽지 않은 열만 더 읽는다.
+    CSV      usecols로 해당 열만 파싱
+    엑셀     행 단위 XML이라 열만 골라 파싱할 수 없으므로, 시트를 한 번 파싱해 열 기반 캐시(workbook_cache)에
+             저장한 뒤 캐시에서 필요한 열만 읽는다. 캐시를 끈 경우에는 처음 읽을 때 시트 전체를 보관한다.
+리커트 응답처럼 작은 정수 열은 int8(결측이 있으면 float32)로 보관한다. 값은 바뀌지 않으므로
+계산 결과는 float64로 보관할 때와 같다. 압축 모드(compact)에서는 uint8 코드 + 결측 비트 마스크로
+보관한다 (compact_data).
+여러 스레드가 함께 쓰는 경우(analysis_server) 읽기를 기다리는 동안 다른 스레드가 요청한 열은
+다음에 읽는 스레드가 함께 읽으므로, 동시에 들어온 분석들이 파일을 한 번만 더 읽는다.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from compact_data import CompactData, compact_enabled
+from dataset_stats import DatasetStats
+from instrumentation import span
+from workbook_cache import cache_enabled, file_fingerprint, is_csv, read_workbook
+
+_FLOAT32_EXACT = 2 ** 24  # 이 범위의 정수는 float32로 정확히 표현됨
+
+
+def sheet_names(file_path):
+    """엑셀 파일의 시트 이름 리스트 (CSV는 빈 리스트)"""
+    if is_csv(file_path):
+        return []
+    with pd.ExcelFile(file_path) as workbook:
+        return list(workbook.sheet_names)
+
+
+def read_header(file_path, sheet=None):
+    """머리글(문항명)만 읽기 - sheet: 엑셀 시트 이름 (None이면 첫 시트)"""
+    with span("load.header", file=str(file_path)) as s:
+        if is_csv(file_path):
+            columns = pd.read_csv(file_path, nrows=0).columns
+        else:
+            columns = pd.read_excel(file_path, sheet_name=0 if sheet is None else sheet, nrows=0).columns
+        s.set(columns=len(columns))
+    return list(columns)
+
+
+def compact_dtypes(data):
+    """
+    정수 값만 있는 숫자 열을 작은 dtype으로 변환 (값은 그대로)
+    -128~127: 결측이 없으면 int8, 있으면 float32 / 그 밖의 정수(|값| < 2^24): float32
+    소수가 있는 열과 숫자가 아닌 열은 그대로 둔다.
+    """
+    data = data.copy(deep=False)
+    for i in range(data.shape[1]):
+        column = data.iloc[:, i]
+        if not pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+            continue
+        values = column.to_numpy(dtype=float, na_value=np.nan)
+        observed = values[~np.isnan(values)]
+        if observed.size and not np.array_equal(observed, np.round(observed)):
+            continue
+        low, high = (observed.min(), observed.max()) if observed.size else (0, 0)
+        if -128 <= low and high <= 127 and observed.size == values.size:
+            data.isetitem(i, values.astype(np.int8))
+        elif -_FLOAT32_EXACT < low and high < _FLOAT32_EXACT:
+            data.isetitem(i, values.astype(np.float32))
+    return data
+
+
+class LazyWorkbook:
+    """
+    file_path: 데이터 파일 (.xlsx, .xls, .csv), sheet: 엑셀 시트 이름 (None이면 첫 시트)
+    fingerprint: 이미 계산한 file_fingerprint, use_cache: workbook_cache.read_workbook과 같음
+    compact: 압축 모드 (None이면 RELIABILITY_COMPACT 환경 변수를 따름)
+    만들 때는 머리글만 읽는다. columns는 파일의 전체 문항명, data는 지금까지 읽은 열 (읽은 순서).
+    """
+
+    def __init__(self, file_path, sheet=None, fingerprint=None, use_cache=None, compact=None):
+        self.file_path = file_path
+        self.sheet_names = sheet_names(file_path)
+        if self.sheet_names and sheet == self.sheet_names[0]:
+            sheet = None  # 첫 시트는 이름을 주든 안 주든 같은 캐시 사용
+        self.sheet = sheet
+        self.columns = read_header(file_path, sheet)
+        self.use_cache = cache_enabled() if use_cache is None else use_cache
+        self.compact = compact_enabled() if compact is None else compact
+        self._fingerprint = fingerprint
+        self._fingerprint_lock = threading.Lock()
+        self.data = None
+        self._stats = None
+        self._lock = threading.Lock()
+        self._wanted = []  # 읽기를 기다리는 스레드들이 요청한 열
+        self._wanted_lock = threading.Lock()
+
+    @property
+    def fingerprint(self):
+        """파일 내용 해시 (처음 필요할 때 계산, 여러 스레드가 함께 요청해도 한 번만 계산)"""
+        with self._fingerprint_lock:
+            if self._fingerprint is None:
+                self._fingerprint = file_fingerprint(self.file_path)
+            return self._fingerprint
+
+    @property
+    def fingerprint_ready(self):
+        """fingerprint를 이미 계산했는지 (기다리지 않고 확인)"""
+        return self._fingerprint is not None
+
+    @property
+    def loaded_columns(self):
+        return [] if self.data is None else list(self.data.columns)
+
+    def load(self, columns):
+        """아직 읽지 않은 열 읽기 → 새로 읽은 열 수"""
+        self._want(columns)
+        with self._lock:
+            return self._load(self._take_wanted(columns))
+
+    def _want(self, columns):
+        with self._wanted_lock:
+            self._wanted.extend(columns)
+
+    def _take_wanted(self, columns):
+        """columns + 다른 스레드가 기다리며 요청한 열 (없는 문항은 요청한 스레드에서만 오류)"""
+        known = set(self.columns)
+        with self._wanted_lock:
+            wanted, self._wanted = self._wanted, []
+        return list(columns) + [col for col in wanted if col in known]
+
+    def _load(self, columns):
+        known, loaded = set(self.columns), set(self.loaded_columns)
+        new = []
+        for col in columns:
+            if col not in known:
+                raise ValueError(f"데이터에 없는 문항: {col}")
+            if col not in loaded and col not in new:
+                new.append(col)
+        if not new:
+            return 0
+
+        with span("load.columns", columns=len(new), loaded=len(loaded)) as s:
+            if self.use_cache or is_csv(self.file_path):
+                fingerprint = self.fingerprint if self.use_cache else None
+                frame = read_workbook(self.file_path, self.use_cache, fingerprint, self.sheet, new)
+            else:
+                # 캐시 없이 엑셀을 열만 골라 읽을 수는 없으므로 한 번 파싱한 시트 전체를 보관
+                frame = read_workbook(self.file_path, False, sheet=self.sheet)
+                new = [col for col in frame.columns if col not in loaded]
+                frame = frame[new]
+            if self.compact:
+                frame = CompactData.from_frame(frame)
+                self.data = frame if self.data is None else self.data.concat(frame)
+                nbytes = frame.nbytes
+            else:
+                frame = compact_dtypes(frame)
+                self.data = frame if self.data is None else pd.concat([self.data, frame], axis=1)
+                nbytes = int(frame.memory_usage(index=False).sum())
+            s.set(rows=len(frame), bytes=nbytes, compact=self.compact)
+        return len(new)
+
+    def stats(self, columns):
+        """columns를 읽은 뒤 읽은 열 전체의 DatasetStats (열이 늘어도 계산해 둔 통계량은 유지)"""
+        self._want(columns)
+        with self._lock:
+            self._load(self._take_wanted(columns))
+            # load()로만 읽은 열도 있을 수 있으므로 읽은 열 수로 통계량이 최신인지 확인
+            if self._stats is None:
+                self._stats = DatasetStats(self.data)
+            elif len(self._stats.data.columns) != len(self.data.columns):
+                self._stats.add_columns(self.data)
+            return self._stats
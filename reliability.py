@@ -0,0 +1,144 @@
+"""
+크론바흐 알파 계산
+
+결측 처리 (missing)
+    listwise  선택한 문항 중 하나라도 결측인 응답자 제외 (모든 추정치가 같은 응답자 사용)
+    pairwise  문항 쌍마다 두 문항 모두 응답한 응답자로 공분산 계산
+    mean      결측을 해당 문항의 평균으로 대체
+
+세 방식 모두 문항 분산과 합계 분산을 같은 공분산 행렬에서 얻는다.
+문항 쌍별 충분통계량(응답자 수, 합, 교차곱 합)은 행렬 곱으로 한 번에 만들고,
+문항 제거 시 α는 같은 행렬의 부분 합으로 계산하므로 응답 자료를 다시 읽지 않는다.
+"""
+import numpy as np
+
+MISSING_MODES = ("listwise", "pairwise", "mean")
+DEFAULT_MISSING = "listwise"
+
+
+def check_missing_mode(missing):
+    if missing not in MISSING_MODES:
+        raise ValueError(f"알 수 없는 결측 처리 방식: {missing} ({', '.join(MISSING_MODES)} 중 선택)")
+
+
+def pairwise_moments(values, shift=None):
+    """
+    문항 쌍별 충분통계량 (결측 마스크 행렬 곱 세 번)
+    values: (응답자 수, 문항 수) 배열, 결측은 NaN
+    shift: 수치 안정성을 위해 미리 빼는 문항별 기준값 (기본값: 문항 평균)
+    반환: (n, sx, sxy) 각 k×k
+        n[i, j]: 문항 i, j 모두 응답한 응답자 수
+        sx[i, j]: 그 응답자들의 문항 i 합, sxy[i, j]: 문항 i × 문항 j 합
+    """
+    values = np.asarray(values, dtype=float)
+    observed = ~np.isnan(values)
+    if shift is None:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shift = np.where(observed.any(axis=0), np.nansum(values, axis=0) / observed.sum(axis=0), 0.0)
+    centered = np.where(observed, values - shift, 0.0)
+    mask = observed.astype(float)
+    return mask.T @ mask, centered.T @ mask, centered.T @ centered
+
+
+def covariance_from_moments(n, sx, sxy, n_rows, missing=DEFAULT_MISSING):
+    """
+    쌍별 충분통계량 → (공분산 행렬, 유효 N 행렬)
+    n_rows: 전체 응답자 수 (listwise는 결측 없는 응답자만 모은 통계량이어야 함)
+    앞쪽 차원을 반복으로 쓰는 배열(..., k, k)도 그대로 계산
+    """
+    check_missing_mode(missing)
+    sx_t = np.swapaxes(sx, -1, -2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if missing == "mean":
+            # 평균으로 대체한 값은 편차가 0이므로 두 문항 모두 응답한 응답자만 교차곱에 기여
+            means = np.diagonal(sx, axis1=-2, axis2=-1) / np.diagonal(n, axis1=-2, axis2=-1)
+            row_means, col_means = means[..., :, None], means[..., None, :]
+            comoment = sxy - col_means * sx - row_means * sx_t + row_means * col_means * n
+            n_rows = np.asarray(n_rows, dtype=float)[..., None, None]
+            return comoment / (n_rows - 1), np.broadcast_to(n_rows, n.shape)
+        if missing == "listwise" and np.any(n != np.asarray(n_rows)[..., None, None]):
+            raise ValueError("listwise 통계량에 결측이 있는 응답자가 포함되어 있습니다.")
+        return (sxy - sx * sx_t / n) / (n - 1), n
+
+
+def item_covariance(values, missing=DEFAULT_MISSING):
+    """
+    선택한 문항의 공분산 행렬과 유효 N 행렬
+    values: (응답자 수, 문항 수) 배열, 결측은 NaN
+    """
+    check_missing_mode(missing)
+    values = np.asarray(values, dtype=float)
+    if missing == "listwise":
+        values = values[~np.isnan(values).any(axis=1)]
+    return covariance_from_moments(*pairwise_moments(values), values.shape[0], missing)
+
+
+def _alpha(n_items, item_variance_sum, total_variance):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (n_items / (n_items - 1)) * (1 - item_variance_sum / total_variance)
+
+
+def alpha_from_covariance(cov):
+    """
+    공분산 행렬 하나로 전체 α와 각 문항 제거 시 α를 O(k²)에 계산
+    (문항 분산은 대각 원소, 앞쪽 차원을 반복으로 쓰는 배열도 가능)
+    반환: (전체 α, 문항 제거 시 α 배열)
+    """
+    n_items = cov.shape[-1]
+    item_variances = np.diagonal(cov, axis1=-2, axis2=-1)
+    item_variance_sum = item_variances.sum(axis=-1)
+    total_variance = cov.sum(axis=(-2, -1))
+    alpha = _alpha(n_items, item_variance_sum, total_variance)
+
+    # Var(합계 - x_j) = Var(합계) - 2 Cov(합계, x_j) + Var(x_j)
+    removed_total = total_variance[..., None] - 2 * cov.sum(axis=-1) + item_variances
+    if n_items > 2:
+        removed_alpha = _alpha(n_items - 1, item_variance_sum[..., None] - item_variances, removed_total)
+    else:
+        removed_alpha = np.full(item_variances.shape, np.nan)
+    return alpha, removed_alpha
+
+
+def effective_n(n):
+    """
+    추정치별 유효 N (사용한 문항 쌍 중 가장 작은 응답자 수)
+    n: 유효 N 행렬 (k×k)
+    반환: (전체 α의 N, 문항 제거 시 α의 N 배열)
+    """
+    n = np.asarray(n, dtype=float)
+    k = n.shape[0]
+    if k < 2:
+        return int(n.min()), np.zeros(k, dtype=int)
+    # 행마다 가장 작은 값과 두 번째로 작은 값을 구해 두면 문항 j를 뺀 최솟값을 O(k²)에 계산
+    order = np.argsort(n, axis=1)
+    first = n[np.arange(k), order[:, 0]]
+    second = n[np.arange(k), order[:, 1]]
+    row_min = np.where(order[:, 0][None, :] == np.arange(k)[:, None], second[None, :], first[None, :])
+    np.fill_diagonal(row_min, np.inf)
+    return int(n.min()), row_min.min(axis=1).astype(int)
+
+
+def reliability_analysis(data, missing=DEFAULT_MISSING):
+    """
+    전체 α와 문항 제거 시 α 계산
+    data: pandas DataFrame (선택된 문항들)
+    반환: (전체 α, {문항명: 제거 시 α}, (전체 α의 N, {문항명: 제거 시 N}))
+    """
+    if data.shape[1] < 2:
+        raise ValueError("문항이 2개 이상 필요합니다.")
+    cov, n = item_covariance(data.to_numpy(dtype=float, na_value=np.nan), missing)
+    alpha, removed_alpha = alpha_from_covariance(cov)
+    total_n, removed_n = effective_n(n)
+    return (float(alpha), {col: float(value) for col, value in zip(data.columns, removed_alpha)},
+            (total_n, {col: int(value) for col, value in zip(data.columns, removed_n)}))
+
+
+def cronbach_alpha(data, missing=DEFAULT_MISSING):
+    """
+    크론바흐 알파 계산 함수
+    data: pandas DataFrame (선택된 문항들)
+    """
+    if data.shape[1] < 2:
+        raise ValueError("문항이 2개 이상 필요합니다.")
+    cov, _ = item_covariance(data.to_numpy(dtype=float, na_value=np.nan), missing)
+    return float(alpha_from_covariance(cov)[0])
@@ -0,0 +1,306 @@
+"""
+신뢰도 일괄 분석 (GUI 없이 실행)
+
+사용 예:
+    python reliability_batch.py data.xlsx scales.yaml -o results.xlsx
+    python reliability_batch.py panel.csv scales.yaml -o results.xlsx --stream --jobs 4
+    python reliability_batch.py data.xlsx scales.yaml -o results.xlsx --ci bootstrap --seed 1
+    python reliability_batch.py data.xlsx scales.yaml -o results.xlsx --missing pairwise
+    python reliability_batch.py data.xlsx scales.yaml -o results.xlsx --reduce 6 --reduce-method beam
+    python reliability_batch.py data.xlsx scales.yaml -o results.xlsx --group-by 성별 차수
+    python reliability_batch.py data.xlsx scales.yaml -o results.xlsx --trace trace.json
+    python reliability_batch.py wave2.xlsx scales.yaml -o results.parquet --append
+    python reliability_batch.py survey.xlsx scales.yaml -o results.xlsx --sheet 2차
+    python reliability_batch.py panel.csv scales.yaml -o results.xlsx --compact
+
+같은 파일(내용 기준) + 같은 문항 + 같은 옵션의 분석은 결과 저장소(result_store)에 저장된 결과를 재사용한다.
+데이터 파일에서는 척도 정의에 쓰인 문항과 집단 변수 열만 읽는다 (lazy_workbook).
+
+척도 정의 파일 (척도명 → 문항 목록, GUI와 같은 문항 선택 입력 지원)
+    범위 '희망1 to 희망6', 와일드카드 '희망*', 제외 '-희망3', 역코딩 '희망3(R)'
+    JSON/YAML: {"희망": ["희망1 to 희망6"], "불안": "불안1, 불안3, 불안5"}
+    CSV: 첫 행은 머리글(변수,문항), 이후 각 행은 척도명과 문항 목록
+"""
+import argparse
+import csv
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from bootstrap import DEFAULT_LEVEL, DEFAULT_N_BOOT, alpha_confidence_intervals
+from column_index import ColumnIndex, SelectionError
+from export import export_results
+from grouped import grouped_selection
+from instrumentation import tracer
+from item_reduction import DEFAULT_BEAM_WIDTH, REDUCTION_METHODS, reduce_selection
+from lazy_workbook import LazyWorkbook
+from reliability import DEFAULT_MISSING, MISSING_MODES
+from report import make_result
+from result_store import memo_key, open_store
+from streaming import DEFAULT_CHUNKSIZE, stream_moment_sets
+
+
+def _split_items(items):
+    """문항 목록을 토큰 리스트로 변환 (문자열이면 쉼표로 구분)"""
+    if isinstance(items, str):
+        items = items.split(",")
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def load_spec(spec_path):
+    """척도 정의 파일 읽기 → [(척도명, 문항 토큰 리스트), ...]"""
+    lower = spec_path.lower()
+    if lower.endswith(".csv"):
+        with open(spec_path, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f))
+        return [(row[0].strip(), _split_items(row[1:])) for row in rows[1:] if row and row[0].strip()]
+
+    with open(spec_path, encoding="utf-8") as f:
+        if lower.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("YAML 척도 정의를 읽으려면 PyYAML이 필요합니다 (pip install pyyaml)")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+
+    if not isinstance(spec, dict):
+        raise SystemExit("척도 정의는 '척도명: 문항 목록' 형식이어야 합니다.")
+    return [(str(name), _split_items(items)) for name, items in spec.items()]
+
+
+def analyze_scale(stats, index, name, tokens, ci_options=None, executor=None, missing=DEFAULT_MISSING,
+                  group_columns=None):
+    """
+    척도 하나 분석 → 결과 로그 항목
+    stats: 데이터 전체의 DatasetStats, index: 데이터 문항명의 ColumnIndex
+    ci_options: 신뢰구간 옵션 (method, n_boot, level, seed), None이면 계산하지 않음
+    missing: 결측 처리 방식 (listwise, pairwise, mean)
+    group_columns: 집단별 신뢰도도 계산할 집단 변수 리스트
+    """
+    return analyze_selection(stats, index.resolve(tokens), name, ci_options, executor, missing, group_columns)
+
+
+def analyze_selection(stats, selection, name, ci_options=None, executor=None, missing=DEFAULT_MISSING,
+                      group_columns=None):
+    """해석된 문항 선택(column_index.Selection) 분석 → 결과 로그 항목 (옵션은 analyze_scale과 같음)"""
+    columns, labels = selection.columns, selection.labels()
+    alpha_value, removed_alpha_values, n = stats.reliability(columns, selection.reversed, labels, missing)
+    ci = None
+    if ci_options is not None:
+        ci = alpha_confidence_intervals(stats.values(columns, selection.reversed), labels,
+                                        executor=executor, missing=missing, **ci_options)
+    groups = None
+    if group_columns:
+        groups = grouped_selection(stats, selection, group_columns, missing, executor)
+    return make_result(name, columns, alpha_value, removed_alpha_values, ci, n, missing, groups=groups)
+
+
+def analyze_reduction(stats, index, name, tokens, reduce_options, missing=DEFAULT_MISSING):
+    """
+    척도 하나의 문항 축약 → 결과 로그 항목
+    reduce_options: 축약 옵션 (target, method, beam_width)
+    """
+    return reduction_result(stats, index.resolve(tokens), name, reduce_options, missing)
+
+
+def reduction_result(stats, selection, name, reduce_options, missing=DEFAULT_MISSING):
+    """해석된 문항 선택(column_index.Selection)의 문항 축약 → 결과 로그 항목"""
+    columns, alpha_value, removed_alpha_values, n, reduction = reduce_selection(
+        stats, selection, missing=missing, **reduce_options)
+    return make_result(f"{name} ({len(columns)}문항 축약)", columns, alpha_value, removed_alpha_values,
+                       n=n, missing=missing, reduction=reduction)
+
+
+def memoized(store, session, key, name, analyze, dataset=None, file=None):
+    """
+    저장소에 같은 분석(memo 키) 결과가 있으면 재사용, 없으면 analyze()로 계산해 저장
+    name: 결과 로그에 쓸 척도명 또는 결과 → 척도명 함수 (척도 정의 파일의 이름이 바뀌어도 현재 이름으로 표시)
+    """
+    if store is None:
+        return analyze()
+    result = store.lookup(key)
+    if result is None:
+        result = analyze()
+    else:
+        result["문항명"] = name(result) if callable(name) else name
+    store.add(result, session, key, dataset, file)
+    return result
+
+
+def analyze_streaming(file_path, spec, chunksize, jobs, report_error, missing=DEFAULT_MISSING):
+    """
+    CSV 파일을 한 번만 스트리밍하며 모든 척도 분석
+    pairwise/mean: 모든 척도 문항의 합집합으로 충분통계량을 누적한 뒤 척도별로 부분 행렬만 사용
+    listwise: 척도마다 결측 없는 응답자가 다르므로 척도별 통계량을 같은 읽기에서 함께 누적
+    """
+    index = ColumnIndex(pd.read_csv(file_path, nrows=0).columns)
+    scales = []
+    union = {}
+    for name, tokens in spec:
+        try:
+            selection = index.resolve(tokens)
+        except SelectionError as e:
+            report_error(name, e)
+            continue
+        scales.append((name, selection))
+        for col in selection.columns:
+            union.setdefault(col, len(union))
+    if not scales:
+        return []
+
+    listwise = missing == "listwise"
+    column_sets = [selection.columns for _, selection in scales] if listwise else [list(union)]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            moments = stream_moment_sets(file_path, column_sets, chunksize, executor, listwise)
+    else:
+        moments = stream_moment_sets(file_path, column_sets, chunksize, listwise=listwise)
+
+    results = []
+    for i, (name, selection) in enumerate(scales):
+        columns, labels = selection.columns, selection.labels()
+        signs = [-1.0 if col in selection.reversed else 1.0 for col in columns]
+        if listwise:
+            scale_moments, indices = moments[i], None
+        else:
+            scale_moments, indices = moments[0], [union[col] for col in columns]
+        try:
+            alpha_value, removed_alpha, (total_n, removed_n) = scale_moments.reliability(indices, signs, missing)
+        except ValueError as e:
+            report_error(name, e)
+            continue
+        removed_alpha_values = {label: float(value) for label, value in zip(labels, removed_alpha)}
+        n = (total_n, {label: int(value) for label, value in zip(labels, removed_n)})
+        results.append(make_result(name, columns, alpha_value, removed_alpha_values, n=n, missing=missing))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="크론바흐 알파 일괄 분석")
+    parser.add_argument("data", help="데이터 파일 (.xlsx, .xls, .csv)")
+    parser.add_argument("spec", help="척도 정의 파일 (.yaml, .json, .csv)")
+    parser.add_argument("-o", "--output", default="reliability_results.xlsx",
+                        help="결과 파일 (.xlsx, .csv 또는 .parquet, 기본값: reliability_results.xlsx)")
+    parser.add_argument("--sheet", help="분석할 엑셀 시트 이름 (기본값: 첫 시트)")
+    parser.add_argument("--append", action="store_true",
+                        help="결과 파일이 이미 있으면 덮어쓰지 않고 뒤에 추가")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="파싱된 데이터 캐시를 사용하지 않고 파일을 다시 읽음")
+    parser.add_argument("--no-store", action="store_true",
+                        help="결과 저장소를 사용하지 않음 (같은 분석도 다시 계산하고 결과를 기록하지 않음)")
+    parser.add_argument("--compact", action="store_true",
+                        help="문항 응답을 uint8 코드 + 결측 비트 마스크로 보관 (메모리 약 1/7, 결과는 같음)")
+    parser.add_argument("--stream", action="store_true",
+                        help="CSV 파일을 청크 단위로 읽어 메모리보다 큰 데이터도 분석")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"스트리밍 시 한 번에 읽는 행 수 (기본값: {DEFAULT_CHUNKSIZE})")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="스트리밍 청크 통계량 / 부트스트랩 반복 / 집단별 합을 계산할 프로세스 수 (기본값: 1)")
+    parser.add_argument("--missing", choices=MISSING_MODES, default=DEFAULT_MISSING,
+                        help=f"결측 처리 방식: listwise(결측 응답자 제외), pairwise(문항 쌍별 제외), "
+                             f"mean(평균 대체) (기본값: {DEFAULT_MISSING})")
+    parser.add_argument("--group-by", nargs="+", metavar="COLUMN",
+                        help="집단 변수별 α도 함께 계산 (여러 개면 교차 집단, 결과는 집단별 열로 저장)")
+    parser.add_argument("--reduce", type=int, metavar="N",
+                        help="척도마다 α가 가장 큰 N문항 단축형도 함께 탐색")
+    parser.add_argument("--reduce-method", choices=REDUCTION_METHODS, default="greedy",
+                        help="문항 축약 방법 (기본값: greedy)")
+    parser.add_argument("--beam-width", type=int, default=DEFAULT_BEAM_WIDTH,
+                        help=f"beam 축약에서 유지할 조합 수 (기본값: {DEFAULT_BEAM_WIDTH})")
+    parser.add_argument("--ci", choices=["bootstrap", "jackknife"],
+                        help="α와 문항 제거 시 α의 신뢰구간 계산 방법")
+    parser.add_argument("--n-boot", type=int, default=DEFAULT_N_BOOT,
+                        help=f"부트스트랩 반복 수 (기본값: {DEFAULT_N_BOOT})")
+    parser.add_argument("--level", type=float, default=DEFAULT_LEVEL,
+                        help=f"신뢰 수준 (기본값: {DEFAULT_LEVEL})")
+    parser.add_argument("--seed", type=int, help="부트스트랩 난수 시드 (재현용)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="단계별 시간 기록 저장 (.json은 Chrome trace, 그 밖에는 JSON Lines)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="단계별 최대 메모리도 기록 (계산이 느려짐)")
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracer.enabled = True
+        tracer.set_track_memory(args.trace_memory)
+
+    failed = 0
+
+    def report_error(name, e):
+        nonlocal failed
+        failed += 1
+        print(f"[오류] {name}: {e}", file=sys.stderr)
+
+    spec = load_spec(args.spec)
+    if args.stream:
+        if not args.data.lower().endswith(".csv"):
+            parser.error("--stream은 CSV 파일에서만 사용할 수 있습니다.")
+        if args.ci:
+            parser.error("--ci는 --stream과 함께 사용할 수 없습니다 (원자료 재표집이 필요).")
+        if args.reduce:
+            parser.error("--reduce는 --stream과 함께 사용할 수 없습니다.")
+        if args.group_by:
+            parser.error("--group-by는 --stream과 함께 사용할 수 없습니다.")
+        results = analyze_streaming(args.data, spec, args.chunksize, args.jobs, report_error, args.missing)
+    else:
+        workbook = LazyWorkbook(args.data, args.sheet, use_cache=False if args.no_cache else None,
+                                compact=True if args.compact else None)
+        fingerprint = workbook.fingerprint
+        index = ColumnIndex(workbook.columns)
+        # 척도 정의에 쓰인 문항과 집단 변수 열만 읽음 (해석할 수 없는 척도는 아래에서 척도별로 알림)
+        needed = [col for col in args.group_by or [] if col in workbook.columns]
+        for name, tokens in spec:
+            try:
+                needed.extend(index.resolve(tokens).columns)
+            except SelectionError:
+                pass
+        stats = workbook.stats(needed) if needed else None  # 척도끼리 문항이 겹쳐도 공분산은 한 번만 계산
+        options = {} if workbook.sheet is None else {"sheet": workbook.sheet}
+        ci_options = None
+        if args.ci:
+            ci_options = {"method": args.ci, "n_boot": args.n_boot, "level": args.level, "seed": args.seed}
+        reduce_options = {"target": args.reduce, "method": args.reduce_method, "beam_width": args.beam_width}
+        parallel = args.ci or args.group_by
+        executor = ProcessPoolExecutor(max_workers=args.jobs) if parallel and args.jobs > 1 else None
+        store = None if args.no_store else open_store()
+        session = store.new_session("cli") if store is not None else None
+        results = []
+        try:
+            for name, tokens in spec:
+                try:
+                    selection = index.resolve(tokens)
+                    # 시드 없는 부트스트랩 신뢰구간이면 key는 None (결과는 저장하지만 다시 쓰지 않음)
+                    key = memo_key(fingerprint, selection, "alpha", missing=args.missing, ci=ci_options,
+                                   group=args.group_by, **options)
+                    results.append(memoized(store, session, key, name, lambda: analyze_scale(
+                        stats, index, name, tokens, ci_options, executor, args.missing, args.group_by),
+                        fingerprint, args.data))
+                    if args.reduce:
+                        key = memo_key(fingerprint, selection, "reduction", missing=args.missing, **reduce_options,
+                                       **options)
+                        results.append(memoized(
+                            store, session, key, lambda result: f"{name} ({result['문항 수']}문항 축약)",
+                            lambda: analyze_reduction(stats, index, name, tokens, reduce_options, args.missing),
+                            fingerprint, args.data))
+                except Exception as e:
+                    report_error(name, e)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if store is not None:
+                store.close()
+
+    if results:
+        export_results(results, args.output, append=args.append)
+        print(f"{len(results)}개 척도 결과가 {args.output}에 {'추가' if args.append else '저장'}되었습니다.")
+    if args.trace:
+        tracer.write(args.trace)
+        print(f"단계별 시간 기록이 {args.trace}에 저장되었습니다.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
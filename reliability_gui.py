@@ -0,0 +1,745 @@
+"""
+신뢰도 분석 GUI (크론바흐 알파)
+
+    python reliability_gui.py   (신뢰도_GUI.py, 신뢰도_GUI_다중클릭기능추가.py도 이 창을 띄움)
+
+창을 빨리 띄우기 위해 pandas/openpyxl은 파일을 처음 열 때 백그라운드 작업 안에서 불러오고,
+지난 결과 로그는 창을 그린 뒤에 불러온다. 시작 시간은 benchmarks/startup.py로 잰다.
+계산 모듈(reliability, dataset_stats 등)은 이 모듈 없이 바로 가져다 쓸 수 있다.
+
+환경 변수
+    RELIABILITY_SERVER        분석 서버 주소 (analysis_server) - 있으면 파일 읽기와 계산을 서버에 맡김
+                              (토큰은 서버가 쓴 토큰 파일에서 읽음, analysis_client 참고)
+"""
+import os
+import sqlite3
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import filedialog, messagebox, ttk
+
+from analysis_client import AnalysisClient, RemoteWorkbook, server_address
+from background import BackgroundRunner
+from bootstrap import DEFAULT_LEVEL, DEFAULT_N_BOOT, alpha_confidence_intervals
+from column_index import ColumnIndex, SelectionError
+from export import export_results
+from grouped import grouped_selection
+from instrumentation import span, tracer
+from item_reduction import REDUCTION_METHODS, reduce_selection
+from reliability import DEFAULT_MISSING
+from report import MISSING_LABELS, ci_label, format_ci, make_result, reduction_summary
+from result_store import memo_key, open_store
+from widgets import ResultsLogView, TracePanel, VirtualListbox
+
+# 색상 및 폰트 설정
+COLOR_BG = "#f5f5f5"
+COLOR_PRIMARY = "#2c3e50"
+COLOR_SECONDARY = "#3498db"
+COLOR_SUCCESS = "#27ae60"
+COLOR_ACCENT = "#e74c3c"
+COLOR_WHITE = "#ffffff"
+COLOR_LIGHT_GRAY = "#ecf0f1"
+COLOR_TEXT = "#2c3e50"
+
+FONT_TITLE = ("맑은 고딕", 11, "bold")
+FONT_NORMAL = ("맑은 고딕", 10)
+FONT_SMALL = ("맑은 고딕", 9)
+
+NO_GROUP = "(없음)"
+
+# 신뢰도 계산 결과 저장
+results_log = []
+
+# 보고서 파일별로 이미 저장한 결과 수 (이어서 저장할 때 새 결과만 추가)
+saved_counts = {}
+
+# 불러온 데이터 파일(머리글만 먼저 읽고 문항 열은 분석할 때 읽음)과 문항명 색인 (파일을 새로 불러오면 교체)
+workbook = None
+column_index = None
+
+# 결과 저장소 (창을 닫아도 결과 로그가 남고, 같은 파일 + 같은 문항 + 같은 옵션의 분석은 바로 불러옴)
+result_store = None
+session_id = None
+
+# 분석 서버 (RELIABILITY_SERVER가 있으면 여러 분석자가 서버에 상주한 데이터를 함께 사용, 없으면 직접 계산)
+analysis_server = None
+
+def select_file():
+    """엑셀 파일 선택 (파일 읽기는 백그라운드에서 실행)"""
+    file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls"), ("CSV files", "*.csv")])
+    if not file_path:
+        return
+    entry_file_path.delete(0, tk.END)
+    entry_file_path.insert(0, file_path)
+
+    # 이전 파일의 통계량 캐시 무효화
+    global workbook
+    workbook = None
+    runner.submit(load_file_job, file_path, message="파일을 읽는 중...",
+                  on_done=on_file_loaded,
+                  on_error=lambda e: messagebox.showerror("오류", f"파일을 열 수 없습니다: {e}"))
+
+def select_sheet(event=None):
+    """다른 시트 선택 → 그 시트의 문항명 읽기"""
+    if workbook is None or sheet_var.get() == current_sheet():
+        return
+    if runner.busy:
+        sheet_var.set(current_sheet())
+        messagebox.showinfo("정보", "이전 작업이 끝난 뒤 다시 시도하세요.")
+        return
+    runner.submit(load_file_job, workbook.file_path, sheet_var.get(), message="시트를 읽는 중...",
+                  on_done=on_file_loaded,
+                  on_error=lambda e: messagebox.showerror("오류", f"시트를 열 수 없습니다: {e}"))
+
+def current_sheet():
+    """불러온 시트 이름 (CSV는 빈 문자열)"""
+    if workbook.sheet is not None:
+        return workbook.sheet
+    return workbook.sheet_names[0] if workbook.sheet_names else ""
+
+def load_file_job(job, file_path, sheet=None):
+    """[백그라운드] 시트 이름과 문항명만 읽기 (문항 응답은 분석할 때 필요한 열만 읽음)"""
+    if analysis_server is not None:
+        return analysis_server.load(file_path, sheet)
+    from lazy_workbook import LazyWorkbook  # pandas는 파일을 처음 열 때 불러옴 (창을 빨리 띄우기 위해)
+
+    loaded = LazyWorkbook(file_path, sheet)
+    job.check()
+    return loaded
+
+def on_file_loaded(loaded):
+    """파일 읽기 완료 후 문항 리스트 갱신"""
+    global workbook
+    workbook = loaded
+    if result_store is not None and not workbook.fingerprint_ready:
+        # 저장소 memo 키용 파일 내용 해시는 파일 크기에 비례하므로 문항 목록을 보여 준 뒤 따로 계산
+        threading.Thread(target=hash_file, args=(workbook,), daemon=True).start()
+    global column_names
+    column_names = workbook.columns
+    global column_index
+    with span("index", columns=len(column_names)):
+        column_index = ColumnIndex(column_names)
+    combo_group["values"] = [NO_GROUP] + [str(col) for col in column_names]
+    group_var.set(NO_GROUP)
+    combo_sheet["values"] = workbook.sheet_names
+    combo_sheet.config(state="readonly" if len(workbook.sheet_names) > 1 else tk.DISABLED)
+    sheet_var.set(current_sheet())
+    update_recommendations()
+
+def hash_file(loaded):
+    """[백그라운드 스레드] 파일 내용 해시 계산 (결과는 loaded.fingerprint에 보관, 위젯은 건드리지 않음)"""
+    try:
+        with span("fingerprint"):
+            return loaded.fingerprint
+    except OSError:
+        return None  # 파일이 사라진 경우 등 - 저장소 memo만 쓰지 않음
+
+def current_fingerprint():
+    """불러온 파일의 내용 해시 (아직 계산 중이면 None)"""
+    if workbook is None or not workbook.fingerprint_ready:
+        return None
+    return workbook.fingerprint
+
+def update_recommendations(*args):
+    """검색어에 맞는 문항 표시 (검색어가 없으면 전체 문항)"""
+    if column_index is None:
+        return
+    positions = column_index.search(search_var.get())
+    listbox_recommendations.set_items([column_names[i] for i in positions])
+
+def add_multiple_selected_recommendations(event=None):
+    """Shift 키를 이용한 다중 선택 추가 (더블클릭 또는 선택 버튼)"""
+    selected_columns = [str(col) for col in listbox_recommendations.selected_items()]
+    if not selected_columns:
+        return
+    insert_columns(selected_columns)
+
+def add_selected_families():
+    """선택한 문항이 속한 문항군 전체 추가 (e.g., 희망3 선택 → 희망1 ~ 희망N)"""
+    families = []
+    for col in listbox_recommendations.selected_items():
+        for member in column_index.family_of(col):
+            if str(member) not in families:
+                families.append(str(member))
+    if families:
+        insert_columns(families)
+
+def insert_columns(selected_columns):
+    """입력란 끝에 문항명 추가"""
+    current_text = entry_columns.get("1.0", tk.END).strip()
+    new_text = ", ".join(selected_columns)
+
+    if current_text:
+        entry_columns.insert(tk.END, f", {new_text}")
+    else:
+        entry_columns.insert(tk.END, new_text)
+
+def current_selection():
+    """입력 확인 후 입력된 문항명 해석 (문제가 있으면 오류를 알리고 None)"""
+    file_path = entry_file_path.get()
+    selected_columns = entry_columns.get("1.0", tk.END).strip()
+
+    if not file_path:
+        messagebox.showerror("오류", "엑셀 파일을 선택하세요!")
+        return None
+
+    if not selected_columns:
+        messagebox.showerror("오류", "문항명을 입력하세요!")
+        return None
+
+    if workbook is None:
+        messagebox.showerror("오류", "엑셀 파일을 불러오지 못했습니다. 파일을 다시 선택하세요!")
+        return None
+
+    if runner.busy:
+        messagebox.showinfo("정보", "이전 작업이 끝난 뒤 다시 시도하세요.")
+        return None
+
+    try:
+        # 입력된 문항명 해석 (범위, 와일드카드, 제외, 역코딩) - 없는 문항 등은 계산 전에 모두 알림
+        return column_index.resolve(selected_columns)
+    except SelectionError as e:
+        messagebox.showerror("입력 오류", str(e))
+        return None
+
+def calculate_alpha():
+    """신뢰도 분석 실행 (입력 확인 후 계산은 백그라운드에서 실행)"""
+    selection = current_selection()
+    if selection is None:
+        return
+
+    # "문항명"에서 숫자 제거 (e.g., '희망1' -> '희망')
+    base_name = ''.join(filter(str.isalpha, str(selection.columns[0])))
+
+    with_ci, missing, group_column = ci_enabled.get(), selected_missing(), selected_group()
+    # 시드 없는 부트스트랩이므로 신뢰구간을 계산하면 memo 키가 None (매번 새로 계산)
+    ci_options = {"method": "bootstrap", "n_boot": DEFAULT_N_BOOT, "level": DEFAULT_LEVEL, "seed": None}
+    memo = analysis_memo(selection, "alpha", missing=missing, group=group_column, ci=ci_options if with_ci else None)
+    if show_memoized(memo):
+        return
+    runner.submit(analysis_job, workbook, selection, base_name, with_ci, missing,
+                  group_column, message="분석 중...",
+                  on_done=lambda result: on_analysis_done(result, memo),
+                  on_error=lambda e: messagebox.showerror("오류", f"분석 중 오류가 발생했습니다:\n{e}"))
+
+def reduce_scale():
+    """문항 축약 실행 (입력된 문항 중 α가 가장 큰 N문항 조합 탐색)"""
+    selection = current_selection()
+    if selection is None:
+        return
+    try:
+        target = int(reduce_target_var.get())
+    except ValueError:
+        messagebox.showerror("입력 오류", "남길 문항 수를 숫자로 입력하세요!")
+        return
+
+    base_name = ''.join(filter(str.isalpha, str(selection.columns[0])))
+    method, missing = reduce_method_var.get(), selected_missing()
+    memo = analysis_memo(selection, "reduction", missing=missing, target=target, method=method)
+    if show_memoized(memo):
+        return
+    runner.submit(reduction_job, workbook, selection, base_name, target, method,
+                  missing, message="문항 축약 중...",
+                  on_done=lambda result: on_analysis_done(result, memo),
+                  on_error=lambda e: messagebox.showerror("오류", f"문항 축약 중 오류가 발생했습니다:\n{e}"))
+
+def reduction_job(job, workbook, selection, base_name, target, method, missing):
+    """[백그라운드] 캐시된 공분산 행렬로 문항 축약 탐색 (후보마다 O(1) 갱신)"""
+    if isinstance(workbook, RemoteWorkbook):
+        job.report(0, 0, "서버에서 문항 축약 중...")
+        result = workbook.reduce(selection, target, method, name=base_name, missing=missing)
+        job.check()
+        return result
+    stats = load_columns(job, workbook, selection.columns)
+
+    def progress(done, total):
+        job.check()
+        job.report(done, total, "문항 축약 중...")
+
+    columns, alpha_value, removed_alpha_values, n, reduction = reduce_selection(
+        stats, selection, target, method, missing=missing, progress=progress)
+    return make_result(f"{base_name} ({target}문항 축약)", columns, alpha_value, removed_alpha_values,
+                       n=n, missing=missing, reduction=reduction)
+
+def analysis_job(job, workbook, selection, base_name, with_ci, missing, group_column):
+    """[백그라운드] 크론바흐 알파 및 문항 제거 시 알파 계산 (캐시된 공분산 행렬의 부분 행렬 사용)"""
+    if isinstance(workbook, RemoteWorkbook):
+        job.report(0, 0, "서버에서 분석 중...")
+        result = workbook.alpha(selection, name=base_name, missing=missing,
+                                ci={"n_boot": DEFAULT_N_BOOT, "level": DEFAULT_LEVEL} if with_ci else None,
+                                group_by=[group_column] if group_column is not None else None)
+        job.check()
+        return result
+
+    columns, labels = selection.columns, selection.labels()
+    stats = load_columns(job, workbook, columns + ([group_column] if group_column is not None else []))
+    alpha_value, removed_alpha_values, n = stats.reliability(columns, selection.reversed, labels, missing)
+
+    ci = None
+    if with_ci:
+        def progress(done, total):
+            job.check()
+            job.report(done, total, "신뢰구간 계산 중...")
+
+        # 행렬 곱은 GIL을 놓으므로 스레드 풀로도 병렬 계산됨
+        with ThreadPoolExecutor() as executor:
+            ci = alpha_confidence_intervals(stats.values(columns, selection.reversed), labels,
+                                            executor=executor, progress=progress, missing=missing)
+
+    groups = None
+    if group_column is not None:
+        # 모든 집단의 합계를 한 번에 계산 (집단이 많으면 행 구간을 나누어 병렬 계산)
+        job.check()
+        job.report(0, 1, "집단별 분석 중...")
+        with ThreadPoolExecutor() as executor:
+            groups = grouped_selection(stats, selection, [group_column], missing, executor)
+    return make_result(base_name, columns, alpha_value, removed_alpha_values, ci, n, missing, groups=groups)
+
+def load_columns(job, workbook, columns):
+    """[백그라운드] 아직 읽지 않은 문항 열 읽기 → 읽은 열 전체의 DatasetStats"""
+    job.report(0, 1, "문항 읽는 중...")
+    stats = workbook.stats(columns)
+    job.check()
+    return stats
+
+def analysis_memo(selection, analysis, **options):
+    """
+    저장소의 memo 키 (저장소를 쓰지 않거나, 파일 해시를 아직 계산 중이거나, 결과가 매번 달라지는 분석이면 None
+    → 저장된 결과를 찾지 않고 계산)
+    """
+    fingerprint = current_fingerprint()
+    if result_store is None or fingerprint is None:
+        return None
+    if workbook.sheet is not None:
+        options["sheet"] = workbook.sheet  # 첫 시트가 아니면 시트도 구분
+    return memo_key(fingerprint, selection, analysis, **options)
+
+def show_memoized(memo):
+    """같은 분석의 저장된 결과가 있으면 다시 계산하지 않고 바로 표시 → 표시 여부"""
+    if memo is None:
+        return False
+    try:
+        result = result_store.lookup(memo)
+    except sqlite3.Error:
+        return False
+    if result is None:
+        return False
+    on_analysis_done(result, memo)
+    progress_status.set("저장된 결과를 불러왔습니다.")
+    return True
+
+def remember(result, memo):
+    """결과를 저장소의 현재 세션에 기록 (저장소 오류는 분석에 영향을 주지 않음)"""
+    if result_store is None:
+        return
+    try:
+        result_store.add(result, session_id, memo, current_fingerprint(), entry_file_path.get())
+    except sqlite3.Error:
+        pass
+
+def start_new_log():
+    """결과 로그 비우고 새 세션 시작 (이전 결과는 저장소에 남음)"""
+    global session_id
+    if runner.busy:
+        messagebox.showinfo("정보", "이전 작업이 끝난 뒤 다시 시도하세요.")
+        return
+    if results_log and not messagebox.askyesno("확인", "결과 로그를 비우고 새로 시작할까요?"):
+        return
+    results_log.clear()
+    saved_counts.clear()
+    log_view.clear()
+    text_result.delete(1.0, tk.END)
+    if result_store is not None:
+        session_id = result_store.new_session()
+
+def on_analysis_done(result, memo=None):
+    """분석 완료 후 결과 표시"""
+    results_log.append(result)
+    remember(result, memo)
+    with span("render.results_log", rows=len(results_log)):
+        log_view.append(result)  # 새 결과만 추가
+
+    ci = result.get("신뢰구간")
+    result_text = f"Cronbach’s α: {result['Cronbach_alpha']}"
+    if ci is not None:
+        result_text += f"  ({ci_label(result)} {format_ci(ci['alpha'])})"
+    result_text += f"\n유효 N: {result['유효 N']} ({MISSING_LABELS[result['결측 처리']]})"
+    reduction = result.get("문항 축약")
+    if reduction is not None:
+        result_text += f"\n문항 축약 ({reduction['방법']}, {reduction['원래 문항 수']} → {result['문항 수']}문항): "
+        result_text += reduction_summary(result) + " 제거"
+        if "경로 N" in reduction and reduction["경로"]:
+            result_text += f"\n  (제거 경로의 α는 문항 풀 전체에 응답한 {reduction['경로 N']}명 기준)"
+    for group in result.get("집단별", {}).get("집단", []):
+        result_text += f"\n  [{group['집단']}] α: {group['Cronbach_alpha']} (N = {group['유효 N']})"
+    result_text += "\n\n각 문항 제거 시 Cronbach’s α:\n"
+    removed_n = result["문항 제거 시 유효 N"]
+    for col, value in result["문항 제거 시 알파 값"].items():
+        result_text += f"{col} 제거 시 α: {value}"
+        if ci is not None:
+            result_text += f"  {format_ci(ci['removed'][col])}"
+        if removed_n[col] != result["유효 N"]:
+            result_text += f"  (N = {removed_n[col]})"
+        result_text += "\n"
+
+    text_result.delete(1.0, tk.END)
+    text_result.insert(tk.END, result_text)
+
+    entry_columns.delete("1.0", tk.END)
+
+def save_results_to_excel_custom():
+    """결과를 엑셀/CSV/Parquet 파일에 저장 (저장은 백그라운드에서 한 행씩 스트리밍)"""
+    if not results_log:
+        messagebox.showinfo("정보", "저장할 결과가 없습니다.")
+        return
+
+    if runner.busy:
+        messagebox.showinfo("정보", "이전 작업이 끝난 뒤 다시 시도하세요.")
+        return
+
+    append = append_enabled.get()
+    save_path = filedialog.asksaveasfilename(
+        defaultextension=".xlsx", confirmoverwrite=not append,
+        filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("Parquet files", "*.parquet")])
+    if not save_path:
+        return
+
+    # 이어서 저장: 이 파일에 아직 저장하지 않은 결과만 추가
+    key = os.path.abspath(save_path)
+    append = append and os.path.exists(save_path)
+    start = saved_counts.get(key, 0) if append else 0
+    results = results_log[start:]
+    if not results:
+        messagebox.showinfo("정보", "새로 저장할 결과가 없습니다.")
+        return
+
+    def on_saved(count):
+        saved_counts[key] = start + count
+        if result_store is not None:
+            try:
+                result_store.set_saved_count(session_id, key, saved_counts[key])
+            except sqlite3.Error:
+                pass
+        action = "추가" if append else "저장"
+        messagebox.showinfo("성공", f"결과 {count}개가 {save_path}에 {action}되었습니다.")
+
+    runner.submit(save_job, results, save_path, append, message="결과 저장 중...",
+                  on_done=on_saved, on_error=on_save_error)
+
+def save_job(job, results, save_path, append):
+    """[백그라운드] 결과를 한 행씩 파일에 쓰기 (취소하면 기존 파일 유지)"""
+    def progress(done, total):
+        job.check()
+        job.report(done, total, "결과 저장 중...")
+
+    return export_results(results, save_path, append, progress)
+
+def on_save_error(e):
+    import traceback
+    error_detail = "".join(traceback.format_exception(e))
+    messagebox.showerror("오류", f"결과 저장 중 오류가 발생했습니다:\n{e}\n\n상세:\n{error_detail}")
+
+def selected_group():
+    """선택된 집단 변수 (없으면 None)"""
+    name = group_var.get()
+    if name == NO_GROUP:
+        return None
+    return next(col for col in column_names if str(col) == name)
+
+def selected_missing():
+    """선택된 결측 처리 방식 (listwise, pairwise, mean)"""
+    return {label: mode for mode, label in MISSING_LABELS.items()}[missing_var.get()]
+
+def set_busy(busy):
+    """작업 중에는 실행 버튼 비활성화, 취소 버튼 활성화"""
+    state = tk.DISABLED if busy else tk.NORMAL
+    btn_browse.config(state=state)
+    btn_analyze.config(state=state)
+    btn_reduce.config(state=state)
+    btn_save.config(state=state)
+    btn_new_log.config(state=state)
+    btn_cancel.config(state=tk.NORMAL if busy else tk.DISABLED)
+    if not busy:
+        trace_panel.refresh()  # 접어 둔 성능 기록은 주기적으로 갱신하지 않으므로 작업이 끝날 때 갱신
+
+def restore_last_session():
+    """저장소를 열고 마지막 세션의 결과 로그 다시 불러오기 (창을 그린 뒤 실행)"""
+    global result_store, session_id
+    result_store = open_store()
+    if result_store is None:
+        return
+    try:
+        session_id = result_store.last_session() or result_store.new_session()
+        results_log.extend(result_store.session_results(session_id))
+        saved_counts.update(result_store.saved_counts(session_id))
+    except sqlite3.Error:
+        result_store = None
+    with span("render.results_log", rows=len(results_log)):
+        log_view.extend(results_log)  # 마지막 결과들만 행을 만듦
+
+# ==================== 화면 구성 ====================
+
+def build_file_section(parent):
+    """1. 데이터 파일 선택"""
+    global entry_file_path, btn_browse, sheet_var, combo_sheet
+    file_frame = tk.LabelFrame(parent, text=" 1. 데이터 파일 선택 ",
+                               font=FONT_TITLE, bg=COLOR_WHITE, fg=COLOR_PRIMARY,
+                               padx=15, pady=15, relief=tk.RIDGE, borderwidth=2)
+    file_frame.pack(fill=tk.X, pady=(0, 10))
+
+    tk.Label(file_frame, text="엑셀 파일:", font=FONT_NORMAL, bg=COLOR_WHITE, fg=COLOR_TEXT).grid(
+        row=0, column=0, sticky="w", padx=(0, 10))
+    entry_file_path = tk.Entry(file_frame, width=60, font=FONT_NORMAL,
+                               relief=tk.SOLID, borderwidth=1)
+    entry_file_path.grid(row=0, column=1, padx=(0, 10), ipady=5)
+    btn_browse = tk.Button(file_frame, text="📁 찾아보기", command=select_file,
+                           font=FONT_NORMAL, bg=COLOR_SECONDARY, fg=COLOR_WHITE,
+                           relief=tk.FLAT, padx=15, pady=5, cursor="hand2",
+                           activebackground="#2980b9", activeforeground=COLOR_WHITE)
+    btn_browse.grid(row=0, column=2)
+
+    # 시트 선택 (문항명만 먼저 읽으므로 시트를 바꿔도 바로 표시됨)
+    tk.Label(file_frame, text="시트:", font=FONT_NORMAL, bg=COLOR_WHITE, fg=COLOR_TEXT).grid(
+        row=1, column=0, sticky="w", padx=(0, 10), pady=(8, 0))
+    sheet_var = tk.StringVar()
+    combo_sheet = ttk.Combobox(file_frame, textvariable=sheet_var, state=tk.DISABLED, width=30, font=FONT_SMALL)
+    combo_sheet.grid(row=1, column=1, sticky="w", pady=(8, 0))
+    combo_sheet.bind("<<ComboboxSelected>>", select_sheet)
+
+def build_input_section(parent, multi_select=True):
+    """
+    2. 분석 문항 선택 (입력란, 문항 검색, 문항 리스트)
+    multi_select: 문항 리스트에서 Shift/Ctrl로 여러 문항을 골라 '선택' 버튼으로 추가 (False면 더블클릭한 문항 하나씩 추가)
+    """
+    global entry_columns, search_var, listbox_recommendations
+    input_frame = tk.LabelFrame(parent, text=" 2. 분석 문항 선택 ",
+                                font=FONT_TITLE, bg=COLOR_WHITE, fg=COLOR_PRIMARY,
+                                padx=15, pady=15, relief=tk.RIDGE, borderwidth=2)
+    input_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+
+    # 문항명 입력 (Text 위젯으로 변경하여 여러 줄 표시)
+    tk.Label(input_frame, text="선택된 문항 (범위 '희망1 to 희망6', 와일드카드 '희망*', 제외 '-희망3', 역코딩 '희망3(R)'):",
+             font=FONT_NORMAL, bg=COLOR_WHITE, fg=COLOR_TEXT).pack(anchor="w", pady=(0, 5))
+
+    # Text 위젯 + 스크롤바
+    entry_columns_frame = tk.Frame(input_frame, bg=COLOR_WHITE)
+    entry_columns_frame.pack(fill=tk.X, pady=(0, 10))
+
+    scrollbar_columns = tk.Scrollbar(entry_columns_frame, orient=tk.VERTICAL)
+    scrollbar_columns.pack(side=tk.RIGHT, fill=tk.Y)
+
+    entry_columns = tk.Text(entry_columns_frame, font=FONT_NORMAL, relief=tk.SOLID,
+                            borderwidth=1, height=4, wrap=tk.WORD,
+                            yscrollcommand=scrollbar_columns.set)
+    entry_columns.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar_columns.config(command=entry_columns.yview)
+
+    # 문항 리스트 (스크롤바 포함)
+    list_label = "문항 리스트 (다중 선택 가능):" if multi_select else "문항 리스트 (더블클릭하면 추가):"
+    tk.Label(input_frame, text=list_label, font=FONT_NORMAL,
+             bg=COLOR_WHITE, fg=COLOR_TEXT).pack(anchor="w", pady=(10, 5))
+
+    # 문항 검색 (입력할 때마다 목록이 걸러짐, '희망*'처럼 *로 끝나면 접두어 검색)
+    search_frame = tk.Frame(input_frame, bg=COLOR_WHITE)
+    search_frame.pack(fill=tk.X, pady=(0, 5))
+    tk.Label(search_frame, text="🔎 검색:", font=FONT_NORMAL, bg=COLOR_WHITE, fg=COLOR_TEXT).pack(side=tk.LEFT)
+    search_var = tk.StringVar()
+    search_var.trace_add("write", update_recommendations)
+    entry_search = tk.Entry(search_frame, textvariable=search_var, font=FONT_NORMAL,
+                            relief=tk.SOLID, borderwidth=1)
+    entry_search.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0), ipady=3)
+
+    # 보이는 줄만 위젯으로 만드는 가상 목록 (문항이 수천 개여도 빠름)
+    listbox_recommendations = VirtualListbox(input_frame, bg=COLOR_WHITE, font=FONT_NORMAL,
+                                             selectmode=tk.EXTENDED if multi_select else tk.BROWSE, relief=tk.SOLID,
+                                             borderwidth=1, selectbackground=COLOR_SECONDARY,
+                                             selectforeground=COLOR_WHITE)
+    listbox_recommendations.pack(fill=tk.BOTH, expand=True)
+    listbox_recommendations.bind("<Double-Button-1>", add_multiple_selected_recommendations)
+    if not multi_select:
+        return
+
+    # '선택' 버튼 추가
+    btn_select_frame = tk.Frame(input_frame, bg=COLOR_WHITE)
+    btn_select_frame.pack(fill=tk.X, pady=(10, 0))
+
+    btn_select = tk.Button(btn_select_frame, text="✓ 선택", command=add_multiple_selected_recommendations,
+                           font=FONT_NORMAL, bg=COLOR_SECONDARY, fg=COLOR_WHITE,
+                           relief=tk.FLAT, padx=20, pady=8, cursor="hand2",
+                           activebackground="#2980b9", activeforeground=COLOR_WHITE)
+    btn_select.pack(side=tk.RIGHT)
+
+    btn_family = tk.Button(btn_select_frame, text="문항군 전체", command=add_selected_families,
+                           font=FONT_NORMAL, bg=COLOR_LIGHT_GRAY, fg=COLOR_TEXT,
+                           relief=tk.FLAT, padx=15, pady=8, cursor="hand2")
+    btn_family.pack(side=tk.RIGHT, padx=(0, 10))
+
+    tk.Label(btn_select_frame, text="💡 Tip: 문항을 Shift/Ctrl로 다중 선택 후, 더블클릭 또는 '선택' 버튼 클릭",
+             font=FONT_SMALL, bg=COLOR_WHITE, fg="#7f8c8d").pack(side=tk.LEFT)
+
+def build_button_section(parent):
+    """실행/저장 버튼, 분석 옵션, 진행 상황"""
+    global btn_analyze, btn_save, append_enabled, ci_enabled, missing_var, btn_cancel, progress_status, progressbar
+    button_frame = tk.Frame(parent, bg=COLOR_BG)
+    button_frame.pack(fill=tk.X, pady=(0, 10))
+
+    btn_analyze = tk.Button(button_frame, text="🔍 분석 실행", command=calculate_alpha,
+                            font=("맑은 고딕", 11, "bold"), bg=COLOR_SECONDARY, fg=COLOR_WHITE,
+                            relief=tk.FLAT, padx=30, pady=10, cursor="hand2",
+                            activebackground="#2980b9", activeforeground=COLOR_WHITE)
+    btn_analyze.pack(side=tk.LEFT, padx=(0, 10))
+
+    btn_save = tk.Button(button_frame, text="💾 결과 저장", command=save_results_to_excel_custom,
+                         font=("맑은 고딕", 11, "bold"), bg=COLOR_SUCCESS, fg=COLOR_WHITE,
+                         relief=tk.FLAT, padx=30, pady=10, cursor="hand2",
+                         activebackground="#229954", activeforeground=COLOR_WHITE)
+    btn_save.pack(side=tk.LEFT)
+
+    # 같은 보고서 파일에 다시 저장할 때 새 결과만 뒤에 추가
+    append_enabled = tk.BooleanVar(value=False)
+    tk.Checkbutton(button_frame, text="이어서 저장", variable=append_enabled,
+                   font=FONT_NORMAL, bg=COLOR_BG, fg=COLOR_TEXT,
+                   activebackground=COLOR_BG).pack(side=tk.LEFT, padx=(5, 0))
+
+    # 부트스트랩 신뢰구간 계산 여부
+    ci_enabled = tk.BooleanVar(value=False)
+    tk.Checkbutton(button_frame, text="95% 신뢰구간 (부트스트랩)", variable=ci_enabled,
+                   font=FONT_NORMAL, bg=COLOR_BG, fg=COLOR_TEXT,
+                   activebackground=COLOR_BG).pack(side=tk.LEFT, padx=(15, 0))
+
+    # 결측 처리 방식 (문항 분산과 합계 분산에 같은 응답자 기준 적용)
+    tk.Label(button_frame, text="결측:", font=FONT_NORMAL, bg=COLOR_BG, fg=COLOR_TEXT).pack(
+        side=tk.LEFT, padx=(10, 0))
+    missing_var = tk.StringVar(value=MISSING_LABELS[DEFAULT_MISSING])
+    ttk.Combobox(button_frame, textvariable=missing_var, values=list(MISSING_LABELS.values()),
+                 state="readonly", width=24, font=FONT_SMALL).pack(side=tk.LEFT, padx=(5, 0))
+
+    btn_cancel = tk.Button(button_frame, text="✕ 취소", command=lambda: runner.cancel(),
+                           font=FONT_NORMAL, bg=COLOR_ACCENT, fg=COLOR_WHITE,
+                           relief=tk.FLAT, padx=15, pady=10, cursor="hand2", state=tk.DISABLED,
+                           activebackground="#c0392b", activeforeground=COLOR_WHITE)
+    btn_cancel.pack(side=tk.RIGHT)
+
+    # 진행 상황 표시
+    progress_status = tk.StringVar(value="")
+    progressbar = ttk.Progressbar(button_frame, length=160, mode="determinate")
+    progressbar.pack(side=tk.RIGHT, padx=(10, 10))
+    tk.Label(button_frame, textvariable=progress_status, font=FONT_SMALL,
+             bg=COLOR_BG, fg="#7f8c8d").pack(side=tk.RIGHT)
+
+def build_option_sections(parent):
+    """집단별 분석, 문항 축약"""
+    global group_var, combo_group, reduce_target_var, reduce_method_var, btn_reduce
+    # 집단별 분석 (선택한 변수의 값마다 α를 함께 계산)
+    group_frame = tk.Frame(parent, bg=COLOR_BG)
+    group_frame.pack(fill=tk.X, pady=(0, 5))
+    tk.Label(group_frame, text="집단별 분석 - 집단 변수:", font=FONT_NORMAL, bg=COLOR_BG, fg=COLOR_TEXT).pack(
+        side=tk.LEFT)
+    group_var = tk.StringVar(value=NO_GROUP)
+    combo_group = ttk.Combobox(group_frame, textvariable=group_var, values=[NO_GROUP],
+                               state="readonly", width=20, font=FONT_SMALL)
+    combo_group.pack(side=tk.LEFT, padx=(5, 0))
+
+    # 문항 축약 (단축형 찾기)
+    reduce_frame = tk.Frame(parent, bg=COLOR_BG)
+    reduce_frame.pack(fill=tk.X, pady=(0, 10))
+    tk.Label(reduce_frame, text="문항 축약 - 남길 문항 수:", font=FONT_NORMAL, bg=COLOR_BG, fg=COLOR_TEXT).pack(
+        side=tk.LEFT)
+    reduce_target_var = tk.StringVar(value="6")
+    tk.Spinbox(reduce_frame, from_=2, to=999, textvariable=reduce_target_var, width=5,
+               font=FONT_NORMAL).pack(side=tk.LEFT, padx=(5, 10))
+    tk.Label(reduce_frame, text="방법:", font=FONT_NORMAL, bg=COLOR_BG, fg=COLOR_TEXT).pack(side=tk.LEFT)
+    reduce_method_var = tk.StringVar(value="greedy")
+    ttk.Combobox(reduce_frame, textvariable=reduce_method_var, values=REDUCTION_METHODS,
+                 state="readonly", width=12, font=FONT_SMALL).pack(side=tk.LEFT, padx=(5, 10))
+    btn_reduce = tk.Button(reduce_frame, text="✂ 문항 축약", command=reduce_scale,
+                           font=FONT_NORMAL, bg=COLOR_LIGHT_GRAY, fg=COLOR_TEXT,
+                           relief=tk.FLAT, padx=15, pady=5, cursor="hand2")
+    btn_reduce.pack(side=tk.LEFT)
+
+def build_result_section(parent):
+    """3. 현재 분석 결과"""
+    global text_result
+    result_frame = tk.LabelFrame(parent, text=" 3. 현재 분석 결과 ",
+                                 font=FONT_TITLE, bg=COLOR_WHITE, fg=COLOR_PRIMARY,
+                                 padx=15, pady=15, relief=tk.RIDGE, borderwidth=2)
+    result_frame.pack(fill=tk.X, pady=(0, 10))
+
+    result_text_frame = tk.Frame(result_frame, bg=COLOR_WHITE)
+    result_text_frame.pack(fill=tk.BOTH, expand=True)
+
+    scrollbar_result = tk.Scrollbar(result_text_frame, orient=tk.VERTICAL)
+    scrollbar_result.pack(side=tk.RIGHT, fill=tk.Y)
+
+    text_result = tk.Text(result_text_frame, font=FONT_NORMAL, height=6,
+                          relief=tk.SOLID, borderwidth=1, bg=COLOR_LIGHT_GRAY,
+                          yscrollcommand=scrollbar_result.set, wrap=tk.WORD)
+    text_result.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar_result.config(command=text_result.yview)
+
+def build_log_section(parent):
+    """4. 전체 결과 로그"""
+    global btn_new_log, log_view
+    log_frame = tk.LabelFrame(parent, text=" 4. 전체 결과 로그 ",
+                              font=FONT_TITLE, bg=COLOR_WHITE, fg=COLOR_PRIMARY,
+                              padx=15, pady=15, relief=tk.RIDGE, borderwidth=2)
+    log_frame.pack(fill=tk.BOTH, expand=True)
+
+    log_toolbar = tk.Frame(log_frame, bg=COLOR_WHITE)
+    log_toolbar.pack(fill=tk.X, pady=(0, 5))
+    tk.Label(log_toolbar, text="창을 닫아도 결과 로그가 남고, 같은 분석은 저장된 결과를 바로 불러옵니다.",
+             font=FONT_SMALL, bg=COLOR_WHITE, fg="#7f8c8d").pack(side=tk.LEFT)
+    btn_new_log = tk.Button(log_toolbar, text="새 로그 시작", command=start_new_log,
+                            font=FONT_SMALL, bg=COLOR_LIGHT_GRAY, fg=COLOR_TEXT,
+                            relief=tk.FLAT, padx=10, cursor="hand2")
+    btn_new_log.pack(side=tk.RIGHT)
+
+    # 결과는 요약 행으로 추가되고, 행을 펼치면 문항 제거 시 α가 표시됨
+    log_view = ResultsLogView(log_frame, alpha_key="Cronbach_alpha", bg=COLOR_WHITE)
+    log_view.pack(fill=tk.BOTH, expand=True)
+
+def build_window(multi_select=True):
+    """
+    창과 위젯 만들기 (mainloop는 실행하지 않음) → Tk 창
+    multi_select: 문항 리스트 다중 선택 (신뢰도_GUI.py는 False, 더블클릭한 문항 하나씩 추가)
+    """
+    global root, trace_panel, runner, analysis_server
+    root = tk.Tk()
+    root.title("신뢰도 분석 (크론바흐 알파)")
+    root.geometry("900x850")
+    root.configure(bg=COLOR_BG)
+
+    # 메인 컨테이너
+    main_container = tk.Frame(root, bg=COLOR_BG)
+    main_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+
+    build_file_section(main_container)
+    build_input_section(main_container, multi_select)
+    build_button_section(main_container)
+    build_option_sections(main_container)
+    build_result_section(main_container)
+    build_log_section(main_container)
+
+    # 성능 기록 (단계별 시간/메모리, 펼쳐서 보고 JSONL 또는 Chrome trace로 저장)
+    trace_panel = TracePanel(main_container, tracer, bg=COLOR_BG, font=FONT_SMALL)
+    trace_panel.pack(fill=tk.X, pady=(5, 0))
+
+    # 백그라운드 작업 실행기 (파일 읽기/분석/저장 중에도 창이 멈추지 않음)
+    runner = BackgroundRunner(root, progressbar=progressbar, status_var=progress_status, on_busy=set_busy)
+
+    address = server_address()
+    if address is not None:
+        analysis_server = AnalysisClient(address)
+        root.title(f"신뢰도 분석 (크론바흐 알파) - 분석 서버 {address}")
+
+    # 마지막 세션의 결과 로그는 창을 먼저 그린 뒤 불러옴
+    root.after_idle(restore_last_session)
+    return root
+
+def main(multi_select=True):
+    build_window(multi_select)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+결과 로그 항목 만들기와 표시/저장 형식 변환
+
+분석 결과(α, 문항 제거 시 α, 유효 N, 신뢰구간, 문항 축약, 집단별 결과)를 결과 로그 항목(dict)으로 만들고,
+화면 표시용 문자열과 보고서 파일의 한 행({열 이름: 값})으로 바꾼다.
+결과 로그 항목은 GUI, 일괄 분석(reliability_batch), 분석 서버와 결과 저장소가 같은 형식으로 쓴다.
+pandas는 표(results_table)를 만들 때만 불러온다 (GUI를 시작할 때는 불러오지 않음).
+"""
+from instrumentation import span
+
+# 결측 처리 방식의 화면 표시 이름
+MISSING_LABELS = {
+    "listwise": "결측 응답자 제외 (listwise)",
+    "pairwise": "문항 쌍별 제외 (pairwise)",
+    "mean": "평균으로 대체 (mean)",
+}
+
+
+def make_result(name, columns, alpha_value, removed_alpha_values, ci=None, n=None, missing=None, reduction=None,
+                groups=None):
+    """
+    결과 로그 항목 생성 (소수점 세 자리로 반올림)
+    ci: bootstrap.alpha_confidence_intervals 결과 (신뢰구간을 계산한 경우)
+    n: (전체 α의 유효 N, {문항명: 제거 시 유효 N}), missing: 결측 처리 방식
+    reduction: item_reduction.reduce_selection의 축약 정보 (문항 축약 결과인 경우)
+    groups: grouped.grouped_selection 결과 (집단별 신뢰도를 계산한 경우)
+    """
+    result = {
+        "문항명": name,
+        "문항 수": len(columns),
+        "Cronbach_alpha": round(alpha_value, 3),
+        "문항 제거 시 알파 값": {k: round(v, 3) for k, v in removed_alpha_values.items()}
+    }
+    if missing is not None:
+        result["결측 처리"] = missing
+    if n is not None:
+        result["유효 N"], result["문항 제거 시 유효 N"] = n[0], dict(n[1])
+    if reduction is not None:
+        result["문항 축약"] = {**reduction, "경로": [(label, k, round(a, 3)) for label, k, a in reduction["경로"]]}
+    if groups is not None:
+        result["집단별"] = {
+            "기준": groups["기준"],
+            "집단": [{
+                "집단": group_name,
+                "Cronbach_alpha": round(group_alpha, 3),
+                "문항 제거 시 알파 값": {k: round(v, 3) for k, v in group_removed.items()},
+                "유효 N": group_n[0],
+                "문항 제거 시 유효 N": dict(group_n[1]),
+            } for group_name, group_alpha, group_removed, group_n in groups["집단"]]
+        }
+    if ci is not None:
+        result["신뢰구간"] = round_ci(ci)
+    return result
+
+
+def round_ci(ci):
+    """신뢰구간 결과를 결과 로그 형식으로 변환 (소수점 세 자리로 반올림)"""
+    return {
+        "수준": ci["level"],
+        "alpha": tuple(round(v, 3) for v in ci["alpha"]),
+        "removed": {k: tuple(round(v, 3) for v in pair) for k, pair in ci["removed"].items()}
+    }
+
+
+def format_ci(pair):
+    """신뢰구간 표시 문자열 (e.g., '[0.764, 0.788]')"""
+    return f"[{pair[0]:.3f}, {pair[1]:.3f}]"
+
+
+def ci_label(result):
+    """신뢰구간 수준 표시 (e.g., '95% CI')"""
+    return f"{result['신뢰구간']['수준'] * 100:g}% CI"
+
+
+def reduction_summary(result):
+    """문항 축약 결과의 제거 순서 표시 (e.g., '희망3 → 희망5'), 전수 탐색은 제거 문항 목록"""
+    reduction = result["문항 축약"]
+    if reduction["경로"]:
+        return " → ".join(label for label, _, _ in reduction["경로"])
+    return ", ".join(reduction["제거 문항"])
+
+
+def results_table(results):
+    """결과 로그를 저장용 표(DataFrame)로 변환"""
+    import pandas as pd  # GUI를 시작할 때는 불러오지 않음
+
+    with span("export.table", rows=len(results)) as s:
+        rows = [result_row(result) for result in results]
+        df_results = pd.DataFrame(rows, columns=table_columns(rows))
+        # 빈 칸이 있어도 N은 정수로 표시
+        for col in df_results.columns:
+            if is_count_column(col):
+                df_results[col] = df_results[col].astype("Int64")
+        s.set(columns=len(df_results.columns))
+    return df_results
+
+
+def result_row(result):
+    """결과 로그 항목 하나 → 저장용 표의 한 행 ({열 이름: 값}, 값이 없는 열은 빠짐)"""
+    # 기본 정보
+    row_data = {
+        "변수": result["문항명"],
+        "문항 수": result["문항 수"],
+        "Cronbach's α": result["Cronbach_alpha"]
+    }
+    if "결측 처리" in result:
+        row_data["결측 처리"] = result["결측 처리"]
+    if "유효 N" in result:
+        row_data["유효 N"] = result["유효 N"]
+    if "문항 축약" in result:
+        reduction = result["문항 축약"]
+        row_data["축약"] = f"{reduction['방법']} ({reduction['원래 문항 수']} → {result['문항 수']}문항)"
+        row_data["제거 문항"] = reduction_summary(result)
+    # 문항 제거 시 N은 전체 N과 다를 때(pairwise)만 표시
+    removed_n = result.get("문항 제거 시 유효 N", {})
+    show_removed_n = any(value != result["유효 N"] for value in removed_n.values())
+
+    ci = result.get("신뢰구간")
+    if ci is not None:
+        label = ci_label(result)
+        row_data[f"α {label} 하한"], row_data[f"α {label} 상한"] = ci["alpha"]
+
+    # 각 문항 제거 시 알파 값을 추가
+    for item_name, alpha_value in result["문항 제거 시 알파 값"].items():
+        row_data[f"{item_name} 제거 시"] = alpha_value
+        if show_removed_n:
+            row_data[f"{item_name} 제거 시 N"] = removed_n[item_name]
+        if ci is not None:
+            row_data[f"{item_name} 제거 시 {label}"] = format_ci(ci["removed"][item_name])
+
+    # 집단별 결과는 집단마다 열을 붙인 넓은 표로 (e.g., '[성별=1] α', '[성별=1] 희망1 제거 시')
+    for group in result.get("집단별", {}).get("집단", []):
+        prefix = f"[{group['집단']}]"
+        row_data[f"{prefix} α"] = group["Cronbach_alpha"]
+        row_data[f"{prefix} N"] = group["유효 N"]
+        for item_name, alpha_value in group["문항 제거 시 알파 값"].items():
+            row_data[f"{prefix} {item_name} 제거 시"] = alpha_value
+    return row_data
+
+
+def table_columns(rows):
+    """행들의 열 이름 합집합 (처음 나온 순서)"""
+    columns = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return list(columns)
+
+
+def is_count_column(col):
+    """정수로 저장할 N 열인지 (e.g., '유효 N', '희망1 제거 시 N', '[성별=1] N')"""
+    return col == "유효 N" or col.endswith(" 제거 시 N") or (col.startswith("[") and col.endswith("] N"))
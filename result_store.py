@@ -0,0 +1,262 @@
+"""
+분석 결과 저장소 (SQLite)
+
+결과 로그 항목을 로컬 SQLite 파일에 한 행씩 저장해 창을 닫아도 남게 하고,
+같은 파일(내용 해시) + 같은 문항 + 같은 옵션의 분석은 저장된 결과를 바로 돌려준다 (memoization).
+결과 항목은 JSON으로 (문항명이 숫자인 dict 키와 tuple도 그대로 복원되도록 표시를 붙여), 검색에 쓰는 값(척도명, 문항 수, α, 결측 처리, 시각)은 색인된 열로 함께 저장하므로
+지난 결과를 검색할 때 모든 결과를 메모리에 올리지 않는다.
+
+시드 없이 계산한 부트스트랩 신뢰구간은 실행할 때마다 달라지므로 memo하지 않는다 (결과 로그에는 저장).
+
+세션은 결과 로그 하나에 해당한다. GUI는 시작할 때 마지막 GUI 세션의 로그를 다시 불러온다.
+
+환경 변수
+    RELIABILITY_RESULTS_DB    저장소 파일 경로 (기본값: 캐시 폴더/results.sqlite)
+    RELIABILITY_NO_STORE      1이면 저장소를 쓰지 않음
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from workbook_cache import cache_dir
+
+STORE_VERSION = 2  # 계산 방식이나 저장 형식이 바뀌면 올려서 이전 memo 키를 무효화
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    session INTEGER NOT NULL REFERENCES sessions(id),
+    memo_key TEXT,
+    dataset TEXT,
+    file TEXT,
+    name TEXT NOT NULL,
+    n_items INTEGER,
+    alpha REAL,
+    missing TEXT,
+    created REAL NOT NULL,
+    result TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exports (
+    session INTEGER NOT NULL REFERENCES sessions(id),
+    path TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (session, path)
+);
+CREATE INDEX IF NOT EXISTS results_session ON results(session, id);
+CREATE INDEX IF NOT EXISTS results_memo ON results(memo_key, id);
+CREATE INDEX IF NOT EXISTS results_name ON results(name);
+CREATE INDEX IF NOT EXISTS results_created ON results(created);
+"""
+
+_SUMMARY_COLUMNS = ("id", "session", "created", "file", "name", "n_items", "alpha", "missing")
+
+
+def store_path():
+    """저장소 파일 경로"""
+    return os.environ.get("RELIABILITY_RESULTS_DB") or os.path.join(cache_dir(), "results.sqlite")
+
+
+def store_enabled():
+    return os.environ.get("RELIABILITY_NO_STORE", "").strip().lower() not in ("1", "true", "yes")
+
+
+def memo_key(dataset, selection, analysis, **options):
+    """
+    분석 결과의 memo 키 - 다시 계산하면 결과가 달라지는 분석이면 None (lookup/add에 그대로 넘기면 됨)
+    dataset: 데이터 파일의 workbook_cache.file_fingerprint, selection: column_index.Selection
+    analysis: 분석 종류 (alpha, reduction), options: 결과에 영향을 주는 옵션 (결측 처리, 신뢰구간 등)
+    options["ci"]: 신뢰구간 옵션 {"method", "n_boot", "level", "seed"} - 시드 없는 부트스트랩은 memo하지 않음
+    """
+    ci = options.get("ci")
+    if ci is not None and ci.get("method", "bootstrap") == "bootstrap" and ci.get("seed") is None:
+        return None
+    payload = {
+        "version": STORE_VERSION,
+        "dataset": dataset,
+        "analysis": analysis,
+        "columns": [str(col) for col in selection.columns],
+        "reversed": sorted(str(col) for col in selection.reversed),
+        "options": options,
+    }
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+
+
+_ITEMS_TAG = "__dict_items__"  # 문자열이 아닌 키가 있는 dict → [[키, 값], ...]
+_TUPLE_TAG = "__tuple__"
+
+
+def _tagged(value):
+    """JSON으로 바꾸면 달라지는 값(문자열이 아닌 dict 키, tuple, numpy 수치)에 표시를 붙인 값"""
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _tagged(item) for key, item in value.items()}
+        return {_ITEMS_TAG: [[_tagged(key), _tagged(item)] for key, item in value.items()]}
+    if isinstance(value, tuple):
+        return {_TUPLE_TAG: [_tagged(item) for item in value]}
+    if isinstance(value, list):
+        return [_tagged(item) for item in value]
+    if hasattr(value, "item"):
+        return value.item()  # numpy 수치 → 파이썬 수치
+    return value
+
+
+def _untagged(obj):
+    if len(obj) == 1 and _ITEMS_TAG in obj:
+        return {key: item for key, item in obj[_ITEMS_TAG]}
+    if len(obj) == 1 and _TUPLE_TAG in obj:
+        return tuple(obj[_TUPLE_TAG])
+    return obj
+
+
+def _to_json(result):
+    return json.dumps(_tagged(result), ensure_ascii=False, default=str)
+
+
+def _from_json(text):
+    return json.loads(text, object_hook=_untagged)
+
+
+class ResultStore:
+    """
+    결과 저장소 연결 (만든 스레드에서만 사용)
+    path: SQLite 파일 경로 (기본값: store_path())
+    """
+
+    def __init__(self, path=None):
+        self.path = path or store_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # ------------------------------------------------------------ 세션
+
+    def new_session(self, source="gui"):
+        """새 결과 로그 시작 → 세션 번호 (source: gui, cli 등 - 마지막 세션을 찾을 때 구분)"""
+        with self._conn:
+            cursor = self._conn.execute("INSERT INTO sessions (source, created) VALUES (?, ?)",
+                                        (source, time.time()))
+        return cursor.lastrowid
+
+    def last_session(self, source="gui"):
+        """source의 마지막 세션 번호 (없으면 None)"""
+        row = self._conn.execute("SELECT MAX(id) FROM sessions WHERE source = ?", (source,)).fetchone()
+        return row[0]
+
+    def session_results(self, session):
+        """세션의 결과 로그 (저장 순서)"""
+        rows = self._conn.execute("SELECT result FROM results WHERE session = ? ORDER BY id", (session,))
+        return [_from_json(text) for text, in rows]
+
+    def saved_counts(self, session):
+        """세션의 보고서 파일별 저장한 결과 수 {파일 경로: 결과 수} (이어서 저장할 때 새 결과만 추가)"""
+        rows = self._conn.execute("SELECT path, count FROM exports WHERE session = ?", (session,))
+        return dict(rows.fetchall())
+
+    def set_saved_count(self, session, path, count):
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO exports (session, path, count) VALUES (?, ?, ?)",
+                               (session, path, count))
+
+    # ------------------------------------------------------------ 결과
+
+    def add(self, result, session, memo=None, dataset=None, file=None):
+        """결과 로그 항목 저장 → 결과 번호 (memo: memo_key, 다음에 같은 분석이면 lookup으로 재사용)"""
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO results (session, memo_key, dataset, file, name, n_items, alpha, missing, created,"
+                " result) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (session, memo, dataset, None if file is None else str(file), str(result["문항명"]),
+                 result["문항 수"], result["Cronbach_alpha"], result.get("결측 처리"), time.time(),
+                 _to_json(result)))
+        return cursor.lastrowid
+
+    def lookup(self, memo):
+        """memo 키로 저장된 가장 최근 결과 (없거나 memo가 None이면 None)"""
+        if memo is None:
+            return None
+        row = self._conn.execute("SELECT result FROM results WHERE memo_key = ? ORDER BY id DESC LIMIT 1",
+                                 (memo,)).fetchone()
+        return None if row is None else _from_json(row[0])
+
+    def result(self, result_id):
+        """결과 번호로 결과 항목 하나 (없으면 None)"""
+        row = self._conn.execute("SELECT result FROM results WHERE id = ?", (result_id,)).fetchone()
+        return None if row is None else _from_json(row[0])
+
+    def query(self, name=None, file=None, dataset=None, missing=None, min_alpha=None, max_alpha=None,
+              since=None, limit=None, full=False):
+        """
+        지난 결과 검색 (최근 것부터, 한 행씩 읽어 넘겨주는 generator)
+        name: 척도명 ('희망*'처럼 *는 임의 문자열), file: 파일 경로 일부, since: 이 시각(time.time()) 이후
+        full: True면 결과 항목 전체("result")도 포함, False면 요약 열만
+        """
+        conditions, params = [], []
+        if name is not None:
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(name))
+        if file is not None:
+            conditions.append("file LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(file)}%")
+        for column, value, op in (("dataset", dataset, "="), ("missing", missing, "="),
+                                  ("alpha", min_alpha, ">="), ("alpha", max_alpha, "<="), ("created", since, ">=")):
+            if value is not None:
+                conditions.append(f"{column} {op} ?")
+                params.append(value)
+
+        columns = ", ".join(_SUMMARY_COLUMNS + (("result",) if full else ()))
+        sql = f"SELECT {columns} FROM results"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        for row in self._conn.execute(sql, params):
+            record = dict(zip(_SUMMARY_COLUMNS, row))
+            if full:
+                record["result"] = _from_json(row[-1])
+            yield record
+
+    def count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like_pattern(name):
+    """'희망*' → '희망%' (* 외의 LIKE 특수 문자는 글자 그대로)"""
+    return "%".join(_escape_like(part) for part in name.split("*"))
+
+
+def open_store(path=None):
+    """저장소 열기 - 쓰지 않도록 설정했거나 열 수 없으면 None (분석은 저장소 없이 계속)"""
+    if path is None and not store_enabled():
+        return None
+    try:
+        return ResultStore(path)
+    except (sqlite3.Error, OSError):
+        return None
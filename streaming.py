@@ -0,0 +1,190 @@
+"""
+메모리에 올릴 수 없는 대용량 CSV의 스트리밍 신뢰도 분석
+
+파일을 청크 단위로 읽으면서 문항 쌍별 충분통계량(응답자 수, 합, 교차곱 합)만 누적한다.
+청크마다 자기 문항 평균을 기준값으로 빼고 합을 구하며, 합칠 때는 기준값 차이만큼 합과 교차곱을
+보정한 뒤 더한다 (Chan 등의 병합 공식을 쌍별 결측에 맞게 쓴 형태). 따라서 청크 통계량은 순서와
+무관하게(병렬로도) 합칠 수 있고, 최대 메모리는 청크 크기에만 비례한다.
+
+정밀도: 누적 통계량은 처음 합친 청크의 평균을 기준값으로 유지한다. 교차곱 합의 상쇄 오차는
+(전체 평균 - 기준값)² × 응답자 수 정도이므로 청크 평균이 전체 평균에서 표준편차의 몇 배 이상
+벗어나지 않는다는 가정(리커트 응답처럼 값의 범위가 좁은 설문 자료)에서 float64로 충분히 정확하다.
+
+결측 처리는 reliability와 같다. pairwise와 mean은 모든 척도 문항의 합집합 통계량 하나로
+계산하고, listwise는 척도마다 결측 없는 응답자가 다르므로 척도별 통계량을 같은 읽기에서 함께 누적한다.
+"""
+import warnings
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import span
+from reliability import DEFAULT_MISSING, alpha_from_covariance, covariance_from_moments, effective_n, pairwise_moments
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+class StreamingMoments:
+    """
+    병합 가능한 문항 쌍별 충분통계량
+    count: 응답자 수, shift: 합을 구하기 전에 뺀 문항별 기준값
+    n/sx/sxy: reliability.pairwise_moments와 같은 k×k 행렬 (기준값을 뺀 값의 합)
+    """
+
+    def __init__(self, n_items, shift=None):
+        self.count = 0
+        self.shift = np.zeros(n_items) if shift is None else np.asarray(shift, dtype=float)
+        self.n = np.zeros((n_items, n_items))
+        self.sx = np.zeros((n_items, n_items))
+        self.sxy = np.zeros((n_items, n_items))
+
+    @classmethod
+    def from_values(cls, values, shift=None, listwise=False):
+        """
+        청크 하나(응답자 × 문항 배열)의 통계량
+        shift: 기준값 (기본값: 청크의 문항 평균, 값이 없는 문항은 0)
+        listwise: 결측이 하나라도 있는 응답자는 제외
+        """
+        values = np.asarray(values, dtype=float)
+        if listwise:
+            values = values[~np.isnan(values).any(axis=1)]
+        if shift is None and values.shape[0]:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # 값이 없는 열
+                shift = np.nan_to_num(np.nanmean(values, axis=0))
+        stats = cls(values.shape[1], shift)
+        if values.shape[0] == 0:
+            return stats
+        stats.count = values.shape[0]
+        stats.n, stats.sx, stats.sxy = pairwise_moments(values, stats.shift)
+        return stats
+
+    def recentered(self, shift):
+        """
+        기준값을 shift로 바꾼 같은 통계량 (원자료 없이 합과 교차곱만 보정)
+        d = shift - 기존 기준값일 때 x - shift = (x - 기존 기준값) - d 이므로
+            sx'[i, j] = sx[i, j] - d_i n[i, j]
+            sxy'[i, j] = sxy[i, j] - d_i sx[j, i] - d_j sx[i, j] + d_i d_j n[i, j]
+        """
+        shift = np.asarray(shift, dtype=float)
+        d = shift - self.shift
+        moved = StreamingMoments(len(shift), shift)
+        moved.count = self.count
+        moved.n = self.n.copy()
+        moved.sx = self.sx - d[:, None] * self.n
+        moved.sxy = self.sxy - d[:, None] * self.sx.T - d[None, :] * self.sx + np.outer(d, d) * self.n
+        return moved
+
+    def merge(self, other):
+        """
+        다른 청크의 통계량을 합친 새 통계량
+        기준값이 다르면 other를 이 통계량의 기준값으로 옮긴 뒤 더한다 (이 통계량이 비어 있으면 other의 기준값).
+        """
+        if not self.count:
+            return other
+        if other.count and not np.array_equal(self.shift, other.shift):
+            other = other.recentered(self.shift)
+        merged = StreamingMoments(len(self.shift), self.shift)
+        merged.count = self.count + other.count
+        merged.n = self.n + other.n
+        merged.sx = self.sx + other.sx
+        merged.sxy = self.sxy + other.sxy
+        return merged
+
+    def covariance(self, indices=None, signs=None, missing=DEFAULT_MISSING):
+        """
+        (공분산 행렬, 유효 N 행렬) - reliability.item_covariance와 같은 형식
+        indices: 일부 문항만 사용할 때의 위치 리스트
+        signs: 문항별 부호 (역코딩 문항은 -1)
+        listwise는 listwise=True로 누적한 통계량(또는 결측이 없는 문항)에서만 계산할 수 있음
+        """
+        if indices is None:
+            indices = np.arange(len(self.shift))
+        idx = np.ix_(indices, indices)
+        cov, n = covariance_from_moments(self.n[idx], self.sx[idx], self.sxy[idx], self.count, missing)
+        if signs is not None:
+            cov = cov * np.outer(signs, signs)
+        return cov, n
+
+    def reliability(self, indices=None, signs=None, missing=DEFAULT_MISSING):
+        """통계량만으로 (전체 α, 문항 제거 시 α 배열, (전체 α의 N, 문항 제거 시 N 배열)) 계산"""
+        cov, n = self.covariance(indices, signs, missing)
+        alpha, removed_alpha = alpha_from_covariance(cov)
+        return float(alpha), removed_alpha, effective_n(n)
+
+
+def _chunk_moments(values, column_sets, listwise):
+    return [StreamingMoments.from_values(values[:, positions], listwise=listwise) for positions in column_sets]
+
+
+def stream_moment_sets(file_path, column_sets, chunksize=DEFAULT_CHUNKSIZE, executor=None, listwise=False):
+    """
+    CSV 파일을 한 번 읽으며 문항 묶음(column_sets)마다 충분통계량 계산
+    executor: concurrent.futures 실행기를 주면 청크 통계량을 병렬로 계산
+              (메모리 한도를 지키기 위해 동시에 처리 중인 청크 수를 제한)
+    listwise: 묶음마다 결측이 하나라도 있는 응답자 제외
+    반환: column_sets 순서의 StreamingMoments 리스트
+    """
+    column_sets = [list(columns) for columns in column_sets]
+    union = list(dict.fromkeys(col for columns in column_sets for col in columns))
+    header = pd.read_csv(file_path, nrows=0).columns
+    missing = [col for col in union if col not in header]
+    if missing:
+        raise ValueError(f"데이터에 없는 문항: {', '.join(missing)}")
+    position = {col: i for i, col in enumerate(union)}
+    set_positions = [np.array([position[col] for col in columns], dtype=int) for columns in column_sets]
+
+    with span("stream", columns=len(union), sets=len(column_sets), chunksize=chunksize) as record:
+        chunks = _read_chunks(file_path, union, chunksize, record)
+        return _accumulate(chunks, set_positions, executor, listwise)
+
+
+def _read_chunks(file_path, columns, chunksize, record):
+    """청크마다 (행 수 × 문항 수) 배열 생성 (지금까지 읽은 행 수를 record에 기록)"""
+    rows = 0
+    for chunk in pd.read_csv(file_path, usecols=columns, chunksize=chunksize):
+        rows += len(chunk)
+        record.set(rows=rows)
+        yield chunk[columns].to_numpy(dtype=float, na_value=np.nan)
+
+
+def _accumulate(chunks, set_positions, executor, listwise):
+    """청크 통계량을 묶음별로 누적 (청크마다 자기 평균을 기준값으로 계산한 뒤 merge로 보정해 합침)"""
+
+    def merge(totals, parts):
+        return [total.merge(part) for total, part in zip(totals, parts)]
+
+    totals = [StreamingMoments(len(positions)) for positions in set_positions]
+    if executor is None:
+        for values in chunks:
+            totals = merge(totals, _chunk_moments(values, set_positions, listwise))
+        return totals
+
+    max_pending = 2 * getattr(executor, "_max_workers", 2)
+    pending = deque()
+    for values in chunks:
+        pending.append(executor.submit(_chunk_moments, values, set_positions, listwise))
+        if len(pending) >= max_pending:
+            totals = merge(totals, pending.popleft().result())
+    while pending:
+        totals = merge(totals, pending.popleft().result())
+    return totals
+
+
+def stream_moments(file_path, columns, chunksize=DEFAULT_CHUNKSIZE, executor=None, listwise=False):
+    """CSV 파일을 청크 단위로 읽어 columns의 충분통계량 계산"""
+    return stream_moment_sets(file_path, [columns], chunksize, executor, listwise)[0]
+
+
+def stream_reliability(file_path, columns, chunksize=DEFAULT_CHUNKSIZE, executor=None, missing=DEFAULT_MISSING):
+    """
+    스트리밍 방식의 전체 α와 문항 제거 시 α
+    반환: (전체 α, {문항명: 제거 시 α}, (전체 α의 N, {문항명: 제거 시 N}))
+    """
+    if len(columns) < 2:
+        raise ValueError("문항이 2개 이상 필요합니다.")
+    moments = stream_moments(file_path, columns, chunksize, executor, listwise=missing == "listwise")
+    alpha, removed_alpha, (total_n, removed_n) = moments.reliability(missing=missing)
+    return (alpha, {col: float(value) for col, value in zip(columns, removed_alpha)},
+            (total_n, {col: int(value) for col, value in zip(columns, removed_n)}))
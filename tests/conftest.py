@@ -0,0 +1,47 @@
+"""
+테스트 공통 준비
+
+모듈들이 저장소 최상위에 있으므로 최상위 폴더를 sys.path에 넣고, 결측이 섞인 가상 설문을 만든다.
+캐시는 테스트마다 임시 폴더를 쓴다.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """파싱 캐시와 서버 토큰 파일을 임시 폴더에 (사용자 캐시 폴더를 건드리지 않음)"""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("RELIABILITY_CACHE_DIR", str(path))
+    monkeypatch.delenv("RELIABILITY_SERVER_TOKEN", raising=False)
+    monkeypatch.delenv("RELIABILITY_SERVER_TOKEN_FILE", raising=False)
+    return path
+
+
+@pytest.fixture
+def survey():
+    """요인 하나를 공유하는 5점 척도 설문 (응답자 300명, 문항1..문항10, 결측 5%, 집단 1..2)"""
+    rng = np.random.default_rng(1)
+    loadings = rng.uniform(0.4, 0.9, 10)
+    factor = rng.standard_normal((300, 1))
+    scores = factor * loadings + rng.standard_normal((300, 10)) * np.sqrt(1 - loadings ** 2)
+    values = np.clip(np.round(scores * 1.2 + 3), 1, 5)
+    values[rng.random(values.shape) < 0.05] = np.nan
+    data = pd.DataFrame(values, columns=[f"문항{i}" for i in range(1, 11)])
+    data["집단"] = rng.integers(1, 3, 300)
+    return data
+
+
+@pytest.fixture
+def survey_csv(tmp_path, survey):
+    path = tmp_path / "survey.csv"
+    survey.to_csv(path, index=False)
+    return path
@@ -0,0 +1,223 @@
+"""분석 서버(analysis_server)를 port 0으로 띄워 클라이언트와 HTTP로 확인"""
+import http.client
+import json
+import threading
+
+import pytest
+
+from analysis_client import AnalysisClient, ServerError
+from analysis_server import AnalysisService, make_server
+from column_index import SelectionError
+from reliability import reliability_analysis
+
+ITEMS = [f"문항{i}" for i in range(1, 11)]
+
+
+@pytest.fixture
+def start_server(tmp_path):
+    """start_server(**AnalysisService 옵션) → (서버, 클라이언트), 테스트가 끝나면 종료"""
+    started = []
+
+    def start(**options):
+        service = AnalysisService(root=str(tmp_path), **options)
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        started.append((server, service))
+        client = AnalysisClient("http://127.0.0.1:%d" % server.server_address[1], timeout=60, token=server.token)
+        return server, client
+
+    yield start
+    for server, service in started:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+@pytest.fixture
+def running(start_server):
+    return start_server(workers=2, queue=8)
+
+
+@pytest.fixture
+def server(running):
+    return running[0]
+
+
+@pytest.fixture
+def client(running):
+    return running[1]
+
+
+@pytest.fixture
+def workbook(client, survey_csv):
+    return client.load(survey_csv.name)
+
+
+def raw_post(server, path, body, content_type="application/json", token=None):
+    """클라이언트를 거치지 않은 요청 → (상태 코드, 응답 JSON)"""
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+    headers = {"Content-Type": content_type, "Authorization": f"Bearer {token or server.token}"}
+    try:
+        connection.request("POST", path, body, headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def local_reliability(survey, columns, missing):
+    return reliability_analysis(survey[columns], missing)
+
+
+# ------------------------------------------------------------ 엔드포인트
+
+
+def test_load_describes_dataset(client, survey_csv):
+    workbook = client.load(survey_csv.name)
+    assert workbook.columns == ITEMS + ["집단"]
+    assert workbook.file_path == str(survey_csv)
+    assert client.load(str(survey_csv)).dataset == workbook.dataset  # 이미 상주 중이면 같은 데이터
+    assert [info["dataset"] for info in client.datasets()] == [workbook.dataset]
+
+
+def test_resolve(workbook):
+    selection = workbook.resolve("문항1, 문항2(R), 문항3 to 문항4")
+    assert selection.columns == ["문항1", "문항2", "문항3", "문항4"]
+    assert selection.reversed == frozenset({"문항2"})
+
+
+@pytest.mark.parametrize("missing", ["listwise", "pairwise", "mean"])
+def test_item_deleted_matches_local(workbook, survey, missing):
+    result = workbook.item_deleted("문항1 to 문항6", missing=missing)
+    alpha, removed, (n, removed_n) = local_reliability(survey, ITEMS[:6], missing)
+    assert result["alpha"] == pytest.approx(alpha, rel=1e-9)
+    assert result["removed"] == pytest.approx(removed, rel=1e-9)
+    assert (result["n"], result["removed_n"]) == (n, removed_n)
+
+
+def test_alpha_with_groups_and_ci(workbook, survey):
+    result = workbook.alpha("문항1 to 문항5", name="척도", missing="pairwise",
+                            ci={"n_boot": 50, "seed": 1}, group_by=["집단"])
+    assert result["문항명"] == "척도"
+    assert result["Cronbach_alpha"] == round(local_reliability(survey, ITEMS[:5], "pairwise")[0], 3)
+    assert len(result["집단별"]["집단"]) == 2
+    assert "신뢰구간" in result
+
+
+def test_reduce(workbook):
+    result = workbook.reduce("문항1 to 문항8", target=4, method="beam", beam_width=3)
+    assert result["문항 수"] == 4
+    assert len(result["문항 축약"]["제거 문항"]) == 4
+
+
+def test_batch_after_partial_load(workbook, survey):
+    # 일부 열만 읽은 뒤 batch가 나머지 열을 load()로 한꺼번에 읽어도 통계량이 최신이어야 함
+    workbook.item_deleted(ITEMS[:3])
+    results = workbook.client.batch([
+        workbook.request("item-deleted", "문항4 to 문항10"),
+        workbook.request("item-deleted", "문항2 to 문항7", missing="pairwise"),
+        workbook.request("alpha", "문항1, 없는문항"),
+    ])
+    assert results[0]["alpha"] == pytest.approx(local_reliability(survey, ITEMS[3:], "listwise")[0], rel=1e-9)
+    assert results[1]["alpha"] == pytest.approx(local_reliability(survey, ITEMS[1:7], "pairwise")[0], rel=1e-9)
+    assert isinstance(results[2], SelectionError)
+
+
+def test_export_inside_root(client, workbook, tmp_path):
+    result = workbook.alpha("문항1 to 문항4")
+    assert client.export([result, result], str(tmp_path / "out.csv")) == 2
+    assert (tmp_path / "out.csv").exists()
+
+
+@pytest.mark.parametrize("path", ["../outside.csv", "/tmp/outside.csv"])
+def test_export_outside_root_forbidden(server, workbook, tmp_path, path):
+    status, payload = raw_post(server, "/export", json.dumps({"results": [], "path": path}).encode())
+    assert status == 403
+    assert "허용된 폴더" in payload["error"]
+    assert not (tmp_path.parent / "outside.csv").exists()
+
+
+def test_load_outside_root_forbidden(server):
+    status, _ = raw_post(server, "/load", json.dumps({"path": "/etc/passwd"}).encode())
+    assert status == 403
+
+
+def test_load_missing_file(client):
+    with pytest.raises(ServerError) as info:
+        client.load("없는파일.csv")
+    assert info.value.status == 404
+
+
+# ------------------------------------------------------------ 인증과 잘못된 요청
+
+
+def test_requires_token(server, survey_csv):
+    status, payload = raw_post(server, "/load", b'{"path": "survey.csv"}', token="wrong")
+    assert status == 401
+    with pytest.raises(ServerError) as info:
+        AnalysisClient("http://127.0.0.1:%d" % server.server_address[1], token="wrong").health()
+    assert info.value.status == 401
+
+
+def test_client_reads_token_file(server, cache_dir):
+    (cache_dir / "server.token").parent.mkdir(parents=True, exist_ok=True)
+    (cache_dir / "server.token").write_text(server.token, encoding="utf-8")
+    assert AnalysisClient("http://127.0.0.1:%d" % server.server_address[1]).health()["status"] == "ok"
+
+
+def test_rejects_non_json_content_type(server, survey_csv):
+    status, _ = raw_post(server, "/load", b'{"path": "survey.csv"}', content_type="text/plain")
+    assert status == 415
+
+
+@pytest.mark.parametrize("body", [b"{", b"[1, 2]", b"\xff"])
+def test_bad_json(server, body):
+    status, payload = raw_post(server, "/load", body)
+    assert status == 400
+    assert payload["error"]
+
+
+@pytest.mark.parametrize("op, body, field", [
+    ("alpha", {"spec": 5}, "spec"),
+    ("reduce", {"spec": "문항1 to 문항6", "target": "abc"}, "target"),
+    ("reduce", {"spec": "문항1 to 문항6", "target": True}, "target"),
+    ("alpha", {"columns": "문항1"}, "columns"),
+    ("alpha", {"spec": "문항1 to 문항6", "group_by": "집단"}, "group_by"),
+    ("alpha", {"spec": "문항1 to 문항6", "ci": {"n_boot": "많이"}}, "n_boot"),
+    ("alpha", {"spec": "문항1 to 문항6", "name": 3}, "name"),
+])
+def test_bad_types(workbook, op, body, field):
+    with pytest.raises(ValueError, match=f'"{field}"'):
+        workbook.client.post(op, dataset=workbook.dataset, **body)
+
+
+def test_unknown_dataset(client):
+    with pytest.raises(ServerError) as info:
+        client.post("alpha", dataset="없음", spec="문항1 to 문항3")
+    assert info.value.status == 404
+
+
+def test_queue_full_returns_503(start_server, survey_csv):
+    server, client = start_server(workers=1, queue=0)
+    workbook = client.load(survey_csv.name)
+    release = threading.Event()
+    busy = server.service._run(release.wait)  # 하나뿐인 자리를 차지
+    try:
+        with pytest.raises(ServerError) as info:
+            workbook.item_deleted("문항1 to 문항3")
+        assert info.value.status == 503
+    finally:
+        release.set()
+        busy.result(timeout=10)
+    assert workbook.item_deleted("문항1 to 문항3")["alpha"]
+
+
+def test_refuses_remote_host():
+    service = AnalysisService(workers=1)
+    try:
+        with pytest.raises(ValueError):
+            make_server(service, host="0.0.0.0", port=0)
+        with pytest.raises(ValueError):
+            make_server(service, host="0.0.0.0", port=0, allow_remote=True)  # 토큰도 직접 주어야 함
+    finally:
+        service.close()
@@ -0,0 +1,70 @@
+"""bootstrap: 가중합으로 구한 α가 재표본 자료를 직접 계산한 값과 같은지 확인"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from bootstrap import _alpha_from_sums, _features, _prepare, _weighted_sums, alpha_confidence_intervals
+from reliability import alpha_from_covariance, item_covariance
+
+COLUMNS = [f"문항{i}" for i in range(1, 7)]
+
+
+@pytest.fixture
+def values(survey):
+    return survey[COLUMNS].to_numpy()
+
+
+def direct_alpha(values, missing="pairwise"):
+    return alpha_from_covariance(item_covariance(values, missing)[0])
+
+
+@pytest.mark.parametrize("missing", ["listwise", "pairwise", "mean"])
+def test_weighted_sums_match_resampled_data(values, missing):
+    prepared, pairwise = _prepare(values, missing)
+    assert pairwise == (missing == "pairwise")
+    features = _features(prepared, pairwise)
+    weights = np.random.default_rng(0).integers(0, 3, size=(4, len(prepared))).astype(float)
+    sums = _weighted_sums(features, weights, pairwise)
+    assert sums.shape == (4, 3 * len(COLUMNS) ** 2 if pairwise else 3 * len(COLUMNS) + 2)
+    alphas, removed = _alpha_from_sums(sums, weights.sum(axis=1), len(COLUMNS), pairwise)
+    for w, alpha, row in zip(weights, alphas, removed):
+        expected_alpha, expected_removed = direct_alpha(np.repeat(prepared, w.astype(int), axis=0))
+        assert alpha == pytest.approx(expected_alpha, rel=1e-10)
+        np.testing.assert_allclose(row, expected_removed, rtol=1e-10)
+
+
+@pytest.mark.parametrize("missing", ["listwise", "pairwise", "mean"])
+def test_jackknife_matches_leave_one_out(values, missing):
+    values = values[:60]
+    ci = alpha_confidence_intervals(values, COLUMNS, "jackknife", missing=missing)
+
+    prepared, _ = _prepare(values, missing)
+    estimate = direct_alpha(prepared)[0]
+    replicates = np.array([direct_alpha(np.delete(prepared, i, axis=0))[0] for i in range(len(prepared))])
+    n = len(prepared)
+    se = np.sqrt((n - 1) / n * ((replicates - replicates.mean()) ** 2).sum())
+    z = 1.959963984540054
+    assert ci["alpha"] == pytest.approx((estimate - z * se, estimate + z * se), rel=1e-8)
+
+
+def test_bootstrap_does_not_depend_on_executor(values):
+    serial = alpha_confidence_intervals(values, COLUMNS, n_boot=200, seed=3, missing="pairwise")
+    with ThreadPoolExecutor(2) as executor:
+        threaded = alpha_confidence_intervals(values, COLUMNS, n_boot=200, seed=3, executor=executor,
+                                              missing="pairwise")
+    assert serial == threaded
+    low, high = serial["alpha"]
+    assert low < direct_alpha(values)[0] < high
+
+
+def test_unknown_method(values):
+    with pytest.raises(ValueError, match="신뢰구간 방법"):
+        alpha_confidence_intervals(values, COLUMNS, "bayes")
+
+
+@pytest.mark.parametrize("method", ["bootstrap", "jackknife"])
+def test_no_complete_rows(method):
+    values = np.array([[1.0, np.nan], [np.nan, 2.0], [3.0, np.nan]])
+    with pytest.raises(ValueError, match="응답자가 없습니다"):
+        alpha_confidence_intervals(values, ["a", "b"], method, n_boot=10, missing="listwise")
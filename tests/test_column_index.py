@@ -0,0 +1,85 @@
+"""column_index: 문항 선택 입력 해석 (처음 GUI에서 쓰던 입력 형식 포함)"""
+import pytest
+
+from column_index import ColumnIndex, SelectionError
+
+COLUMNS = ["ID"] + [f"희망{i}" for i in range(1, 13)] + ["불안01", "불안02", "불안03", "Q1[a]", "Q1[b]", "from to end"]
+
+
+@pytest.fixture
+def index():
+    return ColumnIndex(COLUMNS)
+
+
+def resolved(index, spec):
+    return index.resolve(spec).columns
+
+
+@pytest.mark.parametrize("spec", ["희망1 to 희망6", "희망1to희망6", "희망1 TO 희망6", "희망1  to희망6"])
+def test_range_with_or_without_spaces(index, spec):
+    assert resolved(index, spec) == [f"희망{i}" for i in range(1, 7)]
+
+
+def test_range_over_two_digit_numbers(index):
+    assert resolved(index, "희망9 to 희망12") == ["희망9", "희망10", "희망11", "희망12"]
+
+
+def test_zero_padded_range(index):
+    assert resolved(index, "불안01 to 불안03") == ["불안01", "불안02", "불안03"]
+    with pytest.raises(SelectionError, match="불안1.*자릿수가 다른 문항: 불안01"):
+        index.resolve("불안1 to 불안3")
+
+
+def test_range_never_substitutes_same_number():
+    # 희망01과 희망1이 함께 있으면 입력한 문항명 그대로 사용
+    index = ColumnIndex(["희망01", "희망1", "희망2", "희망3", "희망02"])
+    assert resolved(index, "희망1 to 희망3") == ["희망1", "희망2", "희망3"]
+    assert resolved(index, "희망01 to 희망02") == ["희망01", "희망02"]
+    with pytest.raises(SelectionError, match="희망03"):
+        index.resolve("희망01 to 희망03")
+
+
+def test_exact_names_win_over_patterns(index):
+    assert resolved(index, "Q1[a], from to end") == ["Q1[a]", "from to end"]
+    assert resolved(index, "Q1*") == ["Q1[a]", "Q1[b]"]  # 같은 이름이 없으면 와일드카드
+
+
+def test_wildcards(index):
+    assert resolved(index, "불안*") == ["불안01", "불안02", "불안03"]
+    assert resolved(index, "희망?, -희망5") == ["희망1", "희망2", "희망3", "희망4", "희망6", "희망7", "희망8", "희망9"]
+
+
+def test_exclusions_and_reverse_markers(index):
+    selection = index.resolve("희망1 to 희망6, -희망3, !희망5, 불안02(R), 희망10(역)")
+    assert selection.columns == ["희망1", "희망2", "희망4", "희망6", "불안02", "희망10"]
+    assert selection.reversed == frozenset({"불안02", "희망10"})
+    assert selection.labels()[-2:] == ["불안02(R)", "희망10(R)"]
+
+    selection = index.resolve(["희망1 to 희망4(R)", "-희망2"])  # 범위 전체를 역코딩한 뒤 하나 제외
+    assert selection.reversed == frozenset({"희망1", "희망3", "희망4"})
+
+
+def test_all_errors_are_reported_together(index):
+    with pytest.raises(SelectionError) as info:
+        index.resolve("희망1, 희망1, 희망13, -희망7, 없는*, 희망3 to 불안03, 희망6 to 희망2, 가 to 나")
+    messages = info.value.errors
+    assert len(messages) == 7
+    assert "두 번 이상" in messages[0]
+    assert "데이터에 없는 문항입니다. ('희망' 문항 번호: 1~12)" in messages[1]
+    assert "앞에서 선택되지 않았습니다" in messages[2]
+    assert "일치하는 문항이 없습니다" in messages[3]
+    assert "시작과 끝 문항명이 일치해야" in messages[4]
+    assert "시작 번호가 끝 번호보다 큽니다" in messages[5]
+    assert "번호로 끝나야" in messages[6]
+
+
+def test_needs_two_items(index):
+    with pytest.raises(SelectionError, match="2개 이상"):
+        index.resolve("희망1")
+
+
+def test_search_and_family(index):
+    assert [COLUMNS[i] for i in index.search("희망1")] == ["희망1", "희망10", "희망11", "희망12"]
+    assert [COLUMNS[i] for i in index.search("희망12")] == ["희망12"]  # 이전 결과 안에서 다시 찾기
+    assert index.family_of("불안02") == ["불안01", "불안02", "불안03"]
+    assert index.family_of("ID") == ["ID"]
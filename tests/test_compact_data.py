@@ -0,0 +1,58 @@
+"""compact_data: 압축한 데이터의 값과 통계량이 원래 DataFrame과 같은지 확인"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from compact_data import CompactData
+from dataset_stats import DatasetStats
+
+ITEMS = [f"문항{i}" for i in range(1, 11)]
+
+
+@pytest.fixture
+def mixed(survey):
+    """압축할 수 있는 문항 + 소수 열 + 범위가 넓은 정수 열 + 문자열 열"""
+    rng = np.random.default_rng(0)
+    data = survey.copy()
+    data["점수"] = rng.normal(50, 10, len(data))
+    data["소득"] = rng.integers(0, 10_000, len(data))
+    data["이름"] = "가"
+    return data
+
+
+def test_values_round_trip(mixed):
+    compact = CompactData.from_frame(mixed)
+    numeric = ITEMS + ["집단", "점수", "소득"]
+    np.testing.assert_array_equal(compact.values(numeric), mixed[numeric].to_numpy(dtype=float))
+    pd.testing.assert_frame_equal(compact.frame(["집단", "이름"]), mixed[["집단", "이름"]], check_dtype=False)
+    # 응답 한 칸에 float64 8바이트 → 코드 1바이트 + 결측 비트
+    assert CompactData.from_frame(mixed[ITEMS]).nbytes < mixed[ITEMS].memory_usage(index=False).sum() / 6
+
+
+@pytest.mark.parametrize("missing", ["listwise", "pairwise", "mean"])
+@pytest.mark.parametrize("block_size", [3, 64])
+def test_stats_match_dataframe(mixed, missing, block_size):
+    columns = ["점수", "문항3", "문항8", "소득", "문항1", "문항10", "문항5"]
+    reverse = {"문항8"}
+    from_frame = DatasetStats(mixed, block_size=block_size).covariance(columns, reverse, missing)
+    from_compact = DatasetStats(CompactData.from_frame(mixed), block_size=block_size).covariance(columns, reverse,
+                                                                                                  missing)
+    np.testing.assert_allclose(from_compact[0], from_frame[0], rtol=1e-10)
+    np.testing.assert_array_equal(from_compact[1], from_frame[1])
+
+
+def test_concat_then_add_columns(mixed):
+    # lazy_workbook이 압축 모드에서 열을 덧붙이는 방식
+    first, rest = CompactData.from_frame(mixed[ITEMS[:5]]), CompactData.from_frame(mixed[ITEMS[5:] + ["점수"]])
+    stats = DatasetStats(first, block_size=4)
+    stats.covariance(ITEMS[:5], missing="pairwise")
+    stats.add_columns(first.concat(rest))
+    cov, _ = stats.covariance(ITEMS + ["점수"], missing="pairwise")
+    expected, _ = DatasetStats(mixed).covariance(ITEMS + ["점수"], missing="pairwise")
+    np.testing.assert_allclose(cov, expected, rtol=1e-10)
+
+
+def test_non_numeric_column(mixed):
+    stats = DatasetStats(CompactData.from_frame(mixed))
+    with pytest.raises(ValueError, match="숫자가 아닌 값"):
+        stats.covariance(["문항1", "이름"])
@@ -0,0 +1,92 @@
+"""dataset_stats: 블록 캐시에서 모은 통계량이 선택한 문항만으로 새로 계산한 값과 같은지 확인"""
+import numpy as np
+import pytest
+
+from dataset_stats import DatasetStats
+from reliability import item_covariance, reliability_analysis
+
+MODES = ["listwise", "pairwise", "mean"]
+
+
+def reversed_values(data, columns, reverse):
+    values = data[columns].to_numpy(dtype=float, copy=True)
+    for j, col in enumerate(columns):
+        if col in reverse:
+            values[:, j] = np.nanmin(values[:, j]) + np.nanmax(values[:, j]) - values[:, j]
+    return values
+
+
+@pytest.fixture
+def stats(survey):
+    return DatasetStats(survey, block_size=4)  # 문항 10개 + 집단 → 블록 3개
+
+
+@pytest.mark.parametrize("missing", MODES)
+def test_covariance_matches_item_covariance(stats, survey, missing):
+    # 블록 경계를 넘고 순서가 섞인 선택
+    columns = ["문항9", "문항2", "문항5", "문항1", "문항10"]
+    cov, n = stats.covariance(columns, missing=missing)
+    expected_cov, expected_n = item_covariance(survey[columns].to_numpy(), missing)
+    np.testing.assert_allclose(cov, expected_cov, rtol=1e-10)
+    np.testing.assert_array_equal(n, expected_n)
+
+
+@pytest.mark.parametrize("missing", MODES)
+def test_reverse_coding(stats, survey, missing):
+    columns = [f"문항{i}" for i in range(1, 8)]
+    reverse = {"문항2", "문항6"}
+    cov, _ = stats.covariance(columns, reverse, missing)
+    expected, _ = item_covariance(reversed_values(survey, columns, reverse), missing)
+    np.testing.assert_allclose(cov, expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("missing", MODES)
+def test_reliability_matches_fresh_analysis(stats, survey, missing):
+    columns = [f"문항{i}" for i in range(3, 11)]
+    alpha, removed, n = stats.reliability(columns, missing=missing)
+    expected_alpha, expected_removed, expected_n = reliability_analysis(survey[columns], missing)
+    assert alpha == pytest.approx(expected_alpha, rel=1e-10)
+    assert removed == pytest.approx(expected_removed, rel=1e-10)
+    assert n == expected_n
+
+
+def test_blocks_are_reused(stats):
+    stats.covariance(["문항1", "문항5"])
+    cached = dict(stats._cross)
+    stats.covariance(["문항2", "문항6", "문항1"], missing="pairwise")
+    # 같은 블록만 쓰면 다시 계산하지 않음
+    assert stats._cross.keys() == cached.keys()
+    assert all(stats._cross[pair] is cached[pair] for pair in cached)
+
+
+def test_unknown_and_non_numeric_columns(survey):
+    data = survey.assign(이름="가")
+    stats = DatasetStats(data, block_size=4)
+    with pytest.raises(ValueError, match="데이터에 없는 문항"):
+        stats.covariance(["문항1", "없음"])
+    with pytest.raises(ValueError, match="숫자가 아닌 값"):
+        stats.covariance(["문항1", "이름"])
+
+
+# ------------------------------------------------------------ 열 추가 (lazy_workbook)
+
+
+@pytest.mark.parametrize("first_columns", [3, 4, 6])  # 마지막 블록이 일부만 찬 경우와 꽉 찬 경우
+def test_add_columns_matches_fresh_item_covariance(survey, first_columns):
+    items = [f"문항{i}" for i in range(1, 11)]
+    stats = DatasetStats(survey[items[:first_columns]], block_size=4)
+    stats.covariance(items[:first_columns], missing="pairwise")  # 기존 블록을 미리 계산
+    stats.add_columns(survey[items])
+    for missing in MODES:
+        cov, n = stats.covariance(items, missing=missing)
+        expected_cov, expected_n = item_covariance(survey[items].to_numpy(), missing)
+        np.testing.assert_allclose(cov, expected_cov, rtol=1e-10)
+        np.testing.assert_array_equal(n, expected_n)
+
+
+def test_add_columns_requires_same_rows_and_prefix(survey):
+    stats = DatasetStats(survey[["문항1", "문항2"]])
+    with pytest.raises(ValueError):
+        stats.add_columns(survey[["문항2", "문항1", "문항3"]])
+    with pytest.raises(ValueError):
+        stats.add_columns(survey[["문항1", "문항2", "문항3"]].iloc[:10])
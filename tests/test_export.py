@@ -0,0 +1,130 @@
+"""export: 형식별 저장과 추가(append), 열이 다른 행 추가, 저장 중 오류 시 기존 파일 유지"""
+import os
+
+import pytest
+
+from export import _READERS, export_results, write_rows
+from report import make_result
+
+FORMATS = ["csv", "xlsx", "parquet"]
+COLUMNS = ["변수", "문항 수", "Cronbach's α", "유효 N"]
+
+
+def make_rows(start, count, **extra):
+    return [{"변수": f"척도{i}", "문항 수": 5, "Cronbach's α": 0.5 + i / 100, "유효 N": 100 + i, **extra}
+            for i in range(start, start + count)]
+
+
+def read_back(path):
+    """저장한 파일 → (머리글, 행 리스트) - CSV는 문자열로 읽히므로 비교용으로 맞춤"""
+    header, rows = _READERS[os.path.splitext(path)[1][1:]](path)
+    rows = list(rows)
+    if path.endswith(".csv"):
+        types = {"문항 수": int, "Cronbach's α": float, "유효 N": int}
+        rows = [{col: types.get(col, str)(value) for col, value in row.items() if value != ""} for row in rows]
+    return list(header), rows
+
+
+def failing(rows, after):
+    """after개 행을 넘긴 뒤 오류를 내는 행 iterator (저장 중 오류/취소 흉내)"""
+    for i, row in enumerate(rows):
+        if i == after:
+            raise RuntimeError("중단")
+        yield row
+
+
+@pytest.fixture(params=FORMATS)
+def path(request, tmp_path):
+    return str(tmp_path / f"보고서.{request.param}")
+
+
+def test_write_then_append(path):
+    assert write_rows(path, COLUMNS, make_rows(0, 3), 3) == 3
+    assert write_rows(path, COLUMNS, make_rows(3, 2), 2, append=True) == 2
+    header, rows = read_back(path)
+    assert header == COLUMNS
+    assert rows == make_rows(0, 5)
+
+
+def test_append_without_existing_file_creates_it(path):
+    assert write_rows(path, COLUMNS, make_rows(0, 2), 2, append=True) == 2
+    assert read_back(path) == (COLUMNS, make_rows(0, 2))
+
+
+def test_append_with_new_column_widens_header(path):
+    write_rows(path, COLUMNS, make_rows(0, 2), 2)
+    write_rows(path, COLUMNS + ["결측 처리"], make_rows(2, 2, **{"결측 처리": "listwise"}), 2, append=True)
+    header, rows = read_back(path)
+    assert header == COLUMNS + ["결측 처리"]
+    # 기존 행의 새 열은 빈 칸
+    assert rows == make_rows(0, 2) + make_rows(2, 2, **{"결측 처리": "listwise"})
+
+
+def test_append_with_fewer_columns_keeps_header(path):
+    write_rows(path, COLUMNS, make_rows(0, 2), 2)
+    short = [{k: v for k, v in row.items() if k != "유효 N"} for row in make_rows(2, 1)]
+    write_rows(path, ["변수", "문항 수", "Cronbach's α"], short, 1, append=True)
+    header, rows = read_back(path)
+    assert header == COLUMNS
+    assert rows == make_rows(0, 2) + short
+
+
+@pytest.mark.parametrize("new_columns", [COLUMNS, COLUMNS + ["결측 처리"]], ids=["same", "widened"])
+def test_failed_append_leaves_file_intact(path, new_columns):
+    write_rows(path, COLUMNS, make_rows(0, 3), 3)
+    with open(path, "rb") as f:
+        before = f.read()
+    with pytest.raises(RuntimeError, match="중단"):
+        write_rows(path, new_columns, failing(make_rows(3, 5), 2), 5, append=True)
+    with open(path, "rb") as f:
+        assert f.read() == before
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]  # 임시 파일이 남지 않음
+
+
+def test_failed_overwrite_leaves_file_intact(path):
+    write_rows(path, COLUMNS, make_rows(0, 3), 3)
+    with open(path, "rb") as f:
+        before = f.read()
+
+    def cancel(done, total):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        write_rows(path, COLUMNS, make_rows(0, 300), 300, progress=cancel)
+    with open(path, "rb") as f:
+        assert f.read() == before
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+def test_progress_reports_written_rows(tmp_path):
+    calls = []
+    write_rows(str(tmp_path / "보고서.csv"), COLUMNS, make_rows(0, 250), 250, progress=lambda *a: calls.append(a))
+    assert calls == [(100, 250), (200, 250), (250, 250)]
+
+
+def test_xlsx_with_several_sheets_is_not_appended(tmp_path):
+    from openpyxl import Workbook
+
+    path = str(tmp_path / "보고서.xlsx")
+    workbook = Workbook()
+    workbook.create_sheet("요약")
+    workbook.save(path)
+    with open(path, "rb") as f:
+        before = f.read()
+    with pytest.raises(ValueError, match="시트가 여러 개"):
+        write_rows(path, COLUMNS, make_rows(0, 1), 1, append=True)
+    with open(path, "rb") as f:
+        assert f.read() == before
+
+
+def test_export_results_appends_new_results(path):
+    first = make_result("척도A", ["a", "b", "c"], 0.81234, {"a": 0.7, "b": 0.75, "c": 0.8},
+                        n=(90, {"a": 91, "b": 92, "c": 90}))
+    second = make_result("척도B", ["d", "e"], 0.6, {"d": 0.0, "e": 0.0}, missing="listwise")
+    assert export_results([first], path) == 1
+    assert export_results([second], path, append=True) == 1
+    header, rows = _READERS[os.path.splitext(path)[1][1:]](path)
+    rows = list(rows)
+    assert [row["변수"] for row in rows] == ["척도A", "척도B"]
+    assert "결측 처리" in header and "유효 N" in header
+    assert "결측 처리" not in rows[0] or rows[0]["결측 처리"] == ""
@@ -0,0 +1,35 @@
+"""grouped: 한 번에 구한 집단별 α가 집단마다 데이터를 나누어 계산한 값과 같은지 확인"""
+import numpy as np
+import pytest
+
+from grouped import group_codes, grouped_reliability
+from reliability import reliability_analysis
+
+ITEMS = [f"문항{i}" for i in range(1, 7)]
+
+
+@pytest.fixture
+def data(survey):
+    data = survey.copy()
+    data["차수"] = np.arange(len(data)) % 3 + 1
+    data.loc[:4, "집단"] = np.nan  # 집단 값이 결측인 응답자는 어느 집단에도 들어가지 않음
+    return data
+
+
+@pytest.mark.parametrize("missing", ["listwise", "pairwise", "mean"])
+def test_matches_per_group_analysis(data, missing):
+    codes, labels = group_codes(data, ["집단", "차수"])
+    assert labels[0] == "집단=1.0, 차수=1"
+    alpha, removed, n, removed_n = grouped_reliability(data[ITEMS].to_numpy(), codes, len(labels), missing)
+    for g, (_, group) in enumerate(data.dropna(subset=["집단"]).groupby(["집단", "차수"])):
+        expected_alpha, expected_removed, (expected_n, expected_removed_n) = reliability_analysis(group[ITEMS],
+                                                                                                 missing)
+        assert alpha[g] == pytest.approx(expected_alpha, rel=1e-10)
+        np.testing.assert_allclose(removed[g], list(expected_removed.values()), rtol=1e-10)
+        assert n[g] == expected_n
+        assert removed_n[g].tolist() == list(expected_removed_n.values())
+
+
+def test_unknown_group_column(data):
+    with pytest.raises(ValueError, match="집단 변수"):
+        group_codes(data, ["없음"])
@@ -0,0 +1,137 @@
+"""instrumentation: 링 버퍼, 단계 중첩, JSONL/Chrome trace 저장, 스레드가 여럿일 때의 최대 메모리"""
+import json
+import threading
+
+import pytest
+
+from instrumentation import Tracer
+
+MB = 2 ** 20
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer(capacity=3)
+    yield tracer
+    tracer.set_track_memory(False)
+
+
+def test_ring_buffer_keeps_latest_events(tracer):
+    for i in range(5):
+        with tracer.span(f"단계{i}"):
+            pass
+    assert [event["name"] for event in tracer.events()] == ["단계2", "단계3", "단계4"]
+
+    events, count = tracer.events_since(0)
+    assert count == 5
+    assert [event["name"] for event in events] == ["단계2", "단계3", "단계4"]  # 밀려난 기록은 건너뜀
+    events, count = tracer.events_since(4)
+    assert [event["name"] for event in events] == ["단계4"]
+    assert tracer.events_since(count) == ([], 5)
+
+    tracer.clear()
+    assert tracer.events() == []
+    with tracer.span("단계5"):
+        pass
+    assert [event["name"] for event in tracer.events_since(count)[0]] == ["단계5"]
+
+
+def test_nested_spans_and_errors(tracer):
+    with pytest.raises(KeyError):
+        with tracer.span("바깥", rows=10) as outer:
+            outer.set(columns=4, source="cache")
+            with tracer.span("안쪽"):
+                raise KeyError("문항")
+    inner, outer = tracer.events()
+    assert (inner["name"], inner["depth"], inner["error"]) == ("안쪽", 1, "KeyError")
+    assert (outer["name"], outer["depth"], outer["rows"], outer["columns"]) == ("바깥", 0, 10, 4)
+    assert outer["args"] == {"source": "cache"}
+    assert outer["duration"] >= inner["duration"]
+    assert outer["peak_bytes"] is None  # 메모리 측정을 켜지 않음
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+    with tracer.span("단계") as s:
+        s.set(rows=1)
+    assert tracer.events() == []
+
+
+def test_write_jsonl(tracer, tmp_path):
+    with tracer.span("읽기", rows=300, columns=11, file="설문.csv"):
+        pass
+    path = tmp_path / "trace.jsonl"
+    tracer.write(path)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    event = json.loads(lines[0])
+    assert (event["name"], event["rows"], event["columns"], event["args"]) == ("읽기", 300, 11, {"file": "설문.csv"})
+
+
+def test_write_chrome_trace(tracer, tmp_path):
+    with tracer.span("공분산", rows=300):
+        pass
+
+    def work():
+        with tracer.span("부트스트랩"):
+            pass
+
+    worker = threading.Thread(target=work, name="작업")
+    worker.start()
+    worker.join()
+    path = tmp_path / "trace.json"
+    tracer.write(path)
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    names = {event["tid"]: event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+    assert [event["name"] for event in spans] == ["공분산", "부트스트랩"]
+    assert spans[0]["args"] == {"rows": 300}
+    assert spans[0]["dur"] == pytest.approx(tracer.events()[0]["duration"] * 1e6)
+    assert names[spans[1]["tid"]] == "작업"
+    assert names[spans[0]["tid"]] == threading.current_thread().name
+
+
+def test_memory_peak_of_nested_spans(tracer):
+    tracer.set_track_memory(True)
+    with tracer.span("바깥"):
+        block = bytearray(8 * MB)
+        del block
+        with tracer.span("안쪽"):
+            block = bytearray(2 * MB)
+            del block
+    inner, outer = tracer.events()
+    assert 2 * MB <= inner["peak_bytes"] < 8 * MB
+    assert outer["peak_bytes"] >= 8 * MB
+
+
+def test_other_threads_do_not_reset_the_measured_peak(tracer):
+    """다른 스레드의 단계가 tracemalloc 최대값을 초기화해 재고 있는 단계의 최대값을 잃지 않음"""
+    tracer.set_track_memory(True)
+    allocated, worker_done = threading.Event(), threading.Event()
+
+    def worker():
+        allocated.wait()
+        with tracer.span("작업 스레드"):
+            bytearray(MB)
+        worker_done.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    with tracer.span("주 스레드"):
+        block = bytearray(8 * MB)
+        del block
+        allocated.set()
+        worker_done.wait()
+    thread.join()
+
+    events = {event["name"]: event for event in tracer.events()}
+    assert events["작업 스레드"]["peak_bytes"] is None
+    assert events["주 스레드"]["peak_bytes"] >= 8 * MB
+
+    # 재던 스레드가 끝나면 다른 스레드도 잴 수 있음
+    thread = threading.Thread(target=worker)
+    allocated.set()
+    worker_done.clear()
+    thread.start()
+    thread.join()
+    assert tracer.events()[-1]["peak_bytes"] >= MB
@@ -0,0 +1,58 @@
+"""item_reduction: 탐색 결과를 모든 조합의 α와 비교"""
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from column_index import ColumnIndex
+from dataset_stats import DatasetStats
+from item_reduction import reduce_items, reduce_selection
+from reliability import alpha_from_covariance, item_covariance, reliability_analysis
+
+
+@pytest.fixture
+def cov(survey):
+    return item_covariance(survey[[f"문항{i}" for i in range(1, 10)]].to_numpy(), "pairwise")[0]
+
+
+def best_subset(cov, target):
+    return max(combinations(range(len(cov)), target),
+               key=lambda kept: alpha_from_covariance(cov[np.ix_(kept, kept)])[0])
+
+
+@pytest.mark.parametrize("target", [2, 4, 7])
+def test_exhaustive_finds_best_subset(cov, target):
+    reduction = reduce_items(cov, target, "exhaustive")
+    kept = list(best_subset(cov, target))
+    assert reduction.kept == kept
+    assert reduction.alpha == pytest.approx(alpha_from_covariance(cov[np.ix_(kept, kept)])[0], rel=1e-12)
+
+
+@pytest.mark.parametrize("method", ["greedy", "beam"])
+def test_heuristics_report_their_own_alpha(cov, method):
+    reduction = reduce_items(cov, 5, method, beam_width=4)
+    kept = reduction.kept
+    assert len(kept) == 5
+    assert reduction.alpha == pytest.approx(alpha_from_covariance(cov[np.ix_(kept, kept)])[0], rel=1e-12)
+    assert reduction.alpha <= reduce_items(cov, 5, "exhaustive").alpha + 1e-12
+
+
+def test_target_range(cov):
+    with pytest.raises(ValueError, match="남길 문항 수"):
+        reduce_items(cov, len(cov), "greedy")
+    with pytest.raises(ValueError, match="축약 방법"):
+        reduce_items(cov, 3, "random")
+
+
+def test_listwise_selection_reports_kept_items_own_rows(survey):
+    selection = ColumnIndex(survey.columns).resolve("문항1 to 문항9")
+    columns, alpha, removed_alpha, (total_n, removed_n), info = reduce_selection(
+        DatasetStats(survey), selection, 4, "greedy", missing="listwise")
+
+    expected_alpha, expected_removed, (expected_n, _) = reliability_analysis(survey[columns], "listwise")
+    assert alpha == pytest.approx(expected_alpha, rel=1e-12)
+    assert list(removed_alpha.values()) == pytest.approx(list(expected_removed.values()), rel=1e-12)
+    assert total_n == expected_n == survey[columns].dropna().shape[0]
+    assert set(removed_n.values()) == {expected_n}
+    # 제거 경로의 α는 문항 풀 전체에 응답한 응답자 기준
+    assert info["경로 N"] == survey[[f"문항{i}" for i in range(1, 10)]].dropna().shape[0] < total_n
@@ -0,0 +1,44 @@
+"""lazy_workbook: 필요한 열만 나누어 읽어도 통계량이 한 번에 읽은 데이터와 같은지 확인"""
+import numpy as np
+import pytest
+
+from lazy_workbook import LazyWorkbook
+from reliability import item_covariance
+
+ITEMS = [f"문항{i}" for i in range(1, 11)]
+
+
+@pytest.fixture(params=[False, True], ids=["frame", "compact"])
+def workbook(request, survey_csv):
+    return LazyWorkbook(str(survey_csv), use_cache=False, compact=request.param)
+
+
+def test_header_only_until_needed(workbook):
+    assert workbook.columns == ITEMS + ["집단"]
+    assert workbook.loaded_columns == []
+
+
+def test_stats_after_partial_loads(workbook, survey):
+    workbook.stats(ITEMS[:3])
+    workbook.stats(["문항7", "문항2"])
+    assert workbook.loaded_columns == ITEMS[:3] + ["문항7"]
+    stats = workbook.stats(ITEMS)
+    for missing in ["listwise", "pairwise", "mean"]:
+        cov, n = stats.covariance(ITEMS, missing=missing)
+        expected_cov, expected_n = item_covariance(survey[ITEMS].to_numpy(), missing)
+        np.testing.assert_allclose(cov, expected_cov, rtol=1e-10)
+        np.testing.assert_array_equal(n, expected_n)
+
+
+def test_stats_after_load(workbook, survey):
+    # load()로만 읽은 열(분석 서버의 batch 미리 읽기)도 다음 stats()에 반영되어야 함
+    workbook.stats(ITEMS[:2])
+    assert workbook.load(ITEMS[2:6]) == 4
+    stats = workbook.stats(ITEMS[2:6])
+    cov, _ = stats.covariance(ITEMS[:6], missing="pairwise")
+    np.testing.assert_allclose(cov, item_covariance(survey[ITEMS[:6]].to_numpy(), "pairwise")[0], rtol=1e-10)
+
+
+def test_unknown_column(workbook):
+    with pytest.raises(ValueError, match="데이터에 없는 문항"):
+        workbook.stats(["문항1", "없음"])
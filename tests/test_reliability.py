@@ -0,0 +1,123 @@
+"""
+reliability: 공분산 행렬 하나로 구한 α와 문항 제거 시 α를 원래의 반복 계산과 비교하고,
+결측 처리 방식별 공분산을 numpy/pandas 계산과 비교
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from reliability import alpha_from_covariance, check_missing_mode, cronbach_alpha, item_covariance, reliability_analysis
+
+COLUMNS = [f"문항{i}" for i in range(1, 9)]
+
+
+def baseline_alpha(data):
+    """처음 GUI의 크론바흐 알파 계산 (문항 분산 합과 합계 분산)"""
+    n_items = data.shape[1]
+    item_variances = data.var(axis=0, ddof=1)
+    total_variance = data.sum(axis=1).var(ddof=1)
+    return (n_items / (n_items - 1)) * (1 - (item_variances.sum() / total_variance))
+
+
+@pytest.fixture
+def complete(survey):
+    return survey[COLUMNS].dropna()
+
+
+def test_alpha_matches_baseline(complete):
+    assert cronbach_alpha(complete) == pytest.approx(baseline_alpha(complete), rel=1e-12)
+
+
+def test_item_deleted_matches_baseline_loop(complete):
+    alpha, removed, (n, removed_n) = reliability_analysis(complete)
+    assert alpha == pytest.approx(baseline_alpha(complete), rel=1e-12)
+    for col in COLUMNS:
+        assert removed[col] == pytest.approx(baseline_alpha(complete.drop(columns=[col])), rel=1e-12)
+    assert n == len(complete)
+    assert removed_n == {col: len(complete) for col in COLUMNS}
+
+
+def test_vectorized_covariances(complete):
+    # 앞쪽 차원을 반복으로 쓰는 배열도 반복마다 계산한 것과 같아야 함
+    halves = [complete.iloc[:150], complete.iloc[150:]]
+    stacked = np.stack([np.cov(half.to_numpy(), rowvar=False) for half in halves])
+    alphas, removed = alpha_from_covariance(stacked)
+    for i, half in enumerate(halves):
+        assert alphas[i] == pytest.approx(baseline_alpha(half), rel=1e-12)
+        assert removed[i, 0] == pytest.approx(baseline_alpha(half.drop(columns=[COLUMNS[0]])), rel=1e-12)
+
+
+def test_two_items_have_no_item_deleted_alpha(complete):
+    alpha, removed, _ = reliability_analysis(complete[COLUMNS[:2]])
+    assert alpha == pytest.approx(baseline_alpha(complete[COLUMNS[:2]]), rel=1e-12)
+    assert all(np.isnan(value) for value in removed.values())
+
+
+def test_needs_two_items(complete):
+    with pytest.raises(ValueError):
+        cronbach_alpha(complete[COLUMNS[:1]])
+    with pytest.raises(ValueError):
+        reliability_analysis(pd.DataFrame({"a": [1.0, 2.0]}))
+
+
+# ------------------------------------------------------------ 결측 처리 방식
+
+
+@pytest.fixture
+def with_missing(survey):
+    data = survey[COLUMNS].copy()
+    data.iloc[:5, 0] = np.nan  # 한 문항에만 몰린 결측도 포함
+    return data
+
+
+def test_complete_data_matches_np_cov(complete):
+    for missing in ["listwise", "pairwise", "mean"]:
+        cov, n = item_covariance(complete.to_numpy(), missing)
+        np.testing.assert_allclose(cov, np.cov(complete.to_numpy(), rowvar=False), rtol=1e-12)
+        assert (n == len(complete)).all()
+
+
+def test_listwise_matches_pandas(with_missing):
+    cov, n = item_covariance(with_missing.to_numpy(), "listwise")
+    kept = with_missing.dropna()
+    np.testing.assert_allclose(cov, kept.cov().to_numpy(), rtol=1e-12)
+    assert (n == len(kept)).all()
+
+
+def test_pairwise_matches_pandas(with_missing):
+    cov, n = item_covariance(with_missing.to_numpy(), "pairwise")
+    observed = with_missing.notna().to_numpy(dtype=float)
+    np.testing.assert_allclose(cov, with_missing.cov().to_numpy(), rtol=1e-10)
+    np.testing.assert_array_equal(n, observed.T @ observed)
+
+
+def test_mean_matches_pandas(with_missing):
+    cov, n = item_covariance(with_missing.to_numpy(), "mean")
+    imputed = with_missing.fillna(with_missing.mean())
+    np.testing.assert_allclose(cov, imputed.cov().to_numpy(), rtol=1e-10)
+    assert (n == len(with_missing)).all()
+
+
+@pytest.mark.parametrize("missing, prepare", [
+    ("listwise", lambda data: data.dropna()),
+    ("mean", lambda data: data.fillna(data.mean())),
+])
+def test_alpha_by_missing_mode_matches_baseline(with_missing, missing, prepare):
+    alpha, removed, _ = reliability_analysis(with_missing, missing)
+    prepared = prepare(with_missing)
+    assert alpha == pytest.approx(baseline_alpha(prepared), rel=1e-10)
+    assert removed[COLUMNS[0]] == pytest.approx(baseline_alpha(prepared.drop(columns=[COLUMNS[0]])), rel=1e-10)
+
+
+def test_pairwise_effective_n(with_missing):
+    _, _, (n, removed_n) = reliability_analysis(with_missing, "pairwise")
+    observed = with_missing.notna().to_numpy(dtype=int)
+    pair_n = observed.T @ observed
+    assert n == pair_n.min()
+    # 문항 1을 빼면 그 문항에 몰린 결측이 빠짐
+    assert removed_n[COLUMNS[0]] == pair_n[1:, 1:].min()
+
+
+def test_unknown_missing_mode():
+    with pytest.raises(ValueError, match="결측 처리 방식"):
+        check_missing_mode("drop")
@@ -0,0 +1,165 @@
+"""reliability_batch: 설문 CSV와 척도 정의 파일로 main()을 실행해 저장된 보고서 확인"""
+import json
+import sqlite3
+
+import pandas as pd
+import pytest
+
+import reliability_batch
+from reliability import reliability_analysis
+from reliability_batch import main
+
+SPEC = {"척도A": ["문항1 to 문항5"], "척도B": "문항6 to 문항10, -문항7"}
+COLUMNS = {"척도A": [f"문항{i}" for i in range(1, 6)], "척도B": ["문항6", "문항8", "문항9", "문항10"]}
+
+
+@pytest.fixture
+def store_db(tmp_path, monkeypatch):
+    path = tmp_path / "results.sqlite"
+    monkeypatch.setenv("RELIABILITY_RESULTS_DB", str(path))
+    monkeypatch.delenv("RELIABILITY_NO_STORE", raising=False)
+    return path
+
+
+def write_spec(tmp_path, fmt, spec=SPEC):
+    path = tmp_path / f"scales.{fmt}"
+    if fmt == "json":
+        path.write_text(json.dumps(spec, ensure_ascii=False), encoding="utf-8")
+    elif fmt == "yaml":
+        path.write_text("".join(f"{name}: {json.dumps(items, ensure_ascii=False)}\n" for name, items in spec.items()),
+                        encoding="utf-8")
+    else:
+        rows = [[name] + (items if isinstance(items, list) else items.split(",")) for name, items in spec.items()]
+        path.write_text("변수,문항\n" + "".join(",".join(row) + "\n" for row in rows), encoding="utf-8")
+    return str(path)
+
+
+def run(survey_csv, spec_path, output, *options):
+    return main([str(survey_csv), spec_path, "-o", str(output), *options])
+
+
+def stored_results(store_db):
+    with sqlite3.connect(store_db) as conn:
+        return conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+@pytest.mark.parametrize("fmt", ["json", "yaml", "csv"])
+def test_spec_formats_give_same_report(tmp_path, survey_csv, survey, store_db, fmt):
+    output = tmp_path / "out.csv"
+    assert run(survey_csv, write_spec(tmp_path, fmt), output) == 0
+    report = pd.read_csv(output).set_index("변수")
+    assert report.index.tolist() == ["척도A", "척도B"]
+    assert report["문항 수"].tolist() == [5, 4]
+    for name, columns in COLUMNS.items():
+        alpha, _, (n, _) = reliability_analysis(survey[columns], "listwise")
+        assert report.loc[name, "Cronbach's α"] == pytest.approx(round(alpha, 3))
+        assert report.loc[name, "유효 N"] == n
+    assert "문항7 제거 시" not in report.columns
+
+
+@pytest.mark.parametrize("missing", ["listwise", "pairwise", "mean"])
+def test_missing_mode(tmp_path, survey_csv, survey, store_db, missing):
+    output = tmp_path / "out.csv"
+    assert run(survey_csv, write_spec(tmp_path, "json"), output, "--missing", missing) == 0
+    report = pd.read_csv(output).set_index("변수")
+    for name, columns in COLUMNS.items():
+        alpha, removed, (n, _) = reliability_analysis(survey[columns], missing)
+        assert report.loc[name, "Cronbach's α"] == pytest.approx(round(alpha, 3))
+        assert report.loc[name, "결측 처리"] == missing
+        for col in columns:
+            assert report.loc[name, f"{col} 제거 시"] == pytest.approx(round(removed[col], 3))
+
+
+def test_append_adds_rows_to_existing_report(tmp_path, survey_csv, store_db):
+    output = tmp_path / "out.xlsx"
+    spec = write_spec(tmp_path, "json")
+    assert run(survey_csv, spec, output) == 0
+    assert run(survey_csv, spec, output, "--append", "--missing", "pairwise") == 0
+    report = pd.read_excel(output)
+    assert report["변수"].tolist() == ["척도A", "척도B"] * 2
+    assert report["결측 처리"].tolist() == ["listwise"] * 2 + ["pairwise"] * 2
+    # --append 없이 다시 저장하면 덮어씀
+    assert run(survey_csv, spec, output) == 0
+    assert len(pd.read_excel(output)) == 2
+
+
+@pytest.mark.parametrize("method", ["bootstrap", "jackknife"])
+def test_confidence_intervals(tmp_path, survey_csv, store_db, method):
+    output = tmp_path / "out.csv"
+    assert run(survey_csv, write_spec(tmp_path, "json"), output, "--ci", method, "--n-boot", "200", "--seed", "1",
+               "--level", "0.9") == 0
+    report = pd.read_csv(output)
+    assert (report["α 90% CI 하한"] <= report["Cronbach's α"]).all()
+    assert (report["Cronbach's α"] <= report["α 90% CI 상한"]).all()
+    assert report.loc[0, "문항1 제거 시 90% CI"].startswith("[")
+
+
+def count_analyses(monkeypatch):
+    """analyze_scale 호출 수를 세는 리스트 (저장소에서 재사용하면 늘지 않음)"""
+    calls = []
+    original = reliability_batch.analyze_scale
+    monkeypatch.setattr(reliability_batch, "analyze_scale", lambda *a, **k: calls.append(a[2]) or original(*a, **k))
+    return calls
+
+
+def test_seeded_results_are_reused_from_store(tmp_path, survey_csv, store_db, monkeypatch):
+    spec = write_spec(tmp_path, "json")
+    options = ["--ci", "bootstrap", "--n-boot", "200", "--seed", "1"]
+    calls = count_analyses(monkeypatch)
+    assert run(survey_csv, spec, tmp_path / "first.csv", *options) == 0
+    assert run(survey_csv, spec, tmp_path / "second.csv", *options) == 0
+    assert calls == ["척도A", "척도B"]
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "first.csv"), pd.read_csv(tmp_path / "second.csv"))
+    assert stored_results(store_db) == 4  # 재사용한 결과도 두 번째 세션에 기록
+
+
+def test_unseeded_bootstrap_is_recomputed(tmp_path, survey_csv, store_db, monkeypatch):
+    spec = write_spec(tmp_path, "json")
+    calls = count_analyses(monkeypatch)
+    for output in ("first.csv", "second.csv"):
+        assert run(survey_csv, spec, tmp_path / output, "--ci", "bootstrap", "--n-boot", "50") == 0
+    assert calls == ["척도A", "척도B"] * 2
+
+
+def test_no_store_skips_result_store(tmp_path, survey_csv, store_db):
+    assert run(survey_csv, write_spec(tmp_path, "json"), tmp_path / "out.csv", "--no-store") == 0
+    assert not store_db.exists()
+
+
+@pytest.mark.parametrize("method", ["greedy", "beam", "exhaustive"])
+def test_reduce_adds_short_form_rows(tmp_path, survey_csv, store_db, method):
+    output = tmp_path / "out.csv"
+    assert run(survey_csv, write_spec(tmp_path, "json"), output, "--reduce", "3", "--reduce-method", method) == 0
+    report = pd.read_csv(output)
+    assert report["변수"].tolist() == ["척도A", "척도A (3문항 축약)", "척도B", "척도B (3문항 축약)"]
+    assert report.loc[1, "축약"] == f"{method} (5 → 3문항)"
+    assert report.loc[1, "문항 수"] == 3
+    assert len(report.loc[1, "제거 문항"].replace(" → ", ", ").split(", ")) == 2
+
+
+def test_group_by_adds_group_columns(tmp_path, survey_csv, survey, store_db):
+    output = tmp_path / "out.csv"
+    assert run(survey_csv, write_spec(tmp_path, "json"), output, "--group-by", "집단") == 0
+    report = pd.read_csv(output).set_index("변수")
+    for group in (1, 2):
+        group_columns = [col for col in report.columns if col.startswith("[") and f"={group}]" in col]
+        assert group_columns
+        alpha_column = next(col for col in group_columns if col.endswith("] α"))
+        subset = survey.loc[survey["집단"] == group, COLUMNS["척도A"]]
+        assert report.loc["척도A", alpha_column] == pytest.approx(round(reliability_analysis(subset)[0], 3))
+
+
+def test_stream_matches_in_memory(tmp_path, survey_csv, store_db):
+    spec = write_spec(tmp_path, "json")
+    assert run(survey_csv, spec, tmp_path / "memory.csv", "--missing", "pairwise") == 0
+    assert run(survey_csv, spec, tmp_path / "stream.csv", "--missing", "pairwise", "--stream",
+               "--chunksize", "70") == 0
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "memory.csv"), pd.read_csv(tmp_path / "stream.csv"))
+
+
+def test_bad_scale_is_reported_and_others_saved(tmp_path, survey_csv, store_db, capsys):
+    output = tmp_path / "out.csv"
+    spec = write_spec(tmp_path, "json", {**SPEC, "척도C": "문항1, 없는문항"})
+    assert run(survey_csv, spec, output) == 1
+    assert "[오류] 척도C" in capsys.readouterr().err
+    assert pd.read_csv(output)["변수"].tolist() == ["척도A", "척도B"]
@@ -0,0 +1,94 @@
+"""result_store: 결과 항목 저장/복원, memo 키와 세션 기록"""
+import numpy as np
+import pytest
+
+from column_index import Selection
+from report import make_result
+from result_store import ResultStore, memo_key
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(str(tmp_path / "results.sqlite")) as store:
+        yield store
+
+
+def sample_result(columns=(1, 2, 3), name="척도"):
+    columns = list(columns)
+    removed = {col: np.float64(0.7 + i / 100) for i, col in enumerate(columns)}
+    ci = {"level": 0.95, "alpha": (0.71, 0.79), "removed": {col: (0.6, 0.8) for col in columns}}
+    return make_result(name, columns, np.float64(0.75), removed, ci, n=(np.int64(300), {col: 300 for col in columns}),
+                       missing="pairwise")
+
+
+def test_round_trip_keeps_keys_and_tuples(store):
+    # 머리글이 숫자인 파일은 문항명(dict 키)이 int
+    result = sample_result()
+    session = store.new_session()
+    result_id = store.add(result, session)
+    for restored in [store.result(result_id), store.session_results(session)[0]]:
+        assert restored == result
+        assert list(restored["문항 제거 시 알파 값"]) == [1, 2, 3]
+        assert restored["신뢰구간"]["alpha"] == (0.71, 0.79)
+        assert restored["신뢰구간"]["removed"][2] == (0.6, 0.8)
+
+
+def test_round_trip_str_columns(store):
+    result = sample_result(["희망1", "희망2", "희망3"])
+    assert store.result(store.add(result, store.new_session())) == result
+
+
+def test_lookup_hit_and_miss(store):
+    selection = Selection(["희망1", "희망2"], frozenset({"희망2"}))
+    key = memo_key("파일해시", selection, "alpha", missing="listwise", ci=None)
+    assert store.lookup(key) is None
+    session = store.new_session("cli")
+    store.add(sample_result(["희망1", "희망2"]), session, key)
+    assert store.lookup(key) == sample_result(["희망1", "희망2"])
+    # 문항, 역코딩, 옵션, 데이터가 다르면 다른 키
+    other_keys = [
+        memo_key("파일해시", selection, "alpha", missing="pairwise", ci=None),
+        memo_key("파일해시", Selection(["희망1", "희망2"], frozenset()), "alpha", missing="listwise", ci=None),
+        memo_key("다른 파일", selection, "alpha", missing="listwise", ci=None),
+    ]
+    assert len({key, *other_keys}) == 4
+    assert all(store.lookup(other) is None for other in other_keys)
+
+
+def test_seedless_bootstrap_is_not_memoized(store):
+    selection = Selection(["희망1", "희망2"], frozenset())
+    seedless = {"method": "bootstrap", "n_boot": 2000, "level": 0.95, "seed": None}
+    assert memo_key("파일해시", selection, "alpha", ci=seedless) is None
+    assert memo_key("파일해시", selection, "alpha", ci={**seedless, "seed": 1}) is not None
+    assert memo_key("파일해시", selection, "alpha", ci={**seedless, "method": "jackknife"}) is not None
+
+    session = store.new_session()
+    store.add(sample_result(), session, None)  # 결과 로그에는 남음
+    assert store.lookup(None) is None
+    assert len(store.session_results(session)) == 1
+
+
+def test_sessions_and_saved_counts(store):
+    assert store.last_session() is None
+    first = store.new_session()
+    cli = store.new_session("cli")
+    assert store.last_session() == first
+    assert store.last_session("cli") == cli
+    second = store.new_session()
+    assert store.last_session() == second
+
+    store.set_saved_count(first, "out.xlsx", 3)
+    store.set_saved_count(first, "out.xlsx", 5)  # 같은 파일은 덮어씀
+    store.set_saved_count(first, "out.csv", 1)
+    assert store.saved_counts(first) == {"out.xlsx": 5, "out.csv": 1}
+    assert store.saved_counts(second) == {}
+
+
+def test_query(store):
+    session = store.new_session()
+    for name in ["희망_척도", "희망척도", "불안"]:
+        store.add(sample_result(name=name), session, file="/data/survey.xlsx")
+    assert [r["name"] for r in store.query(name="희망*")] == ["희망척도", "희망_척도"]
+    assert [r["name"] for r in store.query(name="희망_*")] == ["희망_척도"]  # _는 글자 그대로
+    assert [r["result"]["문항명"] for r in store.query(file="survey", limit=1, full=True)] == ["불안"]
+    assert store.count() == 3
@@ -0,0 +1,54 @@
+"""streaming: 청크 단위 누적이 메모리에서 한 번에 계산한 값과 같은지 확인"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from reliability import item_covariance, reliability_analysis
+from streaming import StreamingMoments, stream_moment_sets, stream_reliability
+
+COLUMNS = [f"문항{i}" for i in range(1, 9)]
+
+
+@pytest.fixture
+def sorted_csv(tmp_path, survey):
+    """문항1 순으로 정렬해 청크마다 평균이 크게 다른 CSV (기준값 보정이 필요한 경우)"""
+    path = tmp_path / "sorted.csv"
+    survey.sort_values("문항1").to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("missing", ["listwise", "pairwise", "mean"])
+@pytest.mark.parametrize("chunksize", [7, 64, 10_000])
+def test_stream_matches_in_memory(sorted_csv, survey, missing, chunksize):
+    streamed = stream_reliability(sorted_csv, COLUMNS, chunksize=chunksize, missing=missing)
+    expected = reliability_analysis(survey[COLUMNS], missing)
+    assert streamed[0] == pytest.approx(expected[0], rel=1e-10)
+    assert streamed[1] == pytest.approx(expected[1], rel=1e-10)
+    assert streamed[2] == expected[2]
+
+
+def test_stream_with_executor_matches_sequential(sorted_csv):
+    sets = [COLUMNS[:4], COLUMNS[2:]]
+    sequential = stream_moment_sets(sorted_csv, sets, chunksize=20)
+    with ThreadPoolExecutor(2) as executor:
+        parallel = stream_moment_sets(sorted_csv, sets, chunksize=20, executor=executor)
+    for a, b in zip(sequential, parallel):
+        np.testing.assert_allclose(a.covariance(missing="pairwise")[0], b.covariance(missing="pairwise")[0],
+                                   rtol=1e-12)
+
+
+def test_merge_recenters_different_shifts(survey):
+    values = survey[COLUMNS].to_numpy()
+    first, second = StreamingMoments.from_values(values[:100]), StreamingMoments.from_values(values[100:] + 3.0)
+    assert not np.array_equal(first.shift, second.shift)
+    merged = first.merge(second)
+    combined = np.vstack([values[:100], values[100:] + 3.0])
+    for missing in ["pairwise", "mean"]:
+        cov, n = merged.covariance(missing=missing)
+        expected_cov, expected_n = item_covariance(combined, missing)
+        np.testing.assert_allclose(cov, expected_cov, rtol=1e-10)
+        np.testing.assert_array_equal(n, expected_n)
+    # 합치는 순서와 무관
+    np.testing.assert_allclose(second.merge(first).covariance(missing="pairwise")[0],
+                               merged.covariance(missing="pairwise")[0], rtol=1e-10)
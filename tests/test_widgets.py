@@ -0,0 +1,88 @@
+"""widgets.ListSelection: 가상 목록의 선택을 화면 줄이 아니라 항목 위치로 처리하는지 확인 (화면 없이 실행)"""
+import tkinter as tk
+
+import pytest
+
+from widgets import ListSelection
+
+
+@pytest.fixture
+def extended():
+    selection = ListSelection(tk.EXTENDED)
+    selection.reset(5000)
+    return selection
+
+
+def test_shift_click_selects_range_across_scroll_positions(extended):
+    extended.click(3)
+    extended.click(4000, shift=True)  # 스크롤해서 보이는 구간이 바뀐 뒤
+    assert extended.selected == set(range(3, 4001))
+    extended.click(1, shift=True)  # 기준 위치는 그대로
+    assert extended.selected == {1, 2, 3}
+    assert (extended.anchor, extended.active) == (3, 1)
+
+
+def test_control_click_toggles_and_moves_anchor(extended):
+    extended.click(10)
+    extended.click(20, control=True)
+    extended.click(10, control=True)
+    assert extended.selected == {20}
+    assert extended.anchor == 10  # 마지막으로 Ctrl+클릭한 위치
+    extended.click(13, shift=True)
+    assert extended.selected == {10, 11, 12, 13}
+
+
+def test_shift_arrow_extends_and_shrinks_from_anchor(extended):
+    extended.click(100)
+    for _ in range(3):
+        extended.move(1, shift=True)
+    assert extended.selected == {100, 101, 102, 103}
+    extended.move(-5, shift=True)
+    assert extended.selected == set(range(98, 101))
+    extended.move(1)  # Shift 없이 움직이면 하나만 선택
+    assert extended.selected == {99}
+    assert extended.anchor == extended.active == 99
+
+
+def test_drag_selects_from_anchor(extended):
+    extended.click(50)
+    extended.drag(45)
+    assert extended.selected == set(range(45, 51))
+
+
+def test_move_stays_inside_list(extended):
+    extended.move(-10)
+    assert extended.selected == {0}
+    extended.move(10_000)
+    assert extended.selected == {4999}
+    empty = ListSelection(tk.EXTENDED)
+    empty.move(1)
+    assert empty.selected == set()
+
+
+def test_select_all_and_reset(extended):
+    extended.select_all()
+    assert len(extended.selected) == 5000
+    extended.reset(3)
+    assert (extended.selected, extended.anchor, extended.active) == (set(), None, 0)
+
+
+def test_browse_mode_keeps_one_item():
+    selection = ListSelection(tk.BROWSE)
+    selection.reset(10)
+    selection.click(2)
+    selection.click(7, shift=True)
+    selection.move(1, shift=True)
+    selection.select_all()
+    assert selection.selected == {8}
+
+
+def test_multiple_mode_toggles_on_click():
+    selection = ListSelection(tk.MULTIPLE)
+    selection.reset(10)
+    selection.click(2)
+    selection.click(5)
+    selection.move(1)  # 방향키는 커서만 이동
+    selection.click(2)
+    assert selection.selected == {5}
+    assert selection.active == 2
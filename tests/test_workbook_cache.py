@@ -0,0 +1,81 @@
+"""workbook_cache: 파일이 바뀌지 않으면 캐시에서 읽고, 바뀌거나 손상되면 다시 파싱하는지 확인"""
+import os
+
+import pandas as pd
+import pytest
+
+from workbook_cache import _read_workbook, clear_cache, evict, file_fingerprint, read_workbook
+
+ITEMS = [f"문항{i}" for i in range(1, 11)]
+
+
+def cache_files(cache_dir):
+    return sorted(os.listdir(cache_dir)) if cache_dir.exists() else []
+
+
+def test_miss_then_hit(survey_csv, survey, cache_dir):
+    data, status = _read_workbook(str(survey_csv), True, None)
+    assert status == "miss"
+    assert [name.rsplit(".", 1)[1] for name in cache_files(cache_dir)] == ["parquet"]
+    data, status = _read_workbook(str(survey_csv), True, None, columns=["문항3", "집단"])
+    assert status == "hit"
+    pd.testing.assert_frame_equal(data, survey[["문항3", "집단"]])
+
+
+def test_partial_csv_read_is_not_cached(survey_csv, cache_dir):
+    assert _read_workbook(str(survey_csv), True, None, columns=["문항1"])[1] == "partial"
+    assert cache_files(cache_dir) == []
+    assert _read_workbook(str(survey_csv), False, None)[1] == "off"
+
+
+def test_fingerprint_changes_when_file_is_edited(survey_csv, survey):
+    before = file_fingerprint(survey_csv)
+    assert file_fingerprint(survey_csv) == before
+    survey.assign(문항1=survey["문항1"].fillna(3) + 1).to_csv(survey_csv, index=False)
+    assert file_fingerprint(survey_csv) != before
+    # 바뀐 파일은 캐시를 쓰지 않고 새로 읽음
+    data, status = _read_workbook(str(survey_csv), True, None)
+    assert status == "miss"
+    assert data["문항1"].min() >= 2
+
+
+def test_corrupted_cache_is_replaced(survey_csv, survey, cache_dir):
+    read_workbook(str(survey_csv), use_cache=True)
+    (path,) = [cache_dir / name for name in cache_files(cache_dir)]
+    path.write_bytes(b"not a parquet file")
+    data, status = _read_workbook(str(survey_csv), True, None)
+    assert status == "miss"
+    pd.testing.assert_frame_equal(data, survey)
+    assert path.read_bytes()[:4] == b"PAR1"
+
+
+@pytest.mark.parametrize("values, first, ext", [
+    ([[1, 2], [3, 4]], "a", "parquet"),
+    ([[1, 2], [3, 4]], 1, "pkl"),  # 숫자 열 이름은 Parquet에서 문자열로 바뀌므로 pickle
+    ([[1, "가"], ["나", 4]], "a", "pkl"),  # 숫자와 문자가 섞인 열도 pickle
+])
+def test_missing_column_keeps_cache(tmp_path, cache_dir, values, first, ext):
+    path = tmp_path / "data.xlsx"
+    pd.DataFrame(values, columns=[first, "b"]).to_excel(path, index=False)
+    fingerprint = file_fingerprint(path)
+    read_workbook(str(path), use_cache=True, fingerprint=fingerprint)
+    files = cache_files(cache_dir)
+    assert [name.rsplit(".", 1)[1] for name in files] == [ext]
+    with pytest.raises(KeyError):
+        read_workbook(str(path), use_cache=True, fingerprint=fingerprint, columns=[first, "없음"])
+    assert cache_files(cache_dir) == files
+    data, status = _read_workbook(str(path), True, fingerprint, columns=[first])
+    assert status == "hit"
+    assert data.columns.tolist() == [first]
+
+
+def test_evict_oldest_first_and_clear(cache_dir):
+    cache_dir.mkdir(parents=True)
+    for i, name in enumerate(["old.parquet", "mid.pkl", "new.parquet"]):
+        (cache_dir / name).write_bytes(b"x" * 100)
+        os.utime(cache_dir / name, (1000 + i, 1000 + i))
+    (cache_dir / "results.sqlite").write_bytes(b"x" * 1000)  # 캐시 파일이 아니면 건드리지 않음
+    evict(str(cache_dir), max_bytes=250)
+    assert cache_files(cache_dir) == ["mid.pkl", "new.parquet", "results.sqlite"]
+    clear_cache(str(cache_dir))
+    assert cache_files(cache_dir) == ["results.sqlite"]
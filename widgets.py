@@ -0,0 +1,481 @@
+"""
+GUI 공용 위젯
+"""
+import tkinter as tk
+from tkinter import filedialog, messagebox, font as tkfont, ttk
+
+from report import ci_label, format_ci
+
+DEFAULT_PAGE_SIZE = 200  # 결과 로그에서 한 번에 행을 만드는 결과 수
+
+
+class ResultsLogView(tk.Frame):
+    """
+    결과 로그 (추가 전용 트리 뷰)
+
+    분석 한 번에 요약 행 하나만 추가하고, 문항 제거 시 α 등 세부 행은
+    사용자가 펼칠 때 처음 한 번만 만든다. 이전 결과는 다시 그리지 않으므로
+    결과가 수백 개 쌓여도 분석 한 번의 표시 비용이 일정하다.
+    여러 결과를 한 번에 넣을 때(세션 복원)는 마지막 page_size개만 행을 만들고, 그 앞의 결과는
+    맨 위 '이전 결과' 행을 펼칠 때 page_size개씩 만든다 (결과가 수천 개여도 창을 여는 비용이 일정).
+    alpha_key: 결과 로그 항목에서 전체 α가 저장된 키
+    """
+
+    def __init__(self, parent, alpha_key="Cronbach_alpha", height=10, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.alpha_key = alpha_key
+        self.page_size = max(1, page_size)
+        self._results = []  # 추가된 결과 전체 (표시 번호 = 위치 + 1)
+        self._first = 0  # 행을 만든 첫 결과의 위치 (그 앞은 '이전 결과' 행 아래에 숨김)
+        self._more = None  # '이전 결과' 행 (숨긴 결과가 없으면 None)
+        self._pending = {}  # 아직 펼치지 않은 요약 행 → 결과 항목
+
+        self.tree = ttk.Treeview(self, columns=("n_items", "n", "alpha", "ci"), height=height)
+        self.tree.heading("#0", text="변수 / 제거 문항")
+        self.tree.heading("n_items", text="문항 수")
+        self.tree.heading("n", text="유효 N")
+        self.tree.heading("alpha", text="Cronbach's α")
+        self.tree.heading("ci", text="신뢰구간")
+        self.tree.column("#0", width=260)
+        self.tree.column("n_items", width=70, anchor="center")
+        self.tree.column("n", width=70, anchor="center")
+        self.tree.column("alpha", width=110, anchor="center")
+        self.tree.column("ci", width=160, anchor="center")
+
+        scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+
+    def append(self, result):
+        """결과 하나를 로그 끝에 추가하고 그 위치로 스크롤"""
+        self._results.append(result)
+        self.tree.see(self._insert(len(self._results) - 1, tk.END))
+
+    def extend(self, results):
+        """결과 여러 개를 로그 끝에 추가 (마지막 page_size개만 행을 만들고 끝으로 스크롤)"""
+        results = list(results)
+        if not results:
+            return
+        start = len(self._results)
+        self._results.extend(results)
+        first = max(self._first, len(self._results) - self.page_size)
+        if first > start:
+            # 새 결과만으로 한 페이지가 넘으면 기존 행도 숨김 (행을 만든 구간은 항상 이어져 있어야 함)
+            self._clear_rows()
+            self._first = first
+            start = first
+        for position in range(start, len(self._results)):
+            row = self._insert(position, tk.END)
+        self._update_more()
+        self.tree.see(row)
+
+    def clear(self):
+        self._clear_rows()
+        self._results.clear()
+        self._first = 0
+
+    def _clear_rows(self):
+        self.tree.delete(*self.tree.get_children())
+        self._pending.clear()
+        self._more = None
+
+    def _insert(self, position, index):
+        """결과 하나의 요약 행 만들기 → 행 id"""
+        result = self._results[position]
+        ci = result.get("신뢰구간")
+        ci_text = f"{ci_label(result)} {format_ci(ci['alpha'])}" if ci is not None else ""
+        row = self.tree.insert("", index, text=f"[{position + 1}] {result['문항명']}",
+                               values=(result["문항 수"], result.get("유효 N", ""),
+                                       f"{result[self.alpha_key]:.3f}", ci_text))
+        if result["문항 제거 시 알파 값"]:
+            self._pending[row] = result
+            self.tree.insert(row, tk.END)  # 펼침 표시(▸)용 빈 자리 행
+        return row
+
+    def _update_more(self):
+        """'이전 결과' 행을 숨긴 결과 수에 맞게 만들거나 고치거나 지움"""
+        if not self._first:
+            if self._more is not None:
+                self.tree.delete(self._more)
+                self._more = None
+            return
+        text = f"▲ 이전 결과 {self._first}개 (펼치면 {min(self.page_size, self._first)}개 더 표시)"
+        if self._more is None:
+            self._more = self.tree.insert("", 0, text=text)
+            self.tree.insert(self._more, tk.END)  # 펼침 표시용 빈 자리 행
+        else:
+            self.tree.item(self._more, text=text, open=False)
+
+    def _show_earlier(self):
+        """숨긴 결과 중 마지막 page_size개의 행을 '이전 결과' 행 바로 아래에 만듦"""
+        start = max(0, self._first - self.page_size)
+        for position in range(start, self._first):
+            self._insert(position, position - start + 1)
+        self._first = start
+        self._update_more()
+
+    def _on_open(self, event=None):
+        row = self.tree.focus()
+        if row and row == self._more:
+            self._show_earlier()
+            return
+        result = self._pending.pop(row, None)
+        if result is None:
+            return
+        self.tree.delete(*self.tree.get_children(row))
+        reduction = result.get("문항 축약")
+        if reduction is not None:
+            # 문항 축약 결과는 제거 경로를 먼저 표시
+            for step, (col, n_items, value) in enumerate(reduction["경로"], 1):
+                self.tree.insert(row, tk.END, text=f"{step}단계: {col} 제거",
+                                 values=(n_items, reduction.get("경로 N", ""), f"{value:.3f}", ""))
+            if not reduction["경로"]:
+                self.tree.insert(row, tk.END, text=f"제거: {', '.join(map(str, reduction['제거 문항']))}")
+        for group in result.get("집단별", {}).get("집단", []):
+            self.tree.insert(row, tk.END, text=f"[{group['집단']}]",
+                             values=("", group["유효 N"], f"{group['Cronbach_alpha']:.3f}", ""))
+        ci = result.get("신뢰구간")
+        removed_n = result.get("문항 제거 시 유효 N", {})
+        for col, value in result["문항 제거 시 알파 값"].items():
+            ci_text = format_ci(ci["removed"][col]) if ci is not None else ""
+            self.tree.insert(row, tk.END, text=f"{col} 제거 시",
+                             values=("", removed_n.get(col, ""), f"{value:.3f}", ci_text))
+
+
+class ListSelection:
+    """
+    목록의 선택 상태 (화면에 보이는 줄이 아니라 항목 위치 기준)
+    mode: tk.Listbox의 selectmode
+        browse/single  항목 하나만 선택
+        multiple       클릭할 때마다 선택/해제
+        extended       클릭은 하나만, Ctrl+클릭은 추가/해제, Shift+클릭/Shift+방향키는 기준 위치부터 범위 선택
+    selected: 선택된 위치 집합, anchor: 범위 선택의 기준 위치, active: 키보드 커서 위치
+    """
+
+    def __init__(self, mode=tk.BROWSE):
+        self.mode = str(mode)
+        self.size = 0
+        self.selected = set()
+        self.anchor = None
+        self.active = 0
+
+    def reset(self, size):
+        """항목 수가 size인 새 목록 (선택 해제)"""
+        self.size = size
+        self.selected = set()
+        self.anchor = None
+        self.active = 0
+
+    def click(self, index, shift=False, control=False):
+        """index 위치 클릭 (shift, control: 누르고 있던 보조 키)"""
+        if self.mode == tk.EXTENDED and shift and self.anchor is not None:
+            self.selected = self._span(self.anchor, index)
+        elif self.mode == tk.MULTIPLE or (self.mode == tk.EXTENDED and control):
+            self.selected ^= {index}
+            self.anchor = index
+        else:
+            self.selected = {index}
+            self.anchor = index
+        self.active = index
+
+    def drag(self, index):
+        """누른 채로 index 위치까지 끌기"""
+        if self.mode == tk.EXTENDED and self.anchor is not None:
+            self.selected = self._span(self.anchor, index)
+        elif self.mode in (tk.BROWSE, tk.SINGLE):
+            self.selected = {index}
+            self.anchor = index
+        self.active = index
+
+    def move(self, step, shift=False):
+        """키보드 커서를 step만큼 이동 (shift: extended에서 기준 위치부터 범위 선택)"""
+        if not self.size:
+            return
+        index = max(0, min(self.active + step, self.size - 1))
+        if self.mode == tk.EXTENDED and shift:
+            if self.anchor is None:
+                self.anchor = self.active
+            self.selected = self._span(self.anchor, index)
+        elif self.mode != tk.MULTIPLE:
+            self.selected = {index}
+            self.anchor = index
+        self.active = index
+
+    def select_all(self):
+        if self.mode in (tk.EXTENDED, tk.MULTIPLE):
+            self.selected = set(range(self.size))
+
+    @staticmethod
+    def _span(first, last):
+        return set(range(min(first, last), max(first, last) + 1))
+
+
+class VirtualListbox(tk.Frame):
+    """
+    가상화된 목록 상자
+
+    항목이 수천 개여도 화면에 보이는 줄 수만큼만 Listbox에 넣고,
+    스크롤하면 보이는 구간만 다시 채운다. 선택 상태는 위젯이 아니라
+    항목 위치(ListSelection)로 보관하고 클릭/방향키도 항목 위치로 처리하므로
+    (Listbox 기본 동작은 쓰지 않음) 스크롤한 뒤 Shift+클릭해도 범위가 이어진다.
+    선택이 바뀌면 <<ListboxSelect>> 이벤트를 낸다.
+    listbox_options: 내부 tk.Listbox에 그대로 전달할 옵션 (font, selectmode 등)
+    """
+
+    def __init__(self, parent, bg=None, **listbox_options):
+        super().__init__(parent, bg=bg)
+        self.items = []
+        self.selection = ListSelection(listbox_options.get("selectmode", tk.BROWSE))
+        self.top = 0
+        self.rows = max(1, int(listbox_options.pop("height", 10)))
+
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox = tk.Listbox(self, height=self.rows, exportselection=False, **listbox_options)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.listbox.bind("<Configure>", self._on_configure)
+        self.listbox.bind("<MouseWheel>", self._on_wheel)
+        self.listbox.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.listbox.bind("<Button-5>", lambda e: self.scroll(3))
+        # 선택은 모두 항목 위치로 처리하고 Listbox 기본 동작은 막음 ("break")
+        self.listbox.bind("<Button-1>", lambda e: self._on_click(e))
+        self.listbox.bind("<Shift-Button-1>", lambda e: self._on_click(e, shift=True))
+        self.listbox.bind("<Control-Button-1>", lambda e: self._on_click(e, control=True))
+        self.listbox.bind("<B1-Motion>", self._on_drag)
+        for key, step in (("Up", -1), ("Down", 1)):
+            self.listbox.bind(f"<{key}>", lambda e, step=step: self._on_key(step))
+            self.listbox.bind(f"<Shift-{key}>", lambda e, step=step: self._on_key(step, shift=True))
+        self.listbox.bind("<Prior>", lambda e: self._on_key(-self.rows))
+        self.listbox.bind("<Next>", lambda e: self._on_key(self.rows))
+        self.listbox.bind("<Home>", lambda e: self._on_key(-len(self.items)))
+        self.listbox.bind("<End>", lambda e: self._on_key(len(self.items)))
+        self.listbox.bind("<Control-a>", self._on_select_all)
+
+    def bind(self, sequence=None, func=None, add=None):
+        return self.listbox.bind(sequence, func, add)
+
+    def set_items(self, items):
+        """목록 전체 교체 (선택 해제, 맨 위로 이동)"""
+        self.items = list(items)
+        self.selection.reset(len(self.items))
+        self.top = 0
+        self._render()
+
+    def selected_items(self):
+        """선택된 항목 리스트 (목록 순서)"""
+        return [self.items[i] for i in sorted(self.selection.selected)]
+
+    def scroll(self, lines):
+        self._scroll_to(self.top + lines)
+        return "break"
+
+    def _scroll_to(self, top):
+        top = max(0, min(int(top), max(0, len(self.items) - self.rows)))
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def _render(self):
+        """보이는 구간만 Listbox에 채우고 선택 상태, 커서와 스크롤바 갱신"""
+        visible = self.items[self.top:self.top + self.rows]
+        self.listbox.delete(0, tk.END)
+        if visible:
+            self.listbox.insert(0, *visible)
+        for offset in range(len(visible)):
+            if self.top + offset in self.selection.selected:
+                self.listbox.selection_set(offset)
+        if 0 <= self.selection.active - self.top < len(visible):
+            self.listbox.activate(self.selection.active - self.top)
+        if self.items:
+            self.scrollbar.set(self.top / len(self.items),
+                               min(1.0, (self.top + self.rows) / len(self.items)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _changed(self):
+        self._render()
+        self.listbox.event_generate("<<ListboxSelect>>")
+        return "break"
+
+    def _index_at(self, y):
+        """화면 y 좌표의 항목 위치 (항목이 없으면 None)"""
+        if not self.items:
+            return None
+        return min(self.top + self.listbox.nearest(y), len(self.items) - 1)
+
+    def _on_click(self, event, shift=False, control=False):
+        self.listbox.focus_set()
+        index = self._index_at(event.y)
+        if index is None:
+            return "break"
+        self.selection.click(index, shift, control)
+        return self._changed()
+
+    def _on_drag(self, event):
+        # 목록 밖으로 끌면 한 줄씩 스크롤
+        height = self.listbox.winfo_height()
+        if event.y < 0:
+            self._scroll_to(self.top - 1)
+        elif event.y >= height:
+            self._scroll_to(self.top + 1)
+        index = self._index_at(max(0, min(event.y, height - 1)))
+        if index is None:
+            return "break"
+        self.selection.drag(index)
+        return self._changed()
+
+    def _on_key(self, step, shift=False):
+        self.selection.move(step, shift)
+        # 커서가 보이는 구간 밖으로 나가면 따라 스크롤
+        active = self.selection.active
+        if active < self.top:
+            self.top = active
+        elif active >= self.top + self.rows:
+            self.top = max(0, active - self.rows + 1)
+        return self._changed()
+
+    def _on_select_all(self, event=None):
+        self.selection.select_all()
+        return self._changed()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * len(self.items))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.rows if args[2] == "pages" else 1)
+            self._scroll_to(self.top + step)
+
+    def _on_wheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_configure(self, event):
+        linespace = tkfont.Font(font=self.listbox.cget("font")).metrics("linespace") + 1
+        rows = max(1, event.height // linespace)
+        if rows != self.rows:
+            self.rows = rows
+            self._scroll_to(self.top)
+            self._render()
+
+
+class TracePanel(tk.Frame):
+    """
+    접을 수 있는 성능 기록 패널
+
+    instrumentation 기록기의 단계 기록(걸린 시간, 행/열 수, 최대 메모리)을 끝난 순서대로 보여 주고,
+    JSON Lines 또는 Chrome trace 형식으로 저장한다. 펼쳐 둔 동안에만 refresh_ms마다 새 기록을 가져와 추가하고
+    (접어 두면 멈춤, 접힌 상태에서는 refresh()를 부른 때만 갱신) 표시하는 행은 최근 max_rows개로 제한한다.
+    """
+
+    def __init__(self, parent, tracer, refresh_ms=500, max_rows=500, bg=None, font=None):
+        super().__init__(parent, bg=bg)
+        self.tracer = tracer
+        self.refresh_ms = refresh_ms
+        self.max_rows = max_rows
+        self._seen = 0  # 지금까지 가져온 기록 수 (tracer.events_since)
+        self._after_id = None
+
+        header = tk.Frame(self, bg=bg)
+        header.pack(fill=tk.X)
+        self.toggle_button = tk.Button(header, text="▸ 성능 기록", command=self.toggle, font=font,
+                                       bg=bg, relief=tk.FLAT, cursor="hand2")
+        self.toggle_button.pack(side=tk.LEFT)
+        self.last_var = tk.StringVar(value="")
+        tk.Label(header, textvariable=self.last_var, font=font, bg=bg, fg="#7f8c8d").pack(side=tk.LEFT, padx=(10, 0))
+
+        self.body = tk.Frame(self, bg=bg)
+        buttons = tk.Frame(self.body, bg=bg)
+        buttons.pack(fill=tk.X, pady=(0, 5))
+        self.memory_var = tk.BooleanVar(value=tracer.track_memory)
+        tk.Checkbutton(buttons, text="최대 메모리 측정 (계산이 느려짐)", variable=self.memory_var,
+                       command=lambda: self.tracer.set_track_memory(self.memory_var.get()),
+                       font=font, bg=bg, activebackground=bg).pack(side=tk.LEFT)
+        for text, command in (("지우기", self.clear), ("JSONL 저장", self.save_jsonl),
+                              ("Chrome trace 저장", self.save_chrome_trace)):
+            tk.Button(buttons, text=text, command=command, font=font, relief=tk.FLAT,
+                      padx=10, cursor="hand2").pack(side=tk.RIGHT, padx=(5, 0))
+
+        self.tree = ttk.Treeview(self.body, columns=("ms", "rows", "columns", "memory", "info"), height=6)
+        self.tree.heading("#0", text="단계")
+        self.tree.heading("ms", text="시간 (ms)")
+        self.tree.heading("rows", text="행")
+        self.tree.heading("columns", text="열")
+        self.tree.heading("memory", text="최대 메모리 (MB)")
+        self.tree.heading("info", text="정보")
+        self.tree.column("#0", width=170)
+        self.tree.column("ms", width=80, anchor="e")
+        self.tree.column("rows", width=80, anchor="e")
+        self.tree.column("columns", width=50, anchor="e")
+        self.tree.column("memory", width=110, anchor="e")
+        self.tree.column("info", width=260)
+        scrollbar = tk.Scrollbar(self.body, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    @property
+    def expanded(self):
+        return bool(self.body.winfo_manager())
+
+    def toggle(self):
+        if self.expanded:
+            self.body.pack_forget()
+            self.toggle_button.config(text="▸ 성능 기록")
+            if self._after_id is not None:
+                self.after_cancel(self._after_id)
+                self._after_id = None
+        else:
+            self.body.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+            self.toggle_button.config(text="▾ 성능 기록")
+            self._poll()
+
+    def clear(self):
+        self.tracer.clear()
+        self.tree.delete(*self.tree.get_children())
+        self.last_var.set("")
+
+    def save_jsonl(self):
+        self._save(self.tracer.write_jsonl, ".jsonl", [("JSON Lines", "*.jsonl")])
+
+    def save_chrome_trace(self):
+        self._save(self.tracer.write_chrome_trace, ".json", [("Chrome trace", "*.json")])
+
+    def _save(self, write, extension, filetypes):
+        path = filedialog.asksaveasfilename(defaultextension=extension, filetypes=filetypes)
+        if not path:
+            return
+        try:
+            write(path)
+        except OSError as e:
+            messagebox.showerror("오류", f"성능 기록을 저장할 수 없습니다: {e}")
+
+    def _poll(self):
+        self.refresh()
+        self._after_id = self.after(self.refresh_ms, self._poll)
+
+    def refresh(self):
+        """새 기록만 가져와 표시 (접힌 상태에서 작업이 끝났을 때 머리글의 마지막 작업 갱신용)"""
+        events, self._seen = self.tracer.events_since(self._seen)
+        for event in events:
+            self._insert(event)
+        excess = len(self.tree.get_children()) - self.max_rows
+        if excess > 0:
+            self.tree.delete(*self.tree.get_children()[:excess])
+        if events:
+            self.tree.see(self.tree.get_children()[-1])
+
+    def _insert(self, event):
+        memory = event["peak_bytes"]
+        info = ", ".join(f"{key}={value}" for key, value in event["args"].items())
+        if "error" in event:
+            info = f"오류: {event['error']}" + (f", {info}" if info else "")
+        self.tree.insert("", tk.END, text="  " * event["depth"] + event["name"],
+                         values=(f"{event['duration'] * 1000:.1f}",
+                                 "" if event["rows"] is None else f"{event['rows']:,}",
+                                 "" if event["columns"] is None else event["columns"],
+                                 "" if memory is None else f"{memory / 2 ** 20:.1f}", info))
+        if event["depth"] == 0:
+            self.last_var.set(f"마지막 작업: {event['name']} {event['duration'] * 1000:.0f} ms")
+
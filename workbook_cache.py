@@ -0,0 +1,216 @@
+"""
+읽어 들인 데이터 파일의 디스크 캐시
+
+같은 설문 파일을 여러 번 열 때 매번 엑셀을 다시 파싱하지 않도록,
+파싱된 DataFrame을 열 기반 형식(Parquet, pyarrow가 없거나 저장할 수 없는 데이터는 pickle)으로 저장한다.
+캐시 키는 파일 경로 + 크기 + 수정 시각 + 내용 해시(+ 시트 이름)이므로 파일이 바뀌면 자동으로 새로 읽는다.
+Parquet 캐시는 열 단위로 저장되므로 필요한 열만 골라 읽을 수 있다 (lazy_workbook).
+
+환경 변수
+    RELIABILITY_CACHE_DIR     캐시 폴더 (기본값: 사용자 캐시 폴더/reliability_gui)
+    RELIABILITY_CACHE_MAX_MB  캐시 최대 크기 (기본값: 500MB, 오래 안 쓴 파일부터 삭제)
+    RELIABILITY_NO_CACHE      1이면 캐시를 쓰지 않음
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+
+from instrumentation import span
+
+CACHE_VERSION = "2"  # 저장 형식이 바뀌면 올려서 이전 캐시를 쓰지 않음
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+_HASH_BLOCK = 1024 * 1024
+
+
+def cache_dir():
+    """캐시 폴더 경로"""
+    path = os.environ.get("RELIABILITY_CACHE_DIR")
+    if not path:
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") \
+            or os.path.join(os.path.expanduser("~"), ".cache")
+        path = os.path.join(base, "reliability_gui")
+    return path
+
+
+def cache_enabled():
+    return os.environ.get("RELIABILITY_NO_CACHE", "").strip().lower() not in ("1", "true", "yes")
+
+
+def file_fingerprint(file_path):
+    """경로 + 크기 + 수정 시각 + 내용 해시로 만든 캐시 키"""
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{CACHE_VERSION}|{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|".encode())
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parse_file(file_path, sheet=None, columns=None):
+    """
+    데이터 파일 파싱 (엑셀 또는 CSV)
+    sheet: 엑셀 시트 이름 (None이면 첫 시트), columns: 읽을 열 이름 (None이면 전체)
+    CSV는 columns만 읽고(usecols), 엑셀은 행 단위 XML이라 시트 전체를 파싱한 뒤 고른다.
+    """
+    import pandas as pd  # 파일을 처음 열 때 불러옴 (GUI 시작 시간 단축)
+
+    with span("load.parse", file=os.path.basename(str(file_path))) as s:
+        if is_csv(file_path):
+            data = pd.read_csv(file_path, usecols=None if columns is None else list(columns))
+            if columns is not None:
+                data = data[list(columns)]  # usecols는 파일 순서로 읽음
+        else:
+            data = pd.read_excel(file_path, sheet_name=0 if sheet is None else sheet)
+            if columns is not None:
+                data = data[list(columns)]
+        s.set(rows=len(data), columns=len(data.columns))
+    return data
+
+
+def read_workbook(file_path, use_cache=None, fingerprint=None, sheet=None, columns=None):
+    """
+    데이터 파일 읽기 (바뀌지 않은 파일이면 캐시에서 바로 읽음)
+    use_cache: None이면 RELIABILITY_NO_CACHE 환경 변수를 따름, False면 캐시 무시
+    fingerprint: 이미 계산한 file_fingerprint (파일을 다시 해시하지 않음)
+    sheet: 엑셀 시트 이름 (None이면 첫 시트), columns: 읽을 열 이름 (None이면 전체)
+    Parquet 캐시에서는 columns만 읽는다. CSV를 일부 열만 읽은 경우는 캐시에 저장하지 않는다.
+    """
+    with span("load", file=os.path.basename(str(file_path))) as s:
+        data, status = _read_workbook(file_path, use_cache, fingerprint, sheet, columns)
+        s.set(rows=len(data), columns=len(data.columns), cache=status)
+    return data
+
+
+def is_csv(file_path):
+    """CSV 파일 여부 (그 밖에는 엑셀로 읽음)"""
+    return str(file_path).lower().endswith(".csv")
+
+
+def _cache_key(fingerprint, sheet):
+    if sheet is None:
+        return fingerprint
+    # 시트 이름에는 파일 이름에 쓸 수 없는 문자가 있을 수 있으므로 해시
+    return f"{fingerprint}-{hashlib.blake2b(str(sheet).encode(), digest_size=8).hexdigest()}"
+
+
+def _read_workbook(file_path, use_cache, fingerprint, sheet=None, columns=None):
+    """→ (DataFrame, 캐시 상태 - off, hit, miss, partial - CSV 일부 열만 읽음)"""
+    if use_cache is None:
+        use_cache = cache_enabled()
+    if not use_cache:
+        return parse_file(file_path, sheet, columns), "off"
+
+    key = _cache_key(fingerprint or file_fingerprint(file_path), sheet)
+    directory = cache_dir()
+    for ext, reader in ((".parquet", _read_parquet), (".pkl", _read_pickle)):
+        cached = os.path.join(directory, key + ext)
+        if os.path.exists(cached):
+            try:
+                data = reader(cached, columns)
+            except _corrupt_errors():
+                _remove(cached)  # 손상된 캐시는 지우고 다시 파싱 (없는 열을 요청한 KeyError는 그대로 알림)
+                continue
+            os.utime(cached)  # 최근 사용 시각 갱신 (삭제 순서에 사용)
+            return data, "hit"
+
+    if columns is not None and is_csv(file_path):
+        return parse_file(file_path, sheet, columns), "partial"
+
+    data = parse_file(file_path, sheet)
+    try:
+        with span("load.cache_store"):
+            _store(data, directory, key)
+            evict(directory)
+    except OSError:
+        pass  # 캐시 저장 실패는 분석에 영향을 주지 않음
+    return data if columns is None else data[list(columns)], "miss"
+
+
+def _corrupt_errors():
+    """캐시 파일이 손상되었거나 읽을 수 없는 형식일 때의 예외"""
+    errors = (OSError, EOFError, pickle.UnpicklingError)
+    try:
+        from pyarrow import ArrowException  # ArrowInvalid 등 (Parquet 파일 손상)
+    except ImportError:
+        return errors
+    return errors + (ArrowException,)
+
+
+def _read_parquet(path, columns):
+    import pandas as pd
+    if columns is not None:
+        _check_parquet_columns(path, columns)
+    return pd.read_parquet(path, columns=None if columns is None else list(columns))
+
+
+def _check_parquet_columns(path, columns):
+    """없는 열을 요청해도 pyarrow는 손상된 파일과 같은 ArrowInvalid를 내므로 읽기 전에 KeyError로 구분"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return
+    names = set(pq.read_schema(path).names)
+    missing = [col for col in columns if col not in names]
+    if missing:
+        raise KeyError(f"캐시에 없는 열: {', '.join(map(str, missing))}")
+
+
+def _read_pickle(path, columns):
+    import pandas as pd
+    data = pd.read_pickle(path)
+    return data if columns is None else data[list(columns)]
+
+
+def _store(data, directory, key):
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        ext = ".pkl"
+        # Parquet은 열 이름을 문자열로 바꿔 저장하므로 숫자 열 이름이 있으면 pickle (이름이 그대로 돌아오도록)
+        if all(isinstance(col, str) for col in data.columns):
+            try:
+                data.to_parquet(tmp_path, index=True)
+                ext = ".parquet"
+            except (ImportError, ValueError, TypeError, NotImplementedError):
+                pass  # pyarrow가 없거나 숫자와 문자가 섞인 열 등 Parquet으로 저장할 수 없는 경우
+        if ext == ".pkl":
+            data.to_pickle(tmp_path)
+        os.replace(tmp_path, os.path.join(directory, key + ext))
+    finally:
+        _remove(tmp_path)
+
+
+def evict(directory=None, max_bytes=None):
+    """캐시 크기가 한도를 넘으면 오래 안 쓴 파일부터 삭제"""
+    directory = directory or cache_dir()
+    if not os.path.isdir(directory):
+        return
+    if max_bytes is None:
+        max_mb = os.environ.get("RELIABILITY_CACHE_MAX_MB")
+        max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith((".parquet", ".pkl")):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+
+
+def clear_cache(directory=None):
+    """캐시 전체 삭제"""
+    evict(directory, max_bytes=0)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass